@@ -1,43 +1,258 @@
 from __future__ import annotations
 
-from fastapi import FastAPI
+import threading
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager
+from functools import partial
 
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from pre.api.batching import MicroBatcher
+from pre.api.conditional import is_not_modified, validator_headers
+from pre.api.encoding import VARY, encoded_response, representation_etag
+from pre.api.executors import ExecutorBusyError, RouteExecutors, process_pool
+from pre.api.jobs import JobQueue, QueueFullError
+from pre.api.middleware import MetricsMiddleware
 from pre.api.routes.health import health
-from pre.api.routes.predict import predict_route
-from pre.api.routes.reports import reports_route
-from pre.api.routes.train import train_route
+from pre.api.routes.predict import (
+    demo_events,
+    forecast_batch,
+    forecast_route,
+    predict_route,
+    resolve_run_dir,
+    train_demo_route,
+)
+from pre.api.routes.reports import load_report, reports_events, reports_payload, rerun_report
+from pre.api.routes.train import job_route, submit_train_route
+from pre.api.schemas import PredictRequest, PredictResponse
+from pre.api.singleflight import SingleFlight
+from pre.api.streaming import stream_response
+from pre.demo.runner import demo_needs_training
+from pre.observability.metrics import CONTENT_TYPE, METRICS, MetricsRegistry
+
+
+def create_app(
+    job_queue: JobQueue | None = None,
+    batcher: MicroBatcher | None = None,
+    cache_ttl: float = 2.0,
+    executors: RouteExecutors | None = None,
+    warmup: Callable[[], object] | None = None,
+    metrics: MetricsRegistry = METRICS,
+    compress_min_size: int | None = 1024,
+) -> FastAPI:
+    """Build the API.
+
+    ``cache_ttl`` is the reuse window for coalesced GET results. ``warmup`` runs in a
+    background thread at startup and ``/ready`` answers 503 until it has finished.
+    ``metrics`` is rendered on ``/metrics``; request instrumentation is only
+    installed while it is enabled. Prediction and report responses honour
+    ``Accept: application/x-pre-arrays`` and compress bodies of at least
+    ``compress_min_size`` bytes for clients accepting gzip/deflate. The
+    ``/stream`` routes emit results as they finish, as NDJSON or, for
+    ``Accept: text/event-stream``, server-sent events.
+    """
+    jobs = job_queue or JobQueue()
+    lanes = executors or RouteExecutors()
+    predictions = batcher or MicroBatcher(forecast_batch)
+    flights = SingleFlight(ttl=cache_ttl)
+    readiness: dict[str, object] = {'ready': warmup is None, 'error': None}
 
+    def _warm() -> None:
+        assert warmup is not None
+        try:
+            warmup()
+        except Exception as error:
+            readiness['error'] = f'{type(error).__name__}: {error}'
+        else:
+            readiness['ready'] = True
 
-def create_app() -> FastAPI:
-    app = FastAPI(title="Riffe Labs PRE API", version="0.1.0")
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        if warmup is not None:
+            threading.Thread(target=_warm, name='pre-warmup', daemon=True).start()
+        yield
+        jobs.shutdown(wait=False)
+        predictions.shutdown()
+        lanes.shutdown(wait=False)
+
+    app = FastAPI(title="Riffe Labs PRE API", version="0.1.0", lifespan=lifespan)
+    if metrics.enabled:
+        app.add_middleware(MetricsMiddleware, registry=metrics)
+
+    @app.exception_handler(ExecutorBusyError)
+    async def busy_handler(_: Request, error: ExecutorBusyError) -> JSONResponse:
+        return JSONResponse({'detail': str(error)}, status_code=503, headers={'Retry-After': '1'})
 
     @app.get('/health')
-    def health_endpoint() -> dict[str, str]:
+    async def health_endpoint() -> dict[str, str]:
         return health()
 
-    @app.post('/train')
-    def train_endpoint(
+    @app.get('/ready')
+    async def ready_endpoint() -> JSONResponse:
+        return JSONResponse(readiness, status_code=200 if readiness['ready'] else 503)
+
+    def _encode(
+        request: Request, payload: object, headers: dict[str, str] | None = None
+    ) -> Response:
+        # Multi-MB JSON/gzip bodies take hundreds of ms, so callers run this on a lane.
+        return encoded_response(
+            payload,
+            accept=request.headers.get('accept'),
+            accept_encoding=request.headers.get('accept-encoding'),
+            headers=headers,
+            compress_min_size=compress_min_size,
+        )
+
+    @app.get('/metrics')
+    async def metrics_endpoint() -> PlainTextResponse:
+        return PlainTextResponse(metrics.render(), media_type=CONTENT_TYPE)
+
+    @app.post('/train', status_code=202)
+    async def train_endpoint(
         dataset: str = 'nyc_taxi',
         model: str = 'lstm_gaussian',
         horizon: int = 24,
         context_length: int = 168,
         artifact_root: str = 'artifacts',
     ) -> dict[str, object]:
-        return train_route(
-            dataset=dataset,
-            model=model,
-            horizon=horizon,
-            context_length=context_length,
-            artifact_root=artifact_root,
-        )
+        try:
+            return submit_train_route(
+                jobs,
+                dataset=dataset,
+                model=model,
+                horizon=horizon,
+                context_length=context_length,
+                artifact_root=artifact_root,
+            )
+        except QueueFullError as error:
+            raise HTTPException(status_code=429, detail=str(error)) from error
+
+    @app.get('/jobs/{job_id}')
+    async def job_endpoint(job_id: str) -> dict[str, object]:
+        payload = job_route(jobs, job_id)
+        if payload is None:
+            raise HTTPException(status_code=404, detail=f"Unknown job '{job_id}'")
+        return payload
 
     @app.get('/predict')
-    def predict_endpoint(mode: str = 'demand', artifact_root: str = 'artifacts') -> dict[str, object]:
-        return predict_route(mode=mode, artifact_root=artifact_root)
+    async def predict_endpoint(
+        request: Request,
+        mode: str = 'demand',
+        artifact_root: str = 'artifacts',
+        retrain: bool = False,
+    ) -> Response:
+        def _respond(fresh: bool) -> Response | None:
+            if demo_needs_training(mode, artifact_root):
+                return None
+            payload = flights.do(
+                ('predict', mode, artifact_root),
+                lambda: predict_route(mode=mode, artifact_root=artifact_root),
+                fresh=fresh,
+            )
+            return _encode(request, payload)
+
+        # Training is awaited on the compute lane, never inside a predict-lane thread.
+        response = None if retrain else await lanes.predict.run(_respond, False)
+        if response is None:
+            await train_demo_route(mode, artifact_root, compute=lanes.compute, flights=flights)
+            response = await lanes.predict.run(_respond, True)
+        if response is None:
+            raise RuntimeError(f"Run for mode '{mode}' was not written")
+        return response
+
+    @app.post('/predict', response_model=PredictResponse)
+    async def forecast_endpoint(
+        request: Request,
+        body: PredictRequest,
+        artifact_root: str = 'artifacts',
+    ) -> Response:
+        run_dir = await lanes.predict.run(resolve_run_dir, body.run_id, artifact_root)
+        if run_dir is None:
+            raise HTTPException(status_code=404, detail=f"Unknown run '{body.run_id}'")
+        try:
+            payload = await forecast_route(predictions, body, run_dir, lane=lanes.predict)
+        except ValueError as error:
+            raise HTTPException(status_code=422, detail=str(error)) from error
+        return await lanes.predict.run(_encode, request, payload)
 
     @app.get('/reports')
-    def reports_endpoint(dataset: str = 'nyc_taxi', artifact_root: str = 'artifacts') -> dict[str, object]:
-        return reports_route(dataset=dataset, artifact_root=artifact_root)
+    async def reports_endpoint(
+        request: Request,
+        dataset: str = 'nyc_taxi',
+        artifact_root: str = 'artifacts',
+        refresh: bool = False,
+    ) -> Response:
+        def _respond(fresh: bool) -> Response | None:
+            try:
+                snapshot = flights.do(
+                    ('reports', dataset, artifact_root),
+                    partial(load_report, dataset, artifact_root),
+                    fresh=fresh,
+                )
+            except FileNotFoundError:
+                return None
+            etag = representation_etag(
+                snapshot.etag, request.headers.get('accept'), request.headers.get('accept-encoding')
+            )
+            headers = validator_headers(etag, snapshot.last_modified)
+            if not refresh and is_not_modified(request.headers, etag, snapshot.last_modified):
+                return Response(status_code=304, headers={**headers, **VARY})
+            return _encode(request, reports_payload(snapshot), headers)
+
+        response = None if refresh else await lanes.reports.run(_respond, False)
+        if response is None:
+            await rerun_report(dataset, artifact_root, compute=lanes.compute, flights=flights)
+            response = await lanes.reports.run(_respond, True)
+        if response is None:
+            raise RuntimeError(f"Benchmark artifacts for '{dataset}' were not written")
+        return response
+
+    def _stream(request: Request, start: Callable[[], Iterator[dict[str, object]]]) -> Response:
+        lanes.streams.acquire()
+        try:
+            events = start()
+        except ValueError as error:
+            lanes.streams.release()
+            raise HTTPException(status_code=422, detail=str(error)) from error
+
+        return stream_response(
+            events, request.headers.get('accept'), on_close=lanes.streams.release
+        )
+
+    @app.get('/demos/stream')
+    async def demos_stream_endpoint(
+        request: Request,
+        modes: str | None = None,
+        artifact_root: str = 'artifacts',
+    ) -> Response:
+        return _stream(
+            request,
+            lambda: demo_events(
+                modes=modes,
+                artifact_root=artifact_root,
+                max_workers=lanes.stream_workers,
+                executor_factory=process_pool,
+                flights=flights,
+            ),
+        )
+
+    @app.get('/reports/stream')
+    async def reports_stream_endpoint(
+        request: Request,
+        dataset: str = 'nyc_taxi',
+        artifact_root: str = 'artifacts',
+    ) -> Response:
+        return _stream(
+            request,
+            lambda: reports_events(
+                dataset=dataset,
+                artifact_root=artifact_root,
+                max_workers=lanes.stream_workers,
+                executor_factory=process_pool,
+                flights=flights,
+            ),
+        )
 
     return app
 
@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+import time
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, InvalidStateError
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+BatchFn = Callable[[Any, np.ndarray], np.ndarray]
+
+
+@dataclass
+class _Pending:
+    key: Hashable
+    rows: np.ndarray
+    future: Future[np.ndarray] = field(default_factory=Future)
+
+
+def _settle(future: Future[np.ndarray], outcome: np.ndarray | BaseException) -> None:
+    """Resolve ``future`` unless it already is, so one caller cannot stop the collector."""
+    try:
+        if isinstance(outcome, BaseException):
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+    except InvalidStateError:
+        pass
+
+
+class MicroBatcher:
+    """Coalesces concurrent prediction requests into batched calls.
+
+    ``submit`` enqueues ``[n, features]`` rows under a key (e.g. run and quantile
+    levels). A collector thread takes the first waiting request, keeps gathering
+    for at most ``max_wait`` seconds or until ``max_batch_size`` rows are queued,
+    then calls ``batch_fn(key, stacked_rows)`` once per key and slices the
+    ``[rows, ...]`` result back to each caller. Errors fail every request of the
+    affected key only. Requests cancelled before dispatch (e.g. an awaiting
+    client disconnected) are dropped from the batch.
+    """
+
+    def __init__(
+        self,
+        batch_fn: BatchFn,
+        max_batch_size: int = 64,
+        max_wait: float = 0.002,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be >= 1")
+        if max_wait < 0:
+            raise ValueError("max_wait must be >= 0")
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.batches = 0
+        self.rows = 0
+        self._queue: queue.SimpleQueue[_Pending | None] = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, key: Hashable, rows: np.ndarray) -> Future[np.ndarray]:
+        pending = _Pending(key, np.atleast_2d(np.asarray(rows, dtype=float)))
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._collect, name="pre-microbatcher", daemon=True
+                )
+                self._thread.start()
+            self._queue.put(pending)
+        return pending.future
+
+    async def predict(self, key: Hashable, rows: np.ndarray) -> np.ndarray:
+        return await asyncio.wrap_future(self.submit(key, rows))
+
+    def _collect(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch, size = [first], first.rows.shape[0]
+            deadline = time.monotonic() + self.max_wait
+            stop = False
+            while size < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        item = self._queue.get(timeout=remaining)
+                    else:
+                        item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+                size += item.rows.shape[0]
+            self._dispatch(batch)
+            if stop:
+                return
+
+    def _dispatch(self, batch: list[_Pending]) -> None:
+        groups: dict[Hashable, list[_Pending]] = {}
+        for item in batch:
+            if item.future.set_running_or_notify_cancel():
+                groups.setdefault(item.key, []).append(item)
+        for key, items in groups.items():
+            stacked = np.concatenate([item.rows for item in items])
+            try:
+                outputs = self.batch_fn(key, stacked)
+            except Exception as error:
+                for item in items:
+                    _settle(item.future, error)
+                continue
+            self.batches += 1
+            self.rows += stacked.shape[0]
+            offsets = np.cumsum([0] + [item.rows.shape[0] for item in items])
+            for item, start, stop in zip(items, offsets[:-1], offsets[1:], strict=True):
+                _settle(item.future, outputs[start:stop])
+
+    def shutdown(self) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is not None:
+                self._queue.put(None)
+        if thread is not None:
+            thread.join()
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import gzip
+import json
+import struct
+import zlib
+from collections.abc import Mapping
+from numbers import Number
+from typing import Any
+
+import numpy as np
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+ARRAY_MEDIA_TYPE = "application/x-pre-arrays"
+MAGIC = b"PREA"
+_ALIGN = 8
+_ARRAY_KEY = "__array__"
+_PREFIX = struct.Struct("<4sI")
+VARY = {"Vary": "Accept, Accept-Encoding"}
+
+
+def _parse_header(value: str | None) -> dict[str, float]:
+    """``{token: q}`` from an ``Accept``-style header, parameters other than ``q`` dropped."""
+    weights: dict[str, float] = {}
+    for part in (value or "").split(","):
+        token, *params = (item.strip() for item in part.split(";"))
+        if not token:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, raw = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(raw)
+                except ValueError:
+                    q = 0.0
+        weights[token.lower()] = q
+    return weights
+
+
+def wants_arrays(accept: str | None) -> bool:
+    """True when ``accept`` explicitly asks for the binary array encoding."""
+    return _parse_header(accept).get(ARRAY_MEDIA_TYPE, 0.0) > 0.0
+
+
+def choose_coding(accept_encoding: str | None) -> str | None:
+    """``gzip`` or ``deflate`` if accepted (gzip preferred on ties), else None."""
+    weights = _parse_header(accept_encoding)
+    ranked = [(weights.get(coding, 0.0), coding) for coding in ("deflate", "gzip")]
+    q, coding = max(ranked)
+    return coding if q > 0.0 else None
+
+
+def _as_array(value: list[Any]) -> np.ndarray | None:
+    if not value or not isinstance(value[0], Number | list):
+        return None
+    try:
+        array = np.asarray(value)
+    except ValueError:
+        return None
+    return array if array.dtype.kind in "fiu" else None
+
+
+def _pack(value: Any, arrays: list[np.ndarray]) -> Any:
+    """Replace array leaves (and regular numeric lists) with ``{"__array__": index}``."""
+    if isinstance(value, list):
+        packed = _as_array(value)
+        if packed is None:
+            return [_pack(item, arrays) for item in value]
+        value = packed
+    if isinstance(value, np.ndarray):
+        dtype = np.int32 if value.dtype.kind in "iu" else np.float32
+        arrays.append(np.ascontiguousarray(value, dtype=dtype))
+        return {_ARRAY_KEY: len(arrays) - 1}
+    if isinstance(value, Mapping):
+        return {str(key): _pack(item, arrays) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_pack(item, arrays) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def encode_arrays(payload: Any) -> bytes:
+    """Encode ``payload`` with numeric arrays as raw little-endian buffers.
+
+    Layout: ``b"PREA"``, a uint32 header length, a UTF-8 JSON header
+    ``{"payload": ..., "arrays": [{"dtype", "shape", "offset"}]}`` and then the
+    array buffers, each 8-byte aligned relative to the end of the padded header.
+    Array leaves in ``payload`` become ``{"__array__": index}``. Floats are sent
+    as float32 and integers as int32; ``np.ndarray`` leaves already in that dtype
+    are written straight from their buffers.
+    """
+    arrays: list[np.ndarray] = []
+    meta = _pack(payload, arrays)
+    specs, offset = [], 0
+    for array in arrays:
+        specs.append({"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset})
+        offset += -(-array.nbytes // _ALIGN) * _ALIGN
+    header = json.dumps({"payload": meta, "arrays": specs}, separators=(",", ":")).encode()
+    header += b" " * (-(_PREFIX.size + len(header)) % _ALIGN)
+
+    chunks: list[bytes | memoryview] = [_PREFIX.pack(MAGIC, len(header)), header]
+    for array in arrays:
+        chunks.append(memoryview(array).cast("B"))
+        chunks.append(b"\0" * (-array.nbytes % _ALIGN))
+    return b"".join(chunks)
+
+
+def _unpack(value: Any, arrays: list[np.ndarray]) -> Any:
+    if isinstance(value, dict):
+        if value.keys() == {_ARRAY_KEY}:
+            return arrays[value[_ARRAY_KEY]]
+        return {key: _unpack(item, arrays) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_unpack(item, arrays) for item in value]
+    return value
+
+
+def decode_arrays(body: bytes) -> Any:
+    """Inverse of ``encode_arrays``; arrays are read-only views into ``body``."""
+    magic, header_length = _PREFIX.unpack_from(body)
+    if magic != MAGIC:
+        raise ValueError("not a PRE array payload")
+    start = _PREFIX.size + header_length
+    header = json.loads(body[_PREFIX.size : start])
+    arrays = [
+        np.frombuffer(
+            body,
+            dtype=np.dtype(spec["dtype"]),
+            count=int(np.prod(spec["shape"], dtype=np.int64)),
+            offset=start + spec["offset"],
+        ).reshape(spec["shape"])
+        for spec in header["arrays"]
+    ]
+    return _unpack(header["payload"], arrays)
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, np.ndarray | np.generic):
+        return value.tolist()
+    if isinstance(value, Mapping):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_jsonable(item) for item in value]
+    return value
+
+
+def representation_etag(etag: str, accept: str | None, accept_encoding: str | None) -> str:
+    """Distinct strong validator per negotiated representation of the same resource."""
+    suffix = "-".join(
+        item
+        for item in ("arrays" if wants_arrays(accept) else "", choose_coding(accept_encoding))
+        if item
+    )
+    return f'{etag[:-1]}-{suffix}"' if suffix else etag
+
+
+def encoded_response(
+    payload: Any,
+    accept: str | None = None,
+    accept_encoding: str | None = None,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+    compress_min_size: int | None = 1024,
+) -> Response:
+    """``payload`` as JSON (the default) or binary arrays, optionally compressed.
+
+    Bodies of at least ``compress_min_size`` bytes are gzip/deflate encoded when
+    the client accepts it; ``None`` disables compression.
+    """
+    if wants_arrays(accept):
+        body, media_type = encode_arrays(payload), ARRAY_MEDIA_TYPE
+    else:
+        body, media_type = bytes(JSONResponse(_jsonable(payload)).body), "application/json"
+    response_headers = {**(headers or {}), **VARY}
+    coding = choose_coding(accept_encoding)
+    if coding is not None and compress_min_size is not None and len(body) >= compress_min_size:
+        body = gzip.compress(body, mtime=0) if coding == "gzip" else zlib.compress(body)
+        response_headers["Content-Encoding"] = coding
+    return Response(body, status_code=status_code, headers=response_headers, media_type=media_type)
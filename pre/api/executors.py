@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def process_pool(max_workers: int, **kwargs: Any) -> ProcessPoolExecutor:
+    """Process pool that is safe to create inside a multi-threaded server process.
+
+    Workers start from a forkserver (spawn where that is unavailable) instead of
+    forking the threaded parent, which can deadlock on locks other threads hold.
+    Other keyword arguments go to ``ProcessPoolExecutor``.
+    """
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context(method), **kwargs
+    )
+
+
+class ExecutorBusyError(RuntimeError):
+    """Raised when a lane rejects work because it is saturated."""
+
+
+class Lane:
+    """Bounded executor for one class of route work.
+
+    At most ``max_workers`` calls run at once and ``max_queue`` more may wait;
+    beyond that ``submit`` raises ``ExecutorBusyError`` immediately. ``call`` and
+    ``run`` (its async form) also give up on work that has not started within
+    ``queue_timeout`` seconds, cancelling it, so callers see a fast rejection
+    instead of an unbounded wait. Work that has started always runs to completion.
+    The executor is created on first use.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        max_queue: int = 16,
+        queue_timeout: float = 1.0,
+        executor_factory: Callable[[int], Executor] = ThreadPoolExecutor,
+    ) -> None:
+        if max_workers < 1 or max_queue < 0:
+            raise ValueError("max_workers must be >= 1 and max_queue >= 0")
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.rejected = 0
+        self._executor_factory = executor_factory
+        self._executor: Executor | None = None
+        self._outstanding = 0
+        self._lock = threading.Lock()
+
+    @property
+    def outstanding(self) -> int:
+        return self._outstanding
+
+    def _busy(self, reason: str) -> ExecutorBusyError:
+        with self._lock:
+            self.rejected += 1
+        return ExecutorBusyError(f"{self.name} lane is busy: {reason}")
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> Future[T]:
+        with self._lock:
+            limit = self.max_workers + self.max_queue
+            full = self._outstanding >= limit
+            if not full:
+                if self._executor is None:
+                    self._executor = self._executor_factory(self.max_workers)
+                future = self._executor.submit(fn, *args, **kwargs)
+                self._outstanding += 1
+        if full:
+            raise self._busy(f"{limit} requests outstanding")
+        future.add_done_callback(self.release)
+        return future
+
+    def acquire(self) -> None:
+        """Admit work that runs outside the lane's executor; pair with ``release``."""
+        with self._lock:
+            limit = self.max_workers + self.max_queue
+            full = self._outstanding >= limit
+            if not full:
+                self._outstanding += 1
+        if full:
+            raise self._busy(f"{limit} requests outstanding")
+
+    def release(self, _: Future[Any] | None = None) -> None:
+        with self._lock:
+            self._outstanding -= 1
+
+    def call(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        future = self.submit(fn, *args, **kwargs)
+        try:
+            return future.result(timeout=self.queue_timeout)
+        except TimeoutError:
+            if future.cancel():
+                raise self._busy(f"not started within {self.queue_timeout}s") from None
+        return future.result()
+
+    async def run(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        future = self.submit(fn, *args, **kwargs)
+        waiter = asyncio.wrap_future(future)
+        try:
+            return await asyncio.wait_for(asyncio.shield(waiter), self.queue_timeout)
+        except TimeoutError:
+            if future.cancel():
+                raise self._busy(f"not started within {self.queue_timeout}s") from None
+        return await waiter
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+
+
+@dataclass
+class RouteExecutors:
+    """Per-route-type lanes so heavy work cannot starve latency-sensitive routes.
+
+    ``predict`` serves cached forecasts, ``reports`` loads leaderboards, and
+    ``compute`` is a process pool for the training and benchmark runs either may
+    trigger. ``streams`` only admits streaming runs, each of which trains on its own
+    pool of at most ``stream_workers`` processes. ``/health`` and job polling run on
+    the event loop and use none of them.
+    """
+
+    predict: Lane = field(
+        default_factory=lambda: Lane("predict", max_workers=4, max_queue=64, queue_timeout=1.0)
+    )
+    reports: Lane = field(
+        default_factory=lambda: Lane("reports", max_workers=2, max_queue=16, queue_timeout=5.0)
+    )
+    compute: Lane = field(
+        default_factory=lambda: Lane(
+            "compute",
+            max_workers=1,
+            max_queue=4,
+            queue_timeout=30.0,
+            executor_factory=process_pool,
+        )
+    )
+
+    streams: Lane = field(
+        default_factory=lambda: Lane("streams", max_workers=2, max_queue=0, queue_timeout=0.0)
+    )
+    stream_workers: int = 2
+
+    def shutdown(self, wait: bool = True) -> None:
+        for lane in (self.predict, self.reports, self.compute, self.streams):
+            lane.shutdown(wait=wait)
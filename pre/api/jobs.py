@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import BrokenExecutor, Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from pre.api.executors import process_pool
+from pre.train.trainer import Trainer, observe_stage_seconds
+
+
+class QueueFullError(RuntimeError):
+    """Raised when a submission would exceed the pending-job limit."""
+
+
+def run_training_job(params: dict[str, Any]) -> dict[str, Any]:
+    return Trainer.to_dict(Trainer().train(**params))
+
+
+@dataclass
+class Job:
+    id: str
+    params: dict[str, Any]
+    status: str = "queued"
+    submitted_at: float = field(default_factory=time.time)
+    finished_at: float | None = None
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    future: Future[dict[str, Any]] | None = field(default=None, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    def to_dict(self) -> dict[str, Any]:
+        status = self.status
+        if status == "queued" and self.future is not None and self.future.running():
+            status = "running"
+        return {
+            "job_id": self.id,
+            "status": status,
+            "params": self.params,
+            "submitted_at": self.submitted_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class JobQueue:
+    """Bounded background queue for training jobs.
+
+    Jobs run on a lazily created ``process_pool`` of ``max_workers``. At most
+    ``max_pending`` jobs may be unfinished at once; further submissions raise
+    ``QueueFullError``. Submitting parameters identical to an unfinished job
+    returns that job instead of queuing a duplicate. The newest ``max_history``
+    finished jobs stay queryable. A broken pool (e.g. a worker killed by the OOM
+    killer) is discarded and replaced on the next submission.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_pending: int = 8,
+        max_history: int = 256,
+        worker: Callable[[dict[str, Any]], dict[str, Any]] = run_training_job,
+        executor_factory: Callable[[int], Executor] = process_pool,
+    ) -> None:
+        if max_workers < 1 or max_pending < 1:
+            raise ValueError("max_workers and max_pending must be >= 1")
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.max_history = max_history
+        self._worker = worker
+        self._executor_factory = executor_factory
+        self._executor: Executor | None = None
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._pending: dict[tuple[tuple[str, Any], ...], Job] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def submit(self, params: dict[str, Any]) -> tuple[Job, bool]:
+        """Queue ``params`` for training; returns the job and whether it was newly created."""
+        key = tuple(sorted(params.items()))
+        with self._lock:
+            existing = self._pending.get(key)
+            if existing is not None:
+                return existing, False
+            if len(self._pending) >= self.max_pending:
+                raise QueueFullError(
+                    f"{len(self._pending)} training jobs pending (limit {self.max_pending})"
+                )
+            job = Job(id=uuid.uuid4().hex, params=dict(params))
+            job.future, remote = self._submit_locked(job.params)
+            self._jobs[job.id] = job
+            self._pending[key] = job
+        job.future.add_done_callback(lambda future: self._finish(job, key, future, remote))
+        return job, True
+
+    def _submit_locked(self, params: dict[str, Any]) -> tuple[Future[dict[str, Any]], bool]:
+        """Submit to the pool, replacing it once if it turns out to be broken."""
+        if self._executor is None:
+            self._executor = self._executor_factory(self.max_workers)
+        try:
+            future = self._executor.submit(self._worker, params)
+        except BrokenExecutor:
+            broken, self._executor = self._executor, self._executor_factory(self.max_workers)
+            broken.shutdown(wait=False, cancel_futures=True)
+            future = self._executor.submit(self._worker, params)
+        return future, isinstance(self._executor, ProcessPoolExecutor)
+
+    def _finish(
+        self,
+        job: Job,
+        key: tuple[tuple[str, Any], ...],
+        future: Future[dict[str, Any]],
+        remote: bool = False,
+    ) -> None:
+        error = future.exception()
+        if error is None and remote:
+            # Stage timings recorded in the worker process never reach this registry.
+            observe_stage_seconds(future.result().get("summary", {}).get("stage_seconds", {}))
+        with self._lock:
+            if error is None:
+                job.result, job.status = future.result(), "succeeded"
+            else:
+                job.error, job.status = f"{type(error).__name__}: {error}", "failed"
+            job.finished_at = time.time()
+            self._pending.pop(key, None)
+            finished = [job_id for job_id, item in self._jobs.items() if item.done]
+            for job_id in finished[: max(0, len(finished) - self.max_history)]:
+                del self._jobs[job_id]
+
+    def get(self, job_id: str) -> Job | None:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import time
+
+from starlette.routing import Match
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from pre.observability.metrics import METRICS, MetricsRegistry
+
+_UNMATCHED = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording per-route latency, request counts and in-flight gauges.
+
+    Requests are labelled by route template (``/jobs/{job_id}``) rather than raw
+    path to keep label cardinality bounded. Does nothing while ``registry`` is
+    disabled.
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry = METRICS) -> None:
+        self.app = app
+        self.registry = registry
+        self.latency = registry.histogram(
+            "pre_http_request_duration_seconds",
+            "HTTP request latency by route.",
+            ("method", "route"),
+        )
+        self.requests = registry.counter(
+            "pre_http_requests_total",
+            "HTTP responses by route and status.",
+            ("method", "route", "status"),
+        )
+        self.in_flight = registry.gauge(
+            "pre_http_requests_in_flight",
+            "HTTP requests being served by route.",
+            ("method", "route"),
+        )
+
+    def _route(self, scope: Scope) -> str:
+        for route in scope["app"].router.routes:
+            match, _ = route.matches(scope)
+            if match is Match.FULL:
+                return str(route.path)
+        return _UNMATCHED
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self.registry.enabled:
+            await self.app(scope, receive, send)
+            return
+        labels = {"method": scope["method"], "route": self._route(scope)}
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.in_flight.inc(**labels)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.latency.observe(time.perf_counter() - start, **labels)
+            self.requests.inc(status=str(status), **labels)
+            self.in_flight.dec(**labels)
@@ -1,10 +1,146 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Hashable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
 from typing import Any
 
-from pre.demo.runner import run_demo
+import numpy as np
 
+from pre.api.batching import MicroBatcher
+from pre.api.executors import Lane
+from pre.api.schemas import PredictRequest
+from pre.api.singleflight import SingleFlight
+from pre.demo.modes import DEMO_MODES
+from pre.demo.runner import iter_demos, run_demo, serve_demo
+from pre.registry.model_store import MODEL_STORE, ModelStore, run_is_complete
 
-def predict_route(mode: str = "demand", artifact_root: str = "artifacts") -> dict[str, Any]:
-    """Mode-first inference-style payload for UI demos."""
-    return run_demo(mode=mode, artifact_root=artifact_root)
+
+def predict_route(
+    mode: str = "demand",
+    artifact_root: str = "artifacts",
+    retrain: bool = False,
+) -> dict[str, Any]:
+    """Mode-first inference payload served from cached run artifacts.
+
+    A missing run (or ``retrain``) is trained in the calling thread; the API trains
+    through ``train_demo_route`` first so no route thread waits on training.
+    """
+    return serve_demo(mode=mode, artifact_root=artifact_root, retrain=retrain)
+
+
+async def train_demo_route(
+    mode: str,
+    artifact_root: str,
+    compute: Lane,
+    flights: SingleFlight,
+) -> None:
+    """(Re)train ``mode``'s run on ``compute``, awaiting it without holding a thread.
+
+    Shared through ``flights`` with ``/demos/stream`` and other trainings of the mode.
+    """
+    await flights.run(
+        _demo_key(mode, artifact_root),
+        partial(compute.run, run_demo, mode=mode, artifact_root=artifact_root),
+        fresh=True,
+    )
+
+
+def _demo_key(mode: str, artifact_root: str) -> Hashable:
+    return ("demo", mode, artifact_root)
+
+
+def demo_events(
+    modes: str | None = None,
+    artifact_root: str = "artifacts",
+    max_workers: int | None = None,
+    executor_factory: Callable[..., Executor] = ProcessPoolExecutor,
+    flights: SingleFlight | None = None,
+) -> Iterator[dict[str, Any]]:
+    """``iter_demos`` for comma-separated ``modes`` (default all), validated up front.
+
+    With ``flights`` the stream holds each mode's training key until that mode
+    finishes, so ``/predict`` retrains of those modes wait for it and share its run,
+    and the mode's cached ``/predict`` payload is dropped once it is rewritten.
+    """
+    selected = [mode.strip() for mode in (modes or "").split(",") if mode.strip()] or None
+    unknown = [mode for mode in selected or [] if mode not in DEMO_MODES]
+    if unknown:
+        supported = ", ".join(sorted(DEMO_MODES))
+        raise ValueError(f"Unsupported modes {unknown}. Supported modes: {supported}")
+    events = iter_demos(
+        artifact_root=artifact_root,
+        modes=selected,
+        max_workers=max_workers,
+        executor_factory=executor_factory,
+    )
+    if flights is None:
+        return events
+
+    def _landing(event: dict[str, Any]) -> tuple[Hashable, Any] | None:
+        if event["event"] != "mode":
+            return None
+        return _demo_key(event["payload"]["mode"], artifact_root), event["payload"]
+
+    served: dict[Hashable, Hashable] = {
+        _demo_key(mode, artifact_root): ("predict", mode, artifact_root)
+        for mode in selected or DEMO_MODES
+    }
+    return flights.hold(served, events, _landing, derived=served)
+
+
+def resolve_run_dir(run_id: str, artifact_root: str) -> Path | None:
+    """Complete run directory for ``run_id``; ``latest`` picks the newest trained model."""
+    root = Path(artifact_root)
+    if run_id == "latest":
+        runs = [path for path in root.glob("*") if path.is_dir() and run_is_complete(path)]
+        return max(runs, key=lambda path: (path / "model.npz").stat().st_mtime_ns, default=None)
+    run_dir = root / run_id
+    if Path(run_id).name != run_id or not run_is_complete(run_dir):
+        return None
+    return run_dir
+
+
+def forecast_batch(
+    key: tuple[str, tuple[float, ...]],
+    contexts: np.ndarray,
+    store: ModelStore = MODEL_STORE,
+) -> np.ndarray:
+    """Quantiles shaped ``[rows, levels, horizon]`` for raw ``contexts`` of one run."""
+    run_dir, levels = key
+    loaded = store.get(Path(run_dir))
+    dist = loaded.model.predict(
+        loaded.scaler.transform(contexts), horizon=int(loaded.config["horizon"])
+    )
+    bands = dist.materialize(levels)
+    return np.stack([bands[q] for q in levels], axis=1)
+
+
+async def forecast_route(
+    batcher: MicroBatcher,
+    request: PredictRequest,
+    run_dir: Path,
+    store: ModelStore = MODEL_STORE,
+    lane: Lane | None = None,
+) -> dict[str, Any]:
+    """Forecast caller-supplied context windows through the shared micro-batcher.
+
+    The result follows ``PredictResponse`` but keeps NumPy arrays, so the response
+    encoder can send them as JSON lists or raw binary buffers. The run is looked
+    up on ``lane`` when given, so a cold model load never blocks the event loop.
+    """
+    contexts = np.asarray(request.contexts, dtype=float)
+    loaded = store.get(run_dir) if lane is None else await lane.run(store.get, run_dir)
+    width = loaded.context.shape[-1]
+    if contexts.shape[1] != width:
+        raise ValueError(f"each context must have {width} values, got {contexts.shape[1]}")
+    levels = tuple(dict.fromkeys(request.quantiles))
+    if not all(0.0 < q < 1.0 for q in levels):
+        raise ValueError("quantile levels must be in (0, 1)")
+    values = await batcher.predict((str(loaded.run_dir), levels), contexts)
+    return {
+        "run_id": run_dir.name,
+        "horizon": np.arange(values.shape[-1]),
+        "quantiles": {str(q): values[:, index] for index, q in enumerate(levels)},
+    }
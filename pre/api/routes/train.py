@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
+from pre.api.jobs import JobQueue
 from pre.train.trainer import Trainer
 
 
@@ -20,3 +21,29 @@ def train_route(
         artifact_root=artifact_root,
     )
     return Trainer.to_dict(result)
+
+
+def submit_train_route(
+    queue: JobQueue,
+    dataset: str = "nyc_taxi",
+    model: str = "lstm_gaussian",
+    horizon: int = 24,
+    context_length: int = 168,
+    artifact_root: str = "artifacts",
+) -> dict[str, Any]:
+    """Queue a training run; raises ``QueueFullError`` when the queue is saturated."""
+    job, created = queue.submit(
+        {
+            "dataset": dataset,
+            "model": model,
+            "horizon": horizon,
+            "context_length": context_length,
+            "artifact_root": artifact_root,
+        }
+    )
+    return {**job.to_dict(), "deduplicated": not created}
+
+
+def job_route(queue: JobQueue, job_id: str) -> dict[str, Any] | None:
+    job = queue.get(job_id)
+    return None if job is None else job.to_dict()
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class HealthResponse(BaseModel):
@@ -9,8 +9,11 @@ class HealthResponse(BaseModel):
 
 class PredictRequest(BaseModel):
     run_id: str = "latest"
+    contexts: list[list[float]] = Field(min_length=1)
+    quantiles: list[float] = Field(default=[0.1, 0.5, 0.9], min_length=1)
 
 
 class PredictResponse(BaseModel):
+    run_id: str
     horizon: list[int]
-    quantiles: dict[str, list[float]]
+    quantiles: dict[str, list[list[float]]]
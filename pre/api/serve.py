@@ -1,10 +1,205 @@
 from __future__ import annotations
 
+import argparse
+import gc
+import os
+import random
+import shutil
+import signal
+import socket
+import tempfile
+import time
+import traceback
+from functools import partial
+from pathlib import Path
+from types import FrameType
+
 import uvicorn
 
+from pre.api.app import create_app
+from pre.observability.metrics import METRICS, retire_process
+from pre.registry.model_store import MODEL_STORE, preload_runs
+
+_CRASH_BACKOFF_SECONDS = 1.0
+_POLL_SECONDS = 0.05
+_METRICS_PUBLISH_SECONDS = 1.0
+
+
+def _bind(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def _spawn_worker(
+    sock: socket.socket, max_requests: int, graceful_timeout: float, metrics_dir: Path | None
+) -> int:
+    """Fork a uvicorn worker serving the shared listening socket."""
+    pid = os.fork()
+    if pid:
+        return pid
+    code = 1
+    try:
+        for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+            signal.signal(signum, signal.SIG_DFL)
+        if metrics_dir is not None:
+            METRICS.share(metrics_dir, interval=_METRICS_PUBLISH_SECONDS)
+        # Jitter the request limit so workers do not all recycle at once.
+        limit = max_requests + random.randint(0, max_requests // 10) if max_requests else None
+        config = uvicorn.Config(
+            create_app(),
+            limit_max_requests=limit,
+            timeout_graceful_shutdown=int(graceful_timeout),
+        )
+        uvicorn.Server(config).run(sockets=[sock])
+        code = 0
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        METRICS.publish()
+        os._exit(code)
+
+
+def _freeze_heap() -> None:
+    """Move everything alive now out of the collector's reach, so children share it."""
+    gc.unfreeze()
+    gc.collect()
+    gc.freeze()
+
+
+def serve_prefork(
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    workers: int = 2,
+    artifact_root: str = "artifacts",
+    max_requests: int = 0,
+    graceful_timeout: float = 30.0,
+) -> None:
+    """Serve the API from ``workers`` forked processes sharing one listening socket.
+
+    Complete runs under ``artifact_root`` are loaded and warmed in the parent first,
+    then the heap is frozen so forked workers share model and scaler memory
+    copy-on-write and start ready. Workers exiting after ``max_requests`` (or
+    crashing) are replaced. SIGHUP reloads changed runs in the parent and then
+    recycles workers one at a time (the replacement starts before the old worker
+    is stopped), so capacity never drops and every new worker shares the refreshed
+    models. SIGTERM/SIGINT stop them all.
+
+    Workers publish their metrics to a shared temporary directory, so ``/metrics``
+    reports totals across every worker (including replaced ones) whichever worker
+    answers the scrape.
+    """
+    if not hasattr(os, "fork"):
+        raise ValueError("pre-fork serving requires os.fork")
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    root = Path(artifact_root)
+    metrics_dir = Path(tempfile.mkdtemp(prefix="pre-metrics-")) if METRICS.enabled else None
+    if metrics_dir is not None:
+        METRICS.share(metrics_dir)
+    preload_runs(root, MODEL_STORE)
+    METRICS.publish()
+    _freeze_heap()
+    sock = _bind(host, port)
+    spawn = partial(_spawn_worker, sock, max_requests, graceful_timeout, metrics_dir)
+    children = {spawn(): time.monotonic() for _ in range(workers)}
+    stopping = False
+    reload_requested = False
+    to_recycle: list[int] = []
+    retiring: int | None = None
+
+    def _stop(signum: int, _: FrameType | None) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in list(children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _reload(signum: int, _: FrameType | None) -> None:
+        nonlocal reload_requested
+        reload_requested = True
+
+    signal.signal(signal.SIGTERM, _stop)
+    signal.signal(signal.SIGINT, _stop)
+    signal.signal(signal.SIGHUP, _reload)
+    try:
+        while children:
+            if reload_requested and not stopping:
+                reload_requested = False
+                preload_runs(root, MODEL_STORE)
+                METRICS.publish()
+                _freeze_heap()
+                to_recycle = [pid for pid in children if pid != retiring]
+            if to_recycle and retiring is None and not stopping:
+                old = to_recycle.pop(0)
+                if old in children:
+                    children[spawn()] = time.monotonic()
+                    retiring = old
+                    try:
+                        os.kill(old, signal.SIGTERM)
+                    except ProcessLookupError:
+                        pass
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                time.sleep(_POLL_SECONDS)
+                continue
+            started = children.pop(pid, None)
+            if metrics_dir is not None:
+                retire_process(metrics_dir, pid)
+            if pid == retiring:
+                retiring = None
+                continue
+            if stopping or started is None:
+                continue
+            if os.waitstatus_to_exitcode(status) != 0:
+                if time.monotonic() - started < _CRASH_BACKOFF_SECONDS:
+                    time.sleep(_CRASH_BACKOFF_SECONDS)
+            children[spawn()] = time.monotonic()
+    finally:
+        sock.close()
+        if metrics_dir is not None:
+            shutil.rmtree(metrics_dir, ignore_errors=True)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="pre-api")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--artifact-root", default="artifacts")
+    parser.add_argument("--max-requests", type=int, default=0)
+    parser.add_argument("--graceful-timeout", type=float, default=30.0)
+    parser.add_argument("--no-metrics", action="store_true", help="Disable /metrics collection")
+    args = parser.parse_args(argv)
+    METRICS.enabled = not args.no_metrics
 
-def main() -> None:
-    uvicorn.run('pre.api.app:app', host='0.0.0.0', port=8000, reload=False)
+    if args.workers > 1:
+        serve_prefork(
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            artifact_root=args.artifact_root,
+            max_requests=args.max_requests,
+            graceful_timeout=args.graceful_timeout,
+        )
+        return
+    app = create_app(warmup=partial(preload_runs, Path(args.artifact_root), MODEL_STORE))
+    uvicorn.run(
+        app,
+        host=args.host,
+        port=args.port,
+        limit_max_requests=args.max_requests or None,
+        timeout_graceful_shutdown=int(args.graceful_timeout),
+    )
 
 
 if __name__ == '__main__':
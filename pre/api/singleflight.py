@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Iterator, Mapping
+from concurrent.futures import Future
+from typing import Any, TypeVar, cast
+
+T = TypeVar("T")
+E = TypeVar("E")
+
+
+class _Abandoned(Exception):
+    """Set on a flight whose leader gave up without a result; joined callers retry."""
+
+
+class SingleFlight:
+    """Shares one in-flight computation among concurrent identical calls.
+
+    ``do(key, fn)`` runs ``fn`` once per key at a time: callers arriving while it
+    runs block on the same result (or exception). Successful results are then
+    served from a cache for ``ttl`` seconds. ``fresh=True`` calls bypass the cache
+    and their result replaces the cached one. A fresh call joins a fresh flight
+    in progress; it never reuses a plain one, but waits for it to finish before
+    starting its own, so ``fn`` never runs twice for a key at once. Plain calls
+    join any flight. At most ``max_entries`` results are cached, oldest first out.
+    ``run`` is the same for coroutine functions, awaited on the event loop.
+
+    ``hold`` runs a stream of events as fresh flights for several keys at once, so
+    long-running streams share keys with the calls that write the same artifacts.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 2.0,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if ttl < 0:
+            raise ValueError("ttl must be >= 0")
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self.calls = 0
+        self.shared = 0
+        self.hits = 0
+        self._inflight: dict[Hashable, tuple[Future[Any], bool]] = {}
+        self._cache: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable[[], T], fresh: bool = False) -> T:
+        while True:
+            action, value = self._enter(key, fresh)
+            if action == "hit":
+                return cast(T, value)
+            if action == "lead":
+                break
+            if action == "join":
+                try:
+                    return cast(T, value.result())
+                except _Abandoned:
+                    continue
+            # Let the plain flight finish, then lead (or join) a fresh one.
+            value.exception()
+
+        try:
+            result = fn()
+        except BaseException as error:
+            self._fail(key, value, error)
+            raise
+        self._land(key, value, result)
+        return result
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[T]], fresh: bool = False) -> T:
+        """``do`` for a coroutine function, waiting on other flights without blocking."""
+        while True:
+            action, value = self._enter(key, fresh)
+            if action == "hit":
+                return cast(T, value)
+            if action == "lead":
+                break
+            if action == "join":
+                try:
+                    return cast(T, await asyncio.wrap_future(value))
+                except _Abandoned:
+                    continue
+            await asyncio.wait([asyncio.wrap_future(value)])
+
+        try:
+            result = await fn()
+        except BaseException as error:
+            self._fail(key, value, error)
+            raise
+        self._land(key, value, result)
+        return result
+
+    def hold(
+        self,
+        keys: Iterable[Hashable],
+        events: Iterable[E],
+        landing: Callable[[E], tuple[Hashable, Any] | None],
+        derived: Mapping[Hashable, Hashable] | None = None,
+    ) -> Iterator[E]:
+        """Yield ``events`` while leading fresh flights for ``keys``.
+
+        Each key is claimed once any flight in progress for it has finished, in a
+        fixed order so concurrent holds cannot deadlock. ``landing(event)`` names
+        the ``(key, result)`` an event completes, which callers waiting on that key
+        then receive. Keys still held when the stream ends, fails or is closed are
+        abandoned, and their waiting callers retry. ``derived`` maps a held key to
+        the key of a result cached from the same artifacts; that entry is forgotten
+        once the held key lands or is abandoned, and no other entry is touched.
+        """
+        held: dict[Hashable, Future[Any]] = {}
+        derived = derived or {}
+        try:
+            for key in sorted(set(keys), key=repr):
+                held[key] = self._claim(key)
+            for event in events:
+                landed = landing(event)
+                if landed is not None:
+                    key, result = landed
+                    self._land(key, held.pop(key), result)
+                    self.forget([derived[key]] if key in derived else [])
+                yield event
+        finally:
+            for key, future in held.items():
+                self._fail(key, future, _Abandoned())
+            self.forget(derived[key] for key in held if key in derived)
+
+    def _enter(self, key: Hashable, fresh: bool) -> tuple[str, Any]:
+        """``("hit", value)`` from the cache, or a flight's future to lead, join or wait on."""
+        with self._lock:
+            cached = None if fresh else self._cache.get(key)
+            if cached is not None and cached[0] > self.clock():
+                self.hits += 1
+                return "hit", cached[1]
+            flight = self._inflight.get(key)
+            if flight is None:
+                return "lead", self._open(key, fresh)
+            future, flight_fresh = flight
+            if flight_fresh or not fresh:
+                self.shared += 1
+                return "join", future
+            return "wait", future
+
+    def _claim(self, key: Hashable) -> Future[Any]:
+        while True:
+            with self._lock:
+                flight = self._inflight.get(key)
+                if flight is None:
+                    return self._open(key, True)
+            flight[0].exception()
+
+    def _open(self, key: Hashable, fresh: bool) -> Future[Any]:
+        # Running futures cannot be cancelled, so an awaiting caller that is itself
+        # cancelled never settles a flight that others share.
+        future: Future[Any] = Future()
+        future.set_running_or_notify_cancel()
+        self._inflight[key] = (future, fresh)
+        self.calls += 1
+        return future
+
+    def _land(self, key: Hashable, future: Future[Any], result: Any) -> None:
+        with self._lock:
+            del self._inflight[key]
+            if self.ttl > 0:
+                self._store(key, result)
+        future.set_result(result)
+
+    def _fail(self, key: Hashable, future: Future[Any], error: BaseException) -> None:
+        with self._lock:
+            del self._inflight[key]
+        # Cancellation and interpreter exits abandon the flight rather than being
+        # re-raised in every caller that joined it.
+        future.set_exception(error if isinstance(error, Exception) else _Abandoned())
+
+    def _store(self, key: Hashable, result: Any) -> None:
+        now = self.clock()
+        self._cache.pop(key, None)
+        self._cache[key] = (now + self.ttl, result)
+        expired = [item for item, (expires, _) in self._cache.items() if expires <= now]
+        for item in expired:
+            del self._cache[item]
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def forget(self, keys: Iterable[Hashable]) -> None:
+        """Drop the cached results for ``keys``; flights in progress are unaffected."""
+        with self._lock:
+            for key in keys:
+                self._cache.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+
+from pre.api.encoding import _jsonable, _parse_header
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+SSE_MEDIA_TYPE = "text/event-stream"
+
+
+def wants_event_stream(accept: str | None) -> bool:
+    """True when ``accept`` prefers server-sent events over NDJSON."""
+    weights = _parse_header(accept)
+    return weights.get(SSE_MEDIA_TYPE, 0.0) > weights.get(NDJSON_MEDIA_TYPE, 0.0)
+
+
+def _dumps(event: dict[str, Any]) -> str:
+    return json.dumps(_jsonable(event), separators=(",", ":"))
+
+
+def ndjson_lines(events: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    for event in events:
+        yield (_dumps(event) + "\n").encode()
+
+
+def sse_messages(events: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    """One SSE message per event, named by its ``event`` field and numbered from 1."""
+    for index, event in enumerate(events, start=1):
+        name = event.get("event", "message")
+        yield f"id: {index}\nevent: {name}\ndata: {_dumps(event)}\n\n".encode()
+
+
+def _closing(chunks: Iterator[bytes], on_close: Callable[[], None] | None) -> Iterator[bytes]:
+    try:
+        yield from chunks
+    finally:
+        if on_close is not None:
+            on_close()
+
+
+def stream_response(
+    events: Iterator[dict[str, Any]],
+    accept: str | None = None,
+    on_close: Callable[[], None] | None = None,
+) -> StreamingResponse:
+    """Stream ``events`` as NDJSON (the default) or SSE, each flushed when produced.
+
+    ``on_close`` runs once the stream ends, fails or the client disconnects.
+    """
+    if wants_event_stream(accept):
+        chunks, media_type = sse_messages(events), SSE_MEDIA_TYPE
+    else:
+        chunks, media_type = ndjson_lines(events), NDJSON_MEDIA_TYPE
+    return StreamingResponse(
+        _closing(chunks, on_close),
+        media_type=media_type,
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "Vary": "Accept"},
+    )
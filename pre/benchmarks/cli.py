@@ -3,7 +3,8 @@ from __future__ import annotations
 import argparse
 import json
 
-from pre.benchmarks.runner import run_benchmark
+from pre.benchmarks.kernels import KERNEL_BENCHMARKS
+from pre.benchmarks.runner import iter_benchmark, run_benchmark
 
 
 def benchmark_main() -> None:
@@ -13,9 +14,30 @@ def benchmark_main() -> None:
     parser.add_argument("--horizon", type=int, default=24)
     parser.add_argument("--context-length", type=int, default=168)
     parser.add_argument("--artifact-root", default="artifacts")
+    parser.add_argument("--kernel", choices=sorted(KERNEL_BENCHMARKS))
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Train models in parallel and print NDJSON leaderboard updates as each finishes",
+    )
     args = parser.parse_args()
 
+    if args.kernel:
+        print(json.dumps(KERNEL_BENCHMARKS[args.kernel](), indent=2))
+        return
+
     models = [item.strip() for item in args.models.split(",") if item.strip()]
+    if args.stream:
+        for event in iter_benchmark(
+            dataset=args.dataset,
+            models=models,
+            horizon=args.horizon,
+            context_length=args.context_length,
+            artifact_root=args.artifact_root,
+        ):
+            print(json.dumps(event), flush=True)
+        return
+
     report = run_benchmark(
         dataset=args.dataset,
         models=models,
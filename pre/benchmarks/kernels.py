@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import math
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from pre.api.batching import MicroBatcher
+from pre.data.base import WindowedDataset, WindowSpec, make_supervised_windows
+from pre.eval.calibration import picp, quantile_reliability_bins
+from pre.eval.kernel import fused_gaussian_report
+from pre.eval.metrics import gaussian_nll, mae, rmse
+from pre.infer.rollout import batched_monte_carlo_rollout, monte_carlo_rollout
+from pre.models.lstm_gaussian import LSTMGaussianModel
+
+
+def _measure(fn: Callable[[], object], repeats: int) -> dict[str, float]:
+    """Best-of-``repeats`` wall time plus traced peak allocation of a single call."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": best, "peak_bytes": float(peak)}
+
+
+def _compare(
+    name: str,
+    params: dict[str, Any],
+    baseline: dict[str, float],
+    candidate: dict[str, float],
+) -> dict[str, Any]:
+    return {
+        "kernel": name,
+        "params": params,
+        "baseline": baseline,
+        "candidate": candidate,
+        "speedup": baseline["seconds"] / max(candidate["seconds"], 1e-12),
+        "memory_ratio": baseline["peak_bytes"] / max(candidate["peak_bytes"], 1.0),
+    }
+
+
+def _loop_supervised_windows(values: np.ndarray, spec: WindowSpec) -> WindowedDataset:
+    """Reference per-window copy loop that ``make_supervised_windows`` replaced."""
+    series = values.reshape(-1)
+    window_count = len(series) - spec.context_length - spec.horizon + 1
+    x = np.zeros((window_count, spec.context_length), dtype=float)
+    y = np.zeros((window_count, spec.horizon), dtype=float)
+    t = np.zeros(window_count, dtype=int)
+
+    out_idx = 0
+    for start in range(0, window_count, spec.stride):
+        x[out_idx] = series[start : start + spec.context_length]
+        y[out_idx] = series[
+            start + spec.context_length : start + spec.context_length + spec.horizon
+        ]
+        t[out_idx] = start + spec.context_length
+        out_idx += 1
+
+    return WindowedDataset(features=x[:out_idx], targets=y[:out_idx], timestamps=t[:out_idx])
+
+
+def benchmark_windowing(
+    length: int = 24 * 365 * 3,
+    context_length: int = 168,
+    horizon: int = 24,
+    stride: int = 1,
+    repeats: int = 3,
+) -> dict[str, Any]:
+    """Compare strided-view windowing against the per-window copy loop."""
+    series = np.random.default_rng(0).normal(size=length)
+    spec = WindowSpec(context_length=context_length, horizon=horizon, stride=stride)
+    params = {
+        "length": length,
+        "context_length": context_length,
+        "horizon": horizon,
+        "stride": stride,
+    }
+    return _compare(
+        "windowing",
+        params,
+        baseline=_measure(lambda: _loop_supervised_windows(series, spec), repeats),
+        candidate=_measure(lambda: make_supervised_windows(series, spec), repeats),
+    )
+
+
+def benchmark_rollout(
+    num_samples: int = 10_000,
+    steps: int = 48,
+    phi: float = 0.9,
+    dtype: str = "float64",
+    repeats: int = 3,
+) -> dict[str, Any]:
+    """Compare the batched AR(1) rollout against the per-sample nested loop."""
+    initial = np.zeros(1)
+    loop_rng = np.random.default_rng(0)
+
+    def _scalar_step(state: np.ndarray) -> np.ndarray:
+        return phi * state + loop_rng.standard_normal(state.shape)
+
+    def _batch_step(states: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        noise = rng.standard_normal(states.shape, dtype=states.dtype)
+        states *= phi
+        states += noise
+        return states
+
+    params = {"num_samples": num_samples, "steps": steps, "phi": phi, "dtype": dtype}
+    result = _compare(
+        "rollout",
+        params,
+        baseline=_measure(
+            lambda: monte_carlo_rollout(initial, _scalar_step, steps, num_samples), 1
+        ),
+        candidate=_measure(
+            lambda: batched_monte_carlo_rollout(
+                initial, _batch_step, steps, num_samples, dtype=dtype
+            ),
+            repeats,
+        ),
+    )
+    for key in ("baseline", "candidate"):
+        result[key]["samples_per_second"] = num_samples / max(result[key]["seconds"], 1e-12)
+    return result
+
+
+def _reference_report(
+    y_true: np.ndarray,
+    mean: np.ndarray,
+    std: np.ndarray,
+    quantiles: dict[float, np.ndarray],
+) -> dict[str, Any]:
+    """Multi-pass reference report (``np.vectorize(math.erf)``) the fused kernel replaced."""
+    safe_std = np.clip(std, 1e-6, None)
+    z = (y_true - mean) / safe_std
+    cdf = 0.5 * (1.0 + np.vectorize(math.erf)(z / math.sqrt(2.0)))
+    pdf = np.exp(-0.5 * z**2) / math.sqrt(2.0 * math.pi)
+    crps = safe_std * (z * (2.0 * cdf - 1.0) + 2.0 * pdf - 1.0 / math.sqrt(math.pi))
+    return {
+        "mae": mae(y_true, mean),
+        "rmse": rmse(y_true, mean),
+        "nll": gaussian_nll(y_true, mean, std),
+        "crps": float(np.mean(crps)),
+        "coverage": picp(y_true, quantiles[min(quantiles)], quantiles[max(quantiles)]),
+        "reliability_bins": quantile_reliability_bins(y_true, quantiles),
+    }
+
+
+def benchmark_eval_kernel(size: int = 1_000_000, repeats: int = 3) -> dict[str, Any]:
+    """Compare the fused evaluation pass against the multi-pass ``np.vectorize`` report."""
+    rng = np.random.default_rng(0)
+    y_true = rng.normal(size=size)
+    mean = 0.1 * rng.normal(size=size)
+    std = 0.5 + np.abs(rng.normal(size=size))
+    quantiles = {0.1: mean - 1.28155 * std, 0.5: mean, 0.9: mean + 1.28155 * std}
+
+    result = _compare(
+        "eval",
+        {"size": size},
+        baseline=_measure(lambda: _reference_report(y_true, mean, std, quantiles), 1),
+        candidate=_measure(lambda: fused_gaussian_report(y_true, mean, std, quantiles), repeats),
+    )
+    reference = _reference_report(y_true, mean, std, quantiles)
+    fused = fused_gaussian_report(y_true, mean, std, quantiles)
+    result["max_abs_diff"] = max(
+        abs(fused[key] - reference[key]) for key in ("mae", "rmse", "nll", "crps", "coverage")
+    )
+    return result
+
+
+def benchmark_microbatch(
+    requests: int = 4_096,
+    context_length: int = 168,
+    horizon: int = 24,
+    max_batch_size: int = 64,
+    repeats: int = 3,
+) -> dict[str, Any]:
+    """Compare one ``predict`` per request against micro-batched concurrent requests."""
+    rng = np.random.default_rng(0)
+    model = LSTMGaussianModel.from_artifact_state(
+        {
+            "coefficients": rng.normal(size=(context_length, horizon)),
+            "bias": rng.normal(size=horizon),
+            "residual_std": np.ones(horizon),
+            "horizon": np.array([horizon]),
+        }
+    )
+    contexts = rng.normal(size=(requests, context_length))
+    levels = (0.1, 0.5, 0.9)
+
+    def _forecast(_: object, rows: np.ndarray) -> np.ndarray:
+        bands = model.predict(rows, horizon=horizon).materialize(levels)
+        return np.stack([bands[q] for q in levels], axis=1)
+
+    def _batched() -> None:
+        futures = [batcher.submit(None, row) for row in contexts]
+        for future in futures:
+            future.result()
+
+    batcher = MicroBatcher(_forecast, max_batch_size=max_batch_size)
+    try:
+        params = {
+            "requests": requests,
+            "context_length": context_length,
+            "horizon": horizon,
+            "max_batch_size": max_batch_size,
+        }
+        result = _compare(
+            "microbatch",
+            params,
+            baseline=_measure(lambda: [_forecast(None, row[None, :]) for row in contexts], 1),
+            candidate=_measure(_batched, repeats),
+        )
+        result["mean_batch_rows"] = batcher.rows / max(batcher.batches, 1)
+    finally:
+        batcher.shutdown()
+    for key in ("baseline", "candidate"):
+        result[key]["requests_per_second"] = requests / max(result[key]["seconds"], 1e-12)
+    return result
+
+
+KERNEL_BENCHMARKS: dict[str, Callable[[], dict[str, Any]]] = {
+    "eval": benchmark_eval_kernel,
+    "microbatch": benchmark_microbatch,
+    "rollout": benchmark_rollout,
+    "windowing": benchmark_windowing,
+}
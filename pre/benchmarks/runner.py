@@ -1,11 +1,123 @@
 from __future__ import annotations
 
+import hashlib
+import os
+from bisect import insort
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from pre.registry.artifacts import ensure_artifact_dir, save_json
+from pre.registry.artifacts import ensure_artifact_dir, load_json, save_json
 from pre.train.trainer import Trainer
 
+_RUN_VALIDATOR_FILES = ("summary.json", "model.npz")
+
+
+@dataclass(frozen=True)
+class BenchmarkSnapshot:
+    """Persisted leaderboard plus HTTP validators derived from its artifacts."""
+
+    report: dict[str, Any]
+    etag: str
+    last_modified: float
+
+
+def benchmark_id(dataset: str, horizon: int, context_length: int) -> str:
+    return f"benchmark-{dataset}-h{horizon}-c{context_length}"
+
+
+def _write_report(report: dict[str, Any], artifact_root: str) -> Path:
+    bench_id = benchmark_id(report["dataset"], report["horizon"], report["context_length"])
+    bench_dir = ensure_artifact_dir(Path(artifact_root), bench_id)
+    save_json(bench_dir / "leaderboard.json", report)
+    (bench_dir / "leaderboard.md").write_text(to_markdown(report), encoding="utf-8")
+    return bench_dir
+
+
+def _rank_key(run: dict[str, Any]) -> tuple[float, float, float]:
+    metrics = run["metrics"]
+    return (metrics["crps"], metrics["rmse"], metrics["mae"])
+
+
+def _train_run(
+    dataset: str,
+    model: str,
+    horizon: int,
+    context_length: int,
+    artifact_root: str,
+) -> dict[str, Any]:
+    result = Trainer().train(
+        dataset=dataset,
+        model=model,
+        horizon=horizon,
+        context_length=context_length,
+        artifact_root=artifact_root,
+    )
+    return {
+        "run_id": result.run_id,
+        "dataset": dataset,
+        "model": model,
+        "artifact_path": result.artifact_path,
+        "metrics": result.summary["metrics"],
+    }
+
+
+def iter_benchmark(
+    dataset: str,
+    models: list[str],
+    horizon: int,
+    context_length: int,
+    artifact_root: str = "artifacts",
+    max_workers: int | None = None,
+    executor_factory: Callable[..., Executor] = ProcessPoolExecutor,
+) -> Iterator[dict[str, Any]]:
+    """Yield a ``run`` event as each model finishes, then a ``leaderboard`` event.
+
+    ``run`` events carry the finished run, its 1-based ``rank`` among the runs so
+    far and the current ``leaderboard`` model order, so the first row arrives as
+    soon as the fastest model is done. With more than one worker the models train
+    on a process pool from ``executor_factory``; closing the iterator early cancels
+    models not yet started. The final event holds the persisted report, as
+    returned by ``run_benchmark``.
+    """
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    workers = max(1, min(workers, len(models)))
+    board: list[tuple[tuple[float, float, float], int, dict[str, Any]]] = []
+
+    def _event(run: dict[str, Any]) -> dict[str, Any]:
+        entry = (_rank_key(run), len(board), run)
+        insort(board, entry, key=lambda item: item[:2])
+        return {
+            "event": "run",
+            "completed": len(board),
+            "total": len(models),
+            "rank": board.index(entry) + 1,
+            "run": run,
+            "leaderboard": [row["model"] for *_, row in board],
+        }
+
+    if workers == 1:
+        for model in models:
+            yield _event(_train_run(dataset, model, horizon, context_length, artifact_root))
+    else:
+        pool = executor_factory(max_workers=workers)
+        try:
+            futures: list[Future[dict[str, Any]]] = [
+                pool.submit(_train_run, dataset, model, horizon, context_length, artifact_root)
+                for model in models
+            ]
+            for future in as_completed(futures):
+                yield _event(future.result())
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    runs = [row for *_, row in board]
+    report = build_leaderboard(dataset, models, horizon, context_length, runs)
+    report["artifact_path"] = str(_write_report(report, artifact_root))
+    yield {"event": "leaderboard", "report": report}
+
 
 def run_benchmark(
     dataset: str,
@@ -14,36 +126,22 @@ def run_benchmark(
     context_length: int,
     artifact_root: str = "artifacts",
 ) -> dict[str, Any]:
-    trainer = Trainer()
-    runs: list[dict[str, Any]] = []
-
-    for model in models:
-        result = trainer.train(
-            dataset=dataset,
-            model=model,
-            horizon=horizon,
-            context_length=context_length,
-            artifact_root=artifact_root,
-        )
-        run_payload = {
-            "run_id": result.run_id,
-            "dataset": dataset,
-            "model": model,
-            "artifact_path": result.artifact_path,
-            "metrics": result.summary["metrics"],
-        }
-        runs.append(run_payload)
-
-    leaderboard = sorted(
-        runs,
-        key=lambda item: (
-            item["metrics"]["crps"],
-            item["metrics"]["rmse"],
-            item["metrics"]["mae"],
-        ),
+    *_, done = iter_benchmark(
+        dataset, models, horizon, context_length, artifact_root=artifact_root, max_workers=1
     )
+    report: dict[str, Any] = done["report"]
+    return report
 
-    report = {
+
+def build_leaderboard(
+    dataset: str,
+    models: list[str],
+    horizon: int,
+    context_length: int,
+    runs: list[dict[str, Any]],
+) -> dict[str, Any]:
+    leaderboard = sorted(runs, key=_rank_key)
+    return {
         "dataset": dataset,
         "horizon": horizon,
         "context_length": context_length,
@@ -51,12 +149,50 @@ def run_benchmark(
         "leaderboard": leaderboard,
     }
 
-    bench_id = f"benchmark-{dataset}-h{horizon}-c{context_length}"
-    bench_dir = ensure_artifact_dir(Path(artifact_root), bench_id)
-    save_json(bench_dir / "leaderboard.json", report)
-    (bench_dir / "leaderboard.md").write_text(to_markdown(report), encoding="utf-8")
+
+def load_benchmark(
+    dataset: str,
+    horizon: int,
+    context_length: int,
+    artifact_root: str = "artifacts",
+) -> BenchmarkSnapshot | None:
+    """Serve the persisted leaderboard without training, or ``None`` if it cannot be.
+
+    Returns ``None`` when the leaderboard or any of its runs is missing. When a run
+    was retrained after the leaderboard was written, the leaderboard is rebuilt
+    from the runs' persisted ``summary.json`` metrics. The ETag hashes the
+    modification time and size of the leaderboard and every run's summary and
+    model, so it changes exactly when the underlying artifacts do.
+    """
+    bench_dir = Path(artifact_root) / benchmark_id(dataset, horizon, context_length)
+    leaderboard_path = bench_dir / "leaderboard.json"
+    if not leaderboard_path.is_file():
+        return None
+    report = load_json(leaderboard_path)
+    run_dirs = [Path(row["artifact_path"]) for row in report["leaderboard"]]
+    run_files = [run_dir / name for run_dir in run_dirs for name in _RUN_VALIDATOR_FILES]
+    if not all(path.is_file() for path in run_files):
+        return None
+
+    written = leaderboard_path.stat().st_mtime_ns
+    if any(path.stat().st_mtime_ns > written for path in run_files):
+        runs = [
+            {**row, "metrics": load_json(run_dir / "summary.json")["metrics"]}
+            for row, run_dir in zip(report["leaderboard"], run_dirs, strict=True)
+        ]
+        report = build_leaderboard(dataset, report["models"], horizon, context_length, runs)
+        _write_report(report, artifact_root)
+
+    stats = [path.stat() for path in [leaderboard_path, *run_files]]
+    digest = hashlib.sha256()
+    for path, stat in zip([leaderboard_path, *run_files], stats, strict=True):
+        digest.update(f"{path}:{stat.st_mtime_ns}:{stat.st_size};".encode())
     report["artifact_path"] = str(bench_dir)
-    return report
+    return BenchmarkSnapshot(
+        report=report,
+        etag=f'"{digest.hexdigest()[:32]}"',
+        last_modified=max(stat.st_mtime for stat in stats),
+    )
 
 
 def to_markdown(report: dict[str, Any]) -> str:
@@ -25,6 +25,7 @@ class TrainConfig(BaseModel):
 class EvalConfig(BaseModel):
     quantiles: tuple[float, ...] = (0.1, 0.5, 0.9)
     calibration_bins: int = Field(default=10, gt=1)
+    reliability_levels: int = Field(default=99, gt=0)
 
 
 class ModelConfig(BaseModel):
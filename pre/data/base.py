@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass
 from typing import NamedTuple
 from typing import Protocol
@@ -43,8 +44,17 @@ class DatasetAdapter(Protocol):
         """Create supervised context/horizon windows."""
 
 
-def make_supervised_windows(values: np.ndarray, spec: WindowSpec) -> WindowedDataset:
-    """Convert a 1D or single-column series into context/horizon supervised windows."""
+def make_supervised_windows(
+    values: np.ndarray,
+    spec: WindowSpec,
+    copy: bool = False,
+) -> WindowedDataset:
+    """Convert a 1D or single-column series into context/horizon supervised windows.
+
+    Features and targets are read-only strided views into ``values`` (one row per
+    window start, honoring ``spec.stride``), so no per-window copy is made. Pass
+    ``copy=True`` to get contiguous, writable arrays instead.
+    """
     if values.ndim == 2:
         if values.shape[1] != 1:
             raise ValueError("values must be 1D or a single-column 2D array")
@@ -53,25 +63,49 @@ def make_supervised_windows(values: np.ndarray, spec: WindowSpec) -> WindowedDat
         series = values
     else:
         raise ValueError("values must be 1D or 2D")
+    if spec.stride < 1:
+        raise ValueError("stride must be >= 1")
 
-    window_count = len(series) - spec.context_length - spec.horizon + 1
+    span = spec.context_length + spec.horizon
+    window_count = len(series) - span + 1
     if window_count <= 0:
         raise ValueError("Insufficient samples for requested context_length + horizon")
 
-    x = np.zeros((window_count, spec.context_length), dtype=float)
-    y = np.zeros((window_count, spec.horizon), dtype=float)
-    t = np.zeros(window_count, dtype=int)
-
-    out_idx = 0
-    for start in range(0, window_count, spec.stride):
-        x[out_idx] = series[start : start + spec.context_length]
-        y[out_idx] = series[
-            start + spec.context_length : start + spec.context_length + spec.horizon
-        ]
-        t[out_idx] = start + spec.context_length
-        out_idx += 1
-
-    return WindowedDataset(features=x[:out_idx], targets=y[:out_idx], timestamps=t[:out_idx])
+    series = np.asarray(series, dtype=float)
+    windows = np.lib.stride_tricks.sliding_window_view(series, span)[:: spec.stride]
+    x = windows[:, : spec.context_length]
+    y = windows[:, spec.context_length :]
+    t = np.arange(spec.context_length, spec.context_length + window_count, spec.stride)
+
+    if copy:
+        x = x.copy()
+        y = y.copy()
+    return WindowedDataset(features=x, targets=y, timestamps=t)
+
+
+def iter_window_chunks(
+    values: np.ndarray,
+    spec: WindowSpec,
+    chunk_size: int = 4096,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Yield ``(features, targets)`` window chunks of at most ``chunk_size`` rows.
+
+    Each chunk only reads (and casts to float) the rows of ``values`` its windows
+    cover, so ``values`` may be a memory-mapped series of any dtype that is paged
+    in one chunk at a time.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    if spec.stride < 1:
+        raise ValueError("stride must be >= 1")
+    span = spec.context_length + spec.horizon
+    starts = range(0, len(values) - span + 1, spec.stride)
+    if not starts:
+        raise ValueError("Insufficient samples for requested context_length + horizon")
+    for first in range(0, len(starts), chunk_size):
+        rows = starts[first : first + chunk_size]
+        windows = make_supervised_windows(values[rows[0] : rows[-1] + span], spec)
+        yield windows.features, windows.targets
 
 
 def temporal_train_val_test_split(
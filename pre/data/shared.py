@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class SharedArraySpec:
+    """Picklable handle describing an array placed in a shared memory segment."""
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+
+
+class SharedArrays:
+    """Owner of shared memory copies of a set of arrays.
+
+    The owning process creates one segment per array and is responsible for
+    releasing them; worker processes attach through ``attach_shared_arrays``
+    using the picklable ``specs`` instead of receiving pickled array copies.
+    """
+
+    def __init__(self, arrays: dict[str, np.ndarray]) -> None:
+        self._segments: list[SharedMemory] = []
+        self.specs: dict[str, SharedArraySpec] = {}
+        try:
+            for key, array in arrays.items():
+                segment = SharedMemory(create=True, size=max(1, array.nbytes))
+                self._segments.append(segment)
+                view: np.ndarray = np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)
+                view[...] = array
+                self.specs[key] = SharedArraySpec(
+                    name=segment.name,
+                    shape=tuple(array.shape),
+                    dtype=array.dtype.str,
+                )
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        for segment in self._segments:
+            segment.close()
+            segment.unlink()
+        self._segments = []
+
+    def __enter__(self) -> SharedArrays:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+def attach_shared_arrays(
+    specs: dict[str, SharedArraySpec],
+) -> tuple[dict[str, np.ndarray], list[SharedMemory]]:
+    """Attach read-only views to segments created by ``SharedArrays``.
+
+    The returned segment handles must be kept alive for as long as the views are used.
+    """
+    arrays: dict[str, np.ndarray] = {}
+    segments: list[SharedMemory] = []
+    for key, spec in specs.items():
+        segment = SharedMemory(name=spec.name)
+        segments.append(segment)
+        view: np.ndarray = np.ndarray(spec.shape, dtype=np.dtype(spec.dtype), buffer=segment.buf)
+        view.flags.writeable = False
+        arrays[key] = view
+    return arrays, segments
@@ -3,7 +3,7 @@ from __future__ import annotations
 import argparse
 import json
 
-from pre.demo.runner import build_mode_cards, run_all_demos, run_demo
+from pre.demo.runner import build_mode_cards, iter_demos, run_all_demos, run_demo
 
 
 def demo_main() -> None:
@@ -11,14 +11,27 @@ def demo_main() -> None:
     parser.add_argument("--mode", default="all")
     parser.add_argument("--artifact-root", default="artifacts")
     parser.add_argument("--list-modes", action="store_true")
+    parser.add_argument(
+        "--workers", type=int, help="Processes for --mode all (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--stream", action="store_true", help="Print each mode as NDJSON when it finishes"
+    )
     args = parser.parse_args()
 
     if args.list_modes:
         print(json.dumps(build_mode_cards(), indent=2))
         return
 
+    if args.stream:
+        modes = None if args.mode == "all" else [args.mode]
+        events = iter_demos(artifact_root=args.artifact_root, modes=modes, max_workers=args.workers)
+        for event in events:
+            print(json.dumps(event), flush=True)
+        return
+
     if args.mode == "all":
-        payload = run_all_demos(artifact_root=args.artifact_root)
+        payload = run_all_demos(artifact_root=args.artifact_root, max_workers=args.workers)
     else:
         payload = run_demo(mode=args.mode, artifact_root=args.artifact_root)
     print(json.dumps(payload, indent=2))
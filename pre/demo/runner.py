@@ -1,13 +1,22 @@
 from __future__ import annotations
 
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, as_completed
+from multiprocessing.shared_memory import SharedMemory
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
-from pre.demo.modes import DEMO_MODES
-from pre.registry.artifacts import ensure_artifact_dir, save_json
-from pre.train.trainer import Trainer
+from pre.data.shared import SharedArrays, SharedArraySpec, attach_shared_arrays
+from pre.demo.modes import DEMO_MODES, DemoMode
+from pre.registry.artifacts import artifact_path, ensure_artifact_dir, save_json
+from pre.registry.model_store import MODEL_STORE, LoadedRun, ModelStore, run_is_complete
+from pre.train.trainer import Trainer, load_dataset, make_run_id
+
+_WORKER_SERIES: dict[str, np.ndarray] = {}
+_WORKER_SEGMENTS: list[SharedMemory] = []
 
 
 def _tail_risk_from_metrics(metrics: dict[str, float]) -> float:
@@ -20,22 +29,28 @@ def _regime_score_from_metrics(metrics: dict[str, float]) -> float:
     return float(score)
 
 
-def run_demo(mode: str, artifact_root: str = "artifacts") -> dict[str, Any]:
+def _resolve_mode(mode: str) -> DemoMode:
     if mode not in DEMO_MODES:
         supported = ", ".join(sorted(DEMO_MODES))
         raise ValueError(f"Unsupported mode '{mode}'. Supported modes: {supported}")
+    return DEMO_MODES[mode]
+
+
+def _run_dir(spec: DemoMode, artifact_root: str) -> Path:
+    run_id = make_run_id(spec.dataset, spec.model, spec.horizon, spec.context_length)
+    return Path(artifact_root) / run_id
+
+
+def _demo_dir(spec: DemoMode, artifact_root: str) -> Path:
+    return artifact_path(Path(artifact_root), f"demo-{spec.slug}")
 
-    spec = DEMO_MODES[mode]
-    result = Trainer().train(
-        dataset=spec.dataset,
-        model=spec.model,
-        horizon=spec.horizon,
-        context_length=spec.context_length,
-        artifact_root=artifact_root,
-    )
 
-    metrics = result.summary["metrics"]
-    payload = {
+def _served_payload(spec: DemoMode, loaded: LoadedRun, artifact_root: str) -> dict[str, Any]:
+    dist = loaded.model.predict(loaded.scaler.transform(loaded.context), horizon=spec.horizon)
+    bands = dist.materialize((0.1, 0.5, 0.9))
+    metrics = loaded.summary["metrics"]
+    visuals = loaded.summary["visuals"]
+    return {
         "mode": spec.slug,
         "title": spec.title,
         "description": spec.description,
@@ -47,20 +62,131 @@ def run_demo(mode: str, artifact_root: str = "artifacts") -> dict[str, Any]:
         "metrics": metrics,
         "tail_risk_score": _tail_risk_from_metrics(metrics),
         "regime_shift_score": _regime_score_from_metrics(metrics),
-        "uncertainty_bands": result.summary["visuals"]["bands"],
-        "visuals": result.summary["visuals"],
-        "artifact_path": result.artifact_path,
+        "uncertainty_bands": visuals["bands"],
+        "visuals": visuals,
+        "forecast": {
+            "p10": bands[0.1][0].tolist(),
+            "p50": bands[0.5][0].tolist(),
+            "p90": bands[0.9][0].tolist(),
+        },
+        "artifact_path": str(loaded.run_dir),
+        "demo_artifact_path": str(_demo_dir(spec, artifact_root)),
     }
 
+
+def run_demo(
+    mode: str,
+    artifact_root: str = "artifacts",
+    store: ModelStore = MODEL_STORE,
+    values: np.ndarray | None = None,
+) -> dict[str, Any]:
+    """Train the mode's run, write its demo artifacts and return the payload.
+
+    ``values`` is the mode's already loaded dataset series, if any.
+    """
+    spec = _resolve_mode(mode)
+    result = Trainer().train(
+        dataset=spec.dataset,
+        model=spec.model,
+        horizon=spec.horizon,
+        context_length=spec.context_length,
+        artifact_root=artifact_root,
+        values=values,
+    )
+    payload = _served_payload(spec, store.get(Path(result.artifact_path)), artifact_root)
+
     mode_dir = ensure_artifact_dir(Path(artifact_root), f"demo-{spec.slug}")
     save_json(mode_dir / "demo.json", payload)
     (mode_dir / "demo.md").write_text(to_markdown(payload), encoding="utf-8")
-    payload["demo_artifact_path"] = str(mode_dir)
     return payload
 
 
-def run_all_demos(artifact_root: str = "artifacts") -> dict[str, Any]:
-    results = [run_demo(mode=mode, artifact_root=artifact_root) for mode in sorted(DEMO_MODES)]
+def demo_needs_training(mode: str, artifact_root: str = "artifacts") -> bool:
+    return not run_is_complete(_run_dir(_resolve_mode(mode), artifact_root))
+
+
+def serve_demo(
+    mode: str,
+    artifact_root: str = "artifacts",
+    retrain: bool = False,
+    store: ModelStore = MODEL_STORE,
+) -> dict[str, Any]:
+    """Predict from the mode's persisted run, training only if it is missing or ``retrain``.
+
+    The cached path reads artifacts through ``store`` and writes nothing.
+    """
+    spec = _resolve_mode(mode)
+    run_dir = _run_dir(spec, artifact_root)
+    if retrain or not run_is_complete(run_dir):
+        return run_demo(mode=mode, artifact_root=artifact_root, store=store)
+    return _served_payload(spec, store.get(run_dir), artifact_root)
+
+
+def _attach_worker(specs: dict[str, SharedArraySpec]) -> None:
+    series, segments = attach_shared_arrays(specs)
+    _WORKER_SERIES.update(series)
+    _WORKER_SEGMENTS.extend(segments)
+
+
+def _run_demo_in_worker(mode: str, artifact_root: str) -> dict[str, Any]:
+    values = _WORKER_SERIES[_resolve_mode(mode).dataset]
+    return run_demo(mode=mode, artifact_root=artifact_root, values=values)
+
+
+def iter_demos(
+    artifact_root: str = "artifacts",
+    modes: list[str] | None = None,
+    max_workers: int | None = None,
+    executor_factory: Callable[..., Executor] = ProcessPoolExecutor,
+) -> Iterator[dict[str, Any]]:
+    """Run demo ``modes`` (default all) and yield a ``mode`` event as each finishes.
+
+    Each distinct dataset is loaded once and reused by every mode built on it.
+    With more than one worker the modes run on a process pool from
+    ``executor_factory`` (called with ``initializer``/``initargs``) and the series are
+    copied once into shared memory that workers attach read-only, so the first
+    payload arrives after the fastest mode rather than after all of them. Closing
+    the iterator early cancels modes not yet started. A ``done`` event follows
+    the last mode.
+    """
+    selected = sorted(DEMO_MODES) if modes is None else [_resolve_mode(mode).slug for mode in modes]
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    workers = max(1, min(workers, len(selected)))
+    series = {
+        dataset: load_dataset(dataset)
+        for dataset in sorted({DEMO_MODES[mode].dataset for mode in selected})
+    }
+
+    def _event(completed: int, payload: dict[str, Any]) -> dict[str, Any]:
+        return {"event": "mode", "completed": completed, "total": len(selected), "payload": payload}
+
+    if workers == 1:
+        for completed, mode in enumerate(selected, start=1):
+            values = series[DEMO_MODES[mode].dataset]
+            yield _event(completed, run_demo(mode=mode, artifact_root=artifact_root, values=values))
+    else:
+        with SharedArrays(series) as shared:
+            pool = executor_factory(
+                max_workers=workers, initializer=_attach_worker, initargs=(shared.specs,)
+            )
+            try:
+                futures = [
+                    pool.submit(_run_demo_in_worker, mode, artifact_root) for mode in selected
+                ]
+                for completed, future in enumerate(as_completed(futures), start=1):
+                    yield _event(completed, future.result())
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
+    yield {"event": "done", "engine": "PRE", "count": len(selected)}
+
+
+def run_all_demos(
+    artifact_root: str = "artifacts",
+    max_workers: int | None = None,
+) -> dict[str, Any]:
+    """Run every demo mode in parallel (see ``iter_demos``); results are in mode order."""
+    *events, _ = iter_demos(artifact_root=artifact_root, max_workers=max_workers)
+    results = sorted((event["payload"] for event in events), key=lambda item: item["mode"])
     return {"engine": "PRE", "count": len(results), "modes": results}
 
 
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any
 
 import numpy as np
 
+from pre.eval.crps import QUANTILE_GRID
+from pre.infer.predict import PredictiveDistribution
+
+PIT_FAMILIES = ("normal", "mixture", "samples")
+
 
 @dataclass(frozen=True)
 class ReliabilityBin:
@@ -16,13 +23,112 @@ def quantile_reliability_bins(
     y_true: np.ndarray,
     quantile_predictions: dict[float, np.ndarray],
 ) -> list[ReliabilityBin]:
-    bins: list[ReliabilityBin] = []
-    for q in sorted(quantile_predictions):
-        pred = quantile_predictions[q]
-        observed = float(np.mean(y_true <= pred))
-        bins.append(ReliabilityBin(expected=q, observed=observed, count=int(y_true.size)))
-    return bins
+    levels = sorted(quantile_predictions)
+    stacked = np.stack([quantile_predictions[q] for q in levels])
+    observed = (y_true <= stacked).mean(axis=tuple(range(1, stacked.ndim)))
+    return [
+        ReliabilityBin(expected=q, observed=float(value), count=int(y_true.size))
+        for q, value in zip(levels, observed, strict=True)
+    ]
 
 
 def picp(y_true: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> float:
     return float(np.mean((y_true >= lower) & (y_true <= upper)))
+
+
+def _count_below(ordered: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Per element, how many of the sorted values on ``ordered``'s last axis are ``< y``.
+
+    A vectorized binary search: ``ceil(log2(L + 1))`` gather-and-compare steps
+    over ``L`` levels instead of one full pass per level.
+    """
+    size = ordered.shape[-1]
+    target = y[..., None]
+    lo = np.zeros(target.shape, dtype=np.intp)
+    hi = np.full(target.shape, size, dtype=np.intp)
+    for _ in range(size.bit_length()):
+        mid = (lo + hi) // 2
+        probe = np.take_along_axis(ordered, np.minimum(mid, size - 1), axis=-1)
+        right = (lo < hi) & (probe < target)
+        lo = np.where(right, mid + 1, lo)
+        hi = np.where(right, hi, np.minimum(hi, mid))
+    return lo[..., 0]
+
+
+def pit_values(
+    dist: PredictiveDistribution,
+    y_true: np.ndarray,
+    grid: Sequence[float] = QUANTILE_GRID,
+) -> np.ndarray:
+    """Probability integral transform ``F(y)`` of each target under ``dist``.
+
+    Normal, mixture and sample distributions use their exact CDF. Other
+    distributions are located among quantiles on ``grid`` (or the materialized
+    quantiles when the family cannot produce new levels) and assigned the midpoint
+    of the level interval they fall in.
+    """
+    if dist.family in PIT_FAMILIES:
+        return np.asarray(dist.cdf(y_true))
+    levels = tuple(grid) if dist.family is not None else tuple(sorted(dist.quantiles))
+    bounds = np.concatenate([[0.0], levels, [1.0]])
+    quantiles = dist.materialize(levels)
+    y = np.asarray(y_true, dtype=float)
+    stacked = np.stack([np.broadcast_to(quantiles[q], y.shape) for q in levels], axis=-1)
+    position = _count_below(np.sort(stacked, axis=-1), y)
+    return np.asarray(0.5 * (bounds[position] + bounds[position + 1]))
+
+
+@dataclass
+class CalibrationAccumulator:
+    """Mergeable PIT histogram plus reliability on a fine quantile grid.
+
+    Each ``update`` locates PIT values among the sorted ``levels`` with one
+    ``searchsorted`` and counts them per interval with one ``bincount``; a
+    cumulative sum then gives the observed frequency ``P(PIT <= q)`` for every
+    level at once. The histogram uses ``bins`` equal-width buckets.
+    """
+
+    levels: tuple[float, ...] = QUANTILE_GRID
+    bins: int = 10
+    count: int = 0
+    histogram: np.ndarray = field(init=False)
+    interval_counts: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        if self.bins < 1:
+            raise ValueError("bins must be >= 1")
+        self.levels = tuple(sorted(self.levels))
+        self.histogram = np.zeros(self.bins, dtype=np.int64)
+        self.interval_counts = np.zeros(len(self.levels) + 1, dtype=np.int64)
+
+    def update(self, pit: np.ndarray) -> None:
+        flat = np.asarray(pit, dtype=float).reshape(-1)
+        buckets = np.minimum((flat * self.bins).astype(np.intp), self.bins - 1)
+        self.histogram += np.bincount(buckets, minlength=self.bins)
+        intervals = np.searchsorted(self.levels, flat, side="left")
+        self.interval_counts += np.bincount(intervals, minlength=len(self.levels) + 1)
+        self.count += flat.size
+
+    def merge(self, other: CalibrationAccumulator) -> None:
+        if other.levels != self.levels or other.bins != self.bins:
+            raise ValueError("calibration accumulators must share levels and bins")
+        self.histogram += other.histogram
+        self.interval_counts += other.interval_counts
+        self.count += other.count
+
+    def reliability(self) -> list[ReliabilityBin]:
+        observed = np.cumsum(self.interval_counts)[:-1] / max(self.count, 1)
+        return [
+            ReliabilityBin(expected=q, observed=float(value), count=self.count)
+            for q, value in zip(self.levels, observed, strict=True)
+        ]
+
+    def finalize(self) -> dict[str, Any]:
+        """Compact report entry: histogram densities and observed frequency per level."""
+        total = max(self.count, 1)
+        return {
+            "count": self.count,
+            "pit_histogram": (self.histogram * self.bins / total).tolist(),
+            "levels": list(self.levels),
+            "observed": [item.observed for item in self.reliability()],
+        }
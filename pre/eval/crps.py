@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from pre.infer.predict import PredictiveDistribution
+from pre.infer.special import normal_cdf, normal_pdf
+
+_INV_SQRT_PI = 1.0 / np.sqrt(np.pi)
+
+
+def quantile_grid(count: int) -> tuple[float, ...]:
+    """``count`` evenly spaced interior levels, e.g. 99 -> 0.01, ..., 0.99.
+
+    Every grid of a given ``count`` is built here so the levels used by CRPS and
+    calibration are bit-identical and share memoized quantiles.
+    """
+    return tuple(float(q) for q in np.arange(1, count + 1) / (count + 1))
+
+
+QUANTILE_GRID = quantile_grid(99)
+
+
+def crps_gaussian_values(
+    y_true: np.ndarray,
+    mean: np.ndarray,
+    std: np.ndarray,
+    eps: float = 1e-6,
+) -> np.ndarray:
+    """Element-wise closed-form Gaussian CRPS."""
+    safe_std = np.clip(std, eps, None)
+    z = (y_true - mean) / safe_std
+    return np.asarray(
+        safe_std * (z * (2.0 * normal_cdf(z) - 1.0) + 2.0 * normal_pdf(z) - _INV_SQRT_PI)
+    )
+
+
+def crps_ensemble(samples: np.ndarray, y_true: np.ndarray) -> np.ndarray:
+    """Element-wise CRPS of an ensemble ``samples`` shaped ``[n, ...]`` against ``y_true``.
+
+    Uses ``E|X - y| - ½E|X - X'|`` with the pairwise term from sorted samples:
+    ``Σᵢⱼ |xᵢ - xⱼ| = 2 Σᵢ (2i - n - 1) x₍ᵢ₎``, which is O(n log n) per element
+    instead of O(n²). Vectorized over every trailing axis.
+    """
+    n = samples.shape[0]
+    if n == 0:
+        raise ValueError("samples must not be empty")
+    spread = np.abs(samples - y_true).mean(axis=0)
+    ordered = np.sort(samples, axis=0)
+    ranks = (2.0 * np.arange(1, n + 1) - n - 1).reshape((n,) + (1,) * (samples.ndim - 1))
+    return np.asarray(spread - (ranks * ordered).sum(axis=0) / n**2)
+
+
+def _gaussian_abs_moment(mu: np.ndarray, sigma: np.ndarray) -> np.ndarray:
+    """``E|Z|`` for ``Z ~ N(mu, sigma²)``."""
+    z = mu / sigma
+    return np.asarray(2.0 * sigma * normal_pdf(z) + mu * (2.0 * normal_cdf(z) - 1.0))
+
+
+def crps_gaussian_mixture(
+    y_true: np.ndarray,
+    logmix: np.ndarray,
+    mean: np.ndarray,
+    logstd: np.ndarray,
+) -> np.ndarray:
+    """Element-wise closed-form CRPS of Gaussian mixtures with parameters ``[..., K]``.
+
+    ``Σₖ wₖ E|y - Xₖ| - ½ Σₖₗ wₖ wₗ E|Xₖ - Xₗ|`` where each expectation is the
+    absolute first moment of a Gaussian (Grimit et al., 2006). Cost is O(K²).
+    """
+    weights = np.exp(logmix)
+    variance = np.exp(2.0 * logstd)
+    y = np.asarray(y_true)[..., None]
+    direct = (weights * _gaussian_abs_moment(y - mean, np.exp(logstd))).sum(axis=-1)
+    pair_mean = mean[..., :, None] - mean[..., None, :]
+    pair_std = np.sqrt(variance[..., :, None] + variance[..., None, :])
+    pair_weights = weights[..., :, None] * weights[..., None, :]
+    pairwise = (pair_weights * _gaussian_abs_moment(pair_mean, pair_std)).sum(axis=(-2, -1))
+    return np.asarray(direct - 0.5 * pairwise)
+
+
+def crps_quantiles(y_true: np.ndarray, quantiles: dict[float, np.ndarray]) -> np.ndarray:
+    """Element-wise CRPS approximated from quantiles via ``CRPS = 2∫₀¹ ρ_τ(y - q_τ) dτ``.
+
+    The integral uses a midpoint rule: each level's pinball loss is weighted by the
+    width of the part of ``[0, 1]`` closest to it, so uneven level grids are handled.
+    Accuracy improves with the number of levels.
+    """
+    if not quantiles:
+        raise ValueError("quantiles must not be empty")
+    levels = np.array(sorted(quantiles))
+    edges = np.concatenate([[0.0], 0.5 * (levels[1:] + levels[:-1]), [1.0]])
+    total = np.zeros(np.shape(y_true))
+    for level, width in zip(levels, np.diff(edges), strict=True):
+        residual = y_true - quantiles[float(level)]
+        total += width * np.maximum(level * residual, (level - 1.0) * residual)
+    return 2.0 * total
+
+
+def crps_distribution(
+    dist: PredictiveDistribution,
+    y_true: np.ndarray,
+    grid: Sequence[float] = QUANTILE_GRID,
+) -> np.ndarray:
+    """Element-wise CRPS using the most exact form available for ``dist``.
+
+    Mixtures use the closed form, sample distributions the sorted ensemble form,
+    normals the Gaussian closed form, and anything else the quantile approximation
+    (on ``grid`` when the family can produce arbitrary levels, otherwise on the
+    materialized quantiles).
+    """
+    if dist.family == "mixture":
+        params = dist.params
+        return crps_gaussian_mixture(y_true, params["logmix"], params["mean"], params["logstd"])
+    if dist.samples is not None:
+        return crps_ensemble(dist.samples, y_true)
+    if dist.family == "normal" and dist.mean is not None and dist.std is not None:
+        return crps_gaussian_values(y_true, dist.mean, dist.std)
+    levels = grid if dist.family is not None else tuple(dist.quantiles)
+    return crps_quantiles(y_true, dist.materialize(levels))
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+from pre.eval.streaming import ReportAccumulator, report_elements
+
+BREAKDOWN_METRICS = ("mae", "rmse", "nll", "crps", "coverage")
+
+
+def fused_gaussian_report(
+    y_true: np.ndarray,
+    mean: np.ndarray,
+    std: np.ndarray,
+    quantiles: dict[float, np.ndarray],
+    chunk_size: int = 65_536,
+    eps: float = 1e-6,
+    crps: np.ndarray | None = None,
+) -> dict[str, Any]:
+    """Every ``build_report`` metric from a single chunked pass over the inputs.
+
+    Each chunk of ``chunk_size`` elements is loaded once and reduced into a
+    ``ReportAccumulator`` (absolute/squared error, Gaussian NLL and CRPS, interval
+    coverage between the lowest and highest quantile, per-quantile hit counts), so
+    temporaries stay cache-sized. Inputs are flattened and must have equal size.
+    ``crps`` optionally overrides the Gaussian CRPS with element-wise scores.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    if not quantiles:
+        raise ValueError("quantiles must not be empty")
+    y = np.asarray(y_true, dtype=float).reshape(-1)
+    flat_mean = np.asarray(mean, dtype=float).reshape(-1)
+    flat_std = np.asarray(std, dtype=float).reshape(-1)
+    flat_quantiles = {
+        q: np.asarray(values, dtype=float).reshape(-1) for q, values in quantiles.items()
+    }
+    flat_crps = None if crps is None else np.asarray(crps, dtype=float).reshape(-1)
+    named = [("mean", flat_mean), ("std", flat_std), *flat_quantiles.items()]
+    if flat_crps is not None:
+        named.append(("crps", flat_crps))
+    for name, values in named:
+        if values.size != y.size:
+            raise ValueError(f"size mismatch for {name}: {values.size} vs {y.size}")
+
+    accumulator = ReportAccumulator(tuple(quantiles), eps=eps)
+    for start in range(0, y.size, chunk_size):
+        chunk = slice(start, start + chunk_size)
+        accumulator.update(
+            y[chunk],
+            flat_mean[chunk],
+            flat_std[chunk],
+            {q: values[chunk] for q, values in flat_quantiles.items()},
+            None if flat_crps is None else flat_crps[chunk],
+        )
+    return accumulator.finalize()
+
+
+def fused_breakdown_report(
+    y_true: np.ndarray,
+    mean: np.ndarray,
+    std: np.ndarray,
+    quantiles: dict[float, np.ndarray],
+    chunk_rows: int = 4_096,
+    eps: float = 1e-6,
+    crps: np.ndarray | None = None,
+) -> dict[str, Any]:
+    """``build_report`` metrics plus per-step and per-series breakdowns in one pass.
+
+    Inputs are shaped ``[series, horizon]``. Each block of ``chunk_rows`` series
+    computes its ``report_elements`` once; a ``ReportAccumulator`` absorbs them for
+    the overall report, and the same terms are reduced along the horizon axis
+    (per-series metrics) and the series axis (per-step running sums).
+    """
+    if chunk_rows < 1:
+        raise ValueError("chunk_rows must be >= 1")
+    if not quantiles:
+        raise ValueError("quantiles must not be empty")
+    y = np.asarray(y_true, dtype=float)
+    if y.ndim != 2:
+        raise ValueError(f"breakdown requires [series, horizon] inputs, got shape {y.shape}")
+    accumulator = ReportAccumulator(tuple(quantiles), eps=eps)
+    arrays = [np.asarray(values, dtype=float) for values in (mean, std)]
+    bounds = [np.asarray(quantiles[q], dtype=float) for q in accumulator.levels]
+    scores = None if crps is None else np.asarray(crps, dtype=float)
+    for values in [*arrays, *bounds, *([] if scores is None else [scores])]:
+        if values.shape != y.shape:
+            raise ValueError(f"shape mismatch: {values.shape} vs {y.shape}")
+    flat_mean, flat_std = arrays
+
+    series, horizon = y.shape
+    step_sums = {key: np.zeros(horizon) for key in ("abs", "sq", "nll", "crps", "covered")}
+    by_series = {key: np.empty(series) for key in BREAKDOWN_METRICS}
+    for start in range(0, series, chunk_rows):
+        rows = slice(start, start + chunk_rows)
+        elements = report_elements(
+            y[rows],
+            flat_mean[rows],
+            flat_std[rows],
+            [values[rows] for values in bounds],
+            None if scores is None else scores[rows],
+            eps=eps,
+        )
+        accumulator.absorb(elements)
+        for key, sums in step_sums.items():
+            sums += elements[key].sum(axis=0)
+
+        by_series["mae"][rows] = elements["abs"].mean(axis=1)
+        by_series["rmse"][rows] = np.sqrt(elements["sq"].mean(axis=1))
+        by_series["nll"][rows] = elements["nll"].mean(axis=1)
+        by_series["crps"][rows] = elements["crps"].mean(axis=1)
+        by_series["coverage"][rows] = elements["covered"].mean(axis=1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        by_step = {
+            "mae": step_sums["abs"] / series,
+            "rmse": np.sqrt(step_sums["sq"] / series),
+            "nll": step_sums["nll"] / series,
+            "crps": step_sums["crps"] / series,
+            "coverage": step_sums["covered"] / series,
+        }
+    return {
+        **accumulator.finalize(),
+        "by_step": {key: values.tolist() for key, values in by_step.items()},
+        "by_series": by_series,
+    }
@@ -4,6 +4,8 @@ import math
 
 import numpy as np
 
+from pre.infer.special import normal_cdf
+
 
 def mae(y_true: np.ndarray, y_pred: np.ndarray) -> float:
     return float(np.mean(np.abs(y_true - y_pred)))
@@ -30,8 +32,7 @@ def _standard_normal_pdf(z: np.ndarray) -> np.ndarray:
 
 
 def _standard_normal_cdf(z: np.ndarray) -> np.ndarray:
-    erf_values = np.vectorize(math.erf)(z / math.sqrt(2.0))
-    return 0.5 * (1.0 + erf_values)
+    return normal_cdf(z)
 
 
 def crps_gaussian(
@@ -1,12 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import asdict
 from typing import Any
 
 import numpy as np
 
-from pre.eval.calibration import picp, quantile_reliability_bins
-from pre.eval.metrics import crps_gaussian, gaussian_nll, mae, rmse
+from pre.eval.kernel import BREAKDOWN_METRICS, fused_breakdown_report, fused_gaussian_report
 
 
 def build_report(
@@ -14,19 +12,19 @@ def build_report(
     y_pred_mean: np.ndarray,
     y_pred_std: np.ndarray,
     quantiles: dict[float, np.ndarray],
+    crps_values: np.ndarray | None = None,
+    breakdown: bool = False,
 ) -> dict[str, object]:
-    lower = quantiles[min(quantiles)]
-    upper = quantiles[max(quantiles)]
-    reliability = quantile_reliability_bins(y_true=y_true, quantile_predictions=quantiles)
+    """Point, Gaussian and calibration metrics computed in one fused pass.
 
-    return {
-        "mae": mae(y_true, y_pred_mean),
-        "rmse": rmse(y_true, y_pred_mean),
-        "nll": gaussian_nll(y_true, y_pred_mean, y_pred_std),
-        "crps": crps_gaussian(y_true, y_pred_mean, y_pred_std),
-        "coverage": picp(y_true, lower, upper),
-        "reliability_bins": [asdict(bin_value) for bin_value in reliability],
-    }
+    ``crps_values`` (element-wise, e.g. from ``pre.eval.crps.crps_distribution``)
+    replaces the Gaussian CRPS for non-Gaussian predictive distributions. With
+    ``breakdown=True`` the inputs must be shaped ``[series, horizon]`` and the
+    report also carries ``by_step`` lists and ``by_series`` arrays per metric.
+    """
+    if breakdown:
+        return fused_breakdown_report(y_true, y_pred_mean, y_pred_std, quantiles, crps=crps_values)
+    return fused_gaussian_report(y_true, y_pred_mean, y_pred_std, quantiles, crps=crps_values)
 
 
 def to_markdown(report: dict[str, Any]) -> str:
@@ -41,4 +39,20 @@ def to_markdown(report: dict[str, Any]) -> str:
     for bin_value in report["reliability_bins"]:
         row = bin_value
         lines.append(f"| {row['expected']:.2f} | {row['observed']:.2f} | {row['count']} |")
+
+    by_step = report.get("by_step")
+    if by_step:
+        header = " | ".join(BREAKDOWN_METRICS)
+        lines.extend(["", "## By Horizon Step", "", f"| step | {header} |", "|---" * 6 + "|"])
+        for step in range(len(by_step["mae"])):
+            values = " | ".join(f"{by_step[key][step]:.4f}" for key in BREAKDOWN_METRICS)
+            lines.append(f"| {step} | {values} |")
+
+    calibration = report.get("calibration")
+    if calibration:
+        histogram = calibration["pit_histogram"]
+        lines.extend(["", "## PIT Histogram", "", "| bin | density |", "|---|---|"])
+        for index, density in enumerate(histogram):
+            low, high = index / len(histogram), (index + 1) / len(histogram)
+            lines.append(f"| {low:.2f}-{high:.2f} | {density:.3f} |")
     return "\n".join(lines)
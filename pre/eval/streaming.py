@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from pre.eval.crps import crps_gaussian_values
+
+_HALF_LOG_2PI = 0.5 * math.log(2.0 * math.pi)
+
+ReportChunk = tuple[np.ndarray, np.ndarray, np.ndarray, dict[float, np.ndarray]]
+
+
+def report_elements(
+    y_true: np.ndarray,
+    mean: np.ndarray,
+    std: np.ndarray,
+    bounds: list[np.ndarray],
+    crps: np.ndarray | None = None,
+    eps: float = 1e-6,
+) -> dict[str, np.ndarray]:
+    """Element-wise terms behind every report metric, in the shape of ``y_true``.
+
+    ``bounds`` are the quantile predictions in ascending level order; ``hits``
+    stacks ``y_true <= bound`` for each of them along a new leading axis.
+    """
+    error = y_true - mean
+    safe_std = np.clip(std, eps, None)
+    z = error / safe_std
+    return {
+        "abs": np.abs(error),
+        "sq": np.square(error),
+        "nll": _HALF_LOG_2PI + np.log(safe_std) + 0.5 * np.square(z),
+        "crps": (
+            crps_gaussian_values(y_true, mean, safe_std, eps=eps)
+            if crps is None
+            else np.asarray(crps, dtype=float).reshape(y_true.shape)
+        ),
+        "covered": (y_true >= bounds[0]) & (y_true <= bounds[-1]),
+        "hits": np.stack([y_true <= values for values in bounds]),
+    }
+
+
+@dataclass
+class ReportAccumulator:
+    """Running sums behind every ``build_report`` metric.
+
+    ``update`` absorbs a chunk of flattened targets and predictions, ``merge`` adds
+    another accumulator over the same quantile levels (e.g. from a worker process)
+    and ``finalize`` produces the report dict. State is O(len(levels)).
+    """
+
+    levels: tuple[float, ...]
+    eps: float = 1e-6
+    count: int = 0
+    abs_error: float = 0.0
+    sq_error: float = 0.0
+    nll: float = 0.0
+    crps: float = 0.0
+    covered: int = 0
+    hits: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        if not self.levels:
+            raise ValueError("levels must not be empty")
+        self.levels = tuple(sorted(self.levels))
+        self.hits = np.zeros(len(self.levels), dtype=np.int64)
+
+    def update(
+        self,
+        y_true: np.ndarray,
+        mean: np.ndarray,
+        std: np.ndarray,
+        quantiles: dict[float, np.ndarray],
+        crps: np.ndarray | None = None,
+    ) -> None:
+        """Absorb one chunk; every array is flattened and must match ``y_true`` in size.
+
+        ``crps`` optionally supplies element-wise CRPS from a non-Gaussian scorer;
+        otherwise the Gaussian closed form on ``mean``/``std`` is used.
+        """
+        y = np.asarray(y_true, dtype=float).reshape(-1)
+        self.absorb(
+            report_elements(
+                y,
+                np.asarray(mean, dtype=float).reshape(-1),
+                np.asarray(std, dtype=float).reshape(-1),
+                [np.asarray(quantiles[q], dtype=float).reshape(-1) for q in self.levels],
+                crps,
+                eps=self.eps,
+            )
+        )
+
+    def absorb(self, elements: dict[str, np.ndarray]) -> None:
+        """Add terms already computed by ``report_elements`` for ``levels``."""
+        self.abs_error += float(elements["abs"].sum())
+        self.sq_error += float(elements["sq"].sum())
+        self.nll += float(elements["nll"].sum())
+        self.crps += float(elements["crps"].sum())
+        hits = elements["hits"].reshape(len(self.levels), -1)
+        self.hits += np.count_nonzero(hits, axis=1)
+        self.covered += int(np.count_nonzero(elements["covered"]))
+        self.count += hits.shape[1]
+
+    def merge(self, other: ReportAccumulator) -> None:
+        if other.levels != self.levels:
+            raise ValueError(f"quantile levels differ: {self.levels} vs {other.levels}")
+        self.count += other.count
+        self.abs_error += other.abs_error
+        self.sq_error += other.sq_error
+        self.nll += other.nll
+        self.crps += other.crps
+        self.covered += other.covered
+        self.hits += other.hits
+
+    def finalize(self) -> dict[str, Any]:
+        count = self.count
+
+        def _mean(total: float) -> float:
+            return total / count if count else float("nan")
+
+        return {
+            "mae": _mean(self.abs_error),
+            "rmse": math.sqrt(_mean(self.sq_error)),
+            "nll": _mean(self.nll),
+            "crps": _mean(self.crps),
+            "coverage": _mean(self.covered),
+            "reliability_bins": [
+                {"expected": q, "observed": _mean(float(self.hits[index])), "count": count}
+                for index, q in enumerate(self.levels)
+            ],
+        }
+
+
+def stream_report(chunks: Iterable[ReportChunk]) -> dict[str, Any]:
+    """Report over ``(y_true, mean, std, quantiles)`` chunks without holding them all."""
+    accumulator: ReportAccumulator | None = None
+    for y_true, mean, std, quantiles in chunks:
+        if accumulator is None:
+            accumulator = ReportAccumulator(tuple(quantiles))
+        accumulator.update(y_true, mean, std, quantiles)
+    if accumulator is None:
+        raise ValueError("No chunks to evaluate")
+    return accumulator.finalize()
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+
+@dataclass
+class StepMoments:
+    """Per-step count, mean and sum of squared deviations, merged with Chan's update."""
+
+    steps: int
+    count: int = 0
+    mean: np.ndarray = field(init=False)
+    m2: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.mean = np.zeros(self.steps)
+        self.m2 = np.zeros(self.steps)
+
+    def update(self, values: np.ndarray) -> None:
+        """Absorb a ``[n, steps]`` block of trajectories."""
+        if values.shape[0] == 0:
+            return
+        block = StepMoments(self.steps)
+        block.count = values.shape[0]
+        block.mean = values.mean(axis=0, dtype=float)
+        block.m2 = np.square(values - block.mean).sum(axis=0)
+        self.merge(block)
+
+    def merge(self, other: StepMoments) -> None:
+        if other.steps != self.steps:
+            raise ValueError(f"step mismatch: {self.steps} vs {other.steps}")
+        total = self.count + other.count
+        if other.count == 0:
+            return
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * (other.count / total)
+        self.m2 = self.m2 + other.m2 + delta**2 * (self.count * other.count / total)
+        self.count = total
+
+    @property
+    def std(self) -> np.ndarray:
+        """Population standard deviation per step."""
+        return np.sqrt(self.m2 / max(self.count, 1))
+
+
+@dataclass
+class ExceedanceCounts:
+    """Per-step counts of values strictly above each threshold."""
+
+    thresholds: tuple[float, ...]
+    steps: int
+    total: int = 0
+    counts: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.counts = np.zeros((len(self.thresholds), self.steps), dtype=np.int64)
+
+    def update(self, values: np.ndarray) -> None:
+        for row, threshold in enumerate(self.thresholds):
+            self.counts[row] += np.count_nonzero(values > threshold, axis=0)
+        self.total += values.shape[0]
+
+    def merge(self, other: ExceedanceCounts) -> None:
+        if other.thresholds != self.thresholds or other.steps != self.steps:
+            raise ValueError("exceedance accumulators must share thresholds and steps")
+        self.counts += other.counts
+        self.total += other.total
+
+    def probabilities(self) -> dict[float, np.ndarray]:
+        return {
+            threshold: self.counts[row] / max(self.total, 1)
+            for row, threshold in enumerate(self.thresholds)
+        }
+
+
+@dataclass
+class QuantileSketch:
+    """Mergeable per-step quantile sketch with bounded relative error.
+
+    Values are counted in logarithmic buckets ``(γ^(k-1), γ^k]`` of their magnitude
+    with ``γ = (1 + α) / (1 - α)``, separately for each sign, so any quantile is
+    recovered within relative error ``α`` of a value of the matching rank.
+    Magnitudes below ``min_value`` share a zero bucket. Bucket arrays are dense
+    over the observed key range, which depends on the data's dynamic range and
+    not on how many values were added.
+    """
+
+    steps: int
+    relative_accuracy: float = 0.01
+    min_value: float = 1e-9
+    offset: int = 0
+    positive: np.ndarray = field(init=False)
+    negative: np.ndarray = field(init=False)
+    zero: np.ndarray = field(init=False)
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self.positive = np.zeros((self.steps, 0), dtype=np.int64)
+        self.negative = np.zeros((self.steps, 0), dtype=np.int64)
+        self.zero = np.zeros(self.steps, dtype=np.int64)
+
+    @property
+    def gamma(self) -> float:
+        return (1.0 + self.relative_accuracy) / (1.0 - self.relative_accuracy)
+
+    @property
+    def count(self) -> int:
+        return int(self.zero[0] + self.positive[0].sum() + self.negative[0].sum())
+
+    def _ensure_range(self, low: int, high: int) -> None:
+        width = self.positive.shape[1]
+        if width == 0:
+            self.offset = low
+        new_low = min(low, self.offset)
+        new_high = max(high, self.offset + width - 1)
+        if new_low == self.offset and new_high == self.offset + width - 1:
+            return
+        new_width = new_high - new_low + 1
+        start = self.offset - new_low
+        for name in ("positive", "negative"):
+            grown = np.zeros((self.steps, new_width), dtype=np.int64)
+            grown[:, start : start + width] = getattr(self, name)
+            setattr(self, name, grown)
+        self.offset = new_low
+
+    def update(self, values: np.ndarray) -> None:
+        """Absorb a ``[n, steps]`` block of trajectories."""
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 2 or values.shape[1] != self.steps:
+            raise ValueError(f"values must be shaped [n, {self.steps}]")
+        magnitude = np.abs(values)
+        significant = magnitude > self.min_value
+        self.zero += values.shape[0] - significant.sum(axis=0)
+        if not significant.any():
+            return
+
+        keys = np.zeros(values.shape, dtype=np.int64)
+        keys[significant] = np.ceil(np.log(magnitude[significant]) / math.log(self.gamma))
+        observed = keys[significant]
+        self._ensure_range(int(np.min(observed)), int(np.max(observed)))
+        width = self.positive.shape[1]
+        flat = np.arange(self.steps) * width + (keys - self.offset)
+        size = self.steps * width
+        signs = (("positive", values > self.min_value), ("negative", values < -self.min_value))
+        for name, mask in signs:
+            counts = np.bincount(flat[mask], minlength=size).reshape(self.steps, width)
+            getattr(self, name)[...] += counts
+
+    def merge(self, other: QuantileSketch) -> None:
+        if other.steps != self.steps or other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("sketches must share steps and relative_accuracy")
+        self.zero += other.zero
+        width = other.positive.shape[1]
+        if width == 0:
+            return
+        self._ensure_range(other.offset, other.offset + width - 1)
+        start = other.offset - self.offset
+        self.positive[:, start : start + width] += other.positive
+        self.negative[:, start : start + width] += other.negative
+
+    def quantiles(self, levels: Sequence[float]) -> np.ndarray:
+        """Quantiles shaped ``[len(levels), steps]``."""
+        if self.count == 0:
+            raise ValueError("No values accumulated")
+        gamma = self.gamma
+        keys = np.arange(self.offset, self.offset + self.positive.shape[1])
+        centers = 2.0 * gamma**keys / (gamma + 1.0)
+        bucket_values = np.concatenate([-centers[::-1], [0.0], centers])
+        counts = np.concatenate([self.negative[:, ::-1], self.zero[:, None], self.positive], axis=1)
+        cumulative = np.cumsum(counts, axis=1)
+
+        rows = []
+        for q in levels:
+            if not 0.0 <= q <= 1.0:
+                raise ValueError("quantile levels must be in [0, 1]")
+            rank = q * (cumulative[:, -1] - 1)
+            index = (cumulative <= rank[:, None]).sum(axis=1)
+            rows.append(bucket_values[index])
+        return np.stack(rows)
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from statistics import NormalDist
+
+import numpy as np
+
+from pre.infer.special import normal_cdf, normal_pdf
+
+_BRACKET_STDS = 8.0
+
+
+@dataclass(frozen=True)
+class GaussianMixture:
+    """Per-step Gaussian mixtures with parameters shaped ``[..., K]``.
+
+    ``logmix`` holds normalized log weights. Every method is vectorized over the
+    leading axes, so all steps and series of a batch are handled at once.
+    """
+
+    logmix: np.ndarray
+    mean: np.ndarray
+    logstd: np.ndarray
+
+    @property
+    def weights(self) -> np.ndarray:
+        return np.exp(self.logmix)
+
+    @property
+    def std(self) -> np.ndarray:
+        return np.exp(self.logstd)
+
+    def moments(self) -> tuple[np.ndarray, np.ndarray]:
+        """Exact mixture mean and standard deviation, shaped ``[...]``."""
+        weights = self.weights
+        mean = (weights * self.mean).sum(axis=-1)
+        second = (weights * (self.std**2 + self.mean**2)).sum(axis=-1)
+        return mean, np.sqrt(np.maximum(second - mean**2, 0.0))
+
+    def cdf(self, values: np.ndarray) -> np.ndarray:
+        """Mixture CDF at ``values``, which must broadcast against ``[...]``."""
+        z = (np.asarray(values)[..., None] - self.mean) * np.exp(-self.logstd)
+        return np.asarray((self.weights * normal_cdf(z)).sum(axis=-1))
+
+    def pdf(self, values: np.ndarray) -> np.ndarray:
+        """Mixture density at ``values``, which must broadcast against ``[...]``."""
+        return _mixture_cdf_pdf(values, self.weights, self.mean, np.exp(-self.logstd))[1]
+
+    def quantiles(
+        self,
+        levels: Sequence[float],
+        tol: float = 1e-12,
+        max_iterations: int = 60,
+    ) -> np.ndarray:
+        """Quantiles shaped ``[len(levels), ...]``.
+
+        Single-component mixtures use the closed-form normal quantile. Otherwise all
+        levels and elements are solved together by safeguarded Newton iteration on
+        the mixture CDF: each step keeps a bisection bracket (initially the extreme
+        component means ± 8 std) and bisects instead whenever the Newton step would
+        leave the bracket or fails to halve the previous step. Elements drop out of
+        the working set once their CDF residual is below ``tol``.
+        """
+        level_array = np.asarray(levels, dtype=float)
+        if np.any((level_array <= 0.0) | (level_array >= 1.0)):
+            raise ValueError("quantile levels must be in (0, 1)")
+        shape = (level_array.size,) + (1,) * (self.mean.ndim - 1)
+        normal_z = np.array([NormalDist().inv_cdf(float(q)) for q in level_array]).reshape(shape)
+        if self.mean.shape[-1] == 1:
+            return np.asarray(self.mean[..., 0] + normal_z * self.std[..., 0])
+
+        std = self.std
+        bracket_shape = (level_array.size, *self.mean.shape[:-1])
+        components = self.mean.shape[-1]
+
+        def _flat(values: np.ndarray) -> np.ndarray:
+            return np.broadcast_to(values, bracket_shape).reshape(-1)
+
+        def _flat_components(values: np.ndarray) -> np.ndarray:
+            return np.broadcast_to(values, (*bracket_shape, components)).reshape(-1, components)
+
+        weights = _flat_components(self.weights)
+        means = _flat_components(self.mean)
+        inv_std = _flat_components(np.exp(-self.logstd))
+        target = _flat(level_array.reshape(shape))
+        low = _flat((self.mean - _BRACKET_STDS * std).min(axis=-1)).copy()
+        high = _flat((self.mean + _BRACKET_STDS * std).max(axis=-1)).copy()
+        mixture_mean, mixture_std = self.moments()
+        current = np.clip(_flat(mixture_mean + normal_z * mixture_std), low, high)
+        previous_step = high - low
+        active = np.arange(current.size)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for _ in range(max_iterations):
+                x = current[active]
+                cdf, pdf = _mixture_cdf_pdf(x, weights[active], means[active], inv_std[active])
+                residual = cdf - target[active]
+                unconverged = np.abs(residual) > tol
+                active, x, pdf, residual = (
+                    active[unconverged],
+                    x[unconverged],
+                    pdf[unconverged],
+                    residual[unconverged],
+                )
+                if active.size == 0:
+                    break
+                lo = np.where(residual < 0.0, x, low[active])
+                hi = np.where(residual < 0.0, high[active], x)
+                newton = x - residual / pdf
+                use_newton = (
+                    (newton > lo)
+                    & (newton < hi)
+                    & (np.abs(2.0 * residual) <= np.abs(previous_step[active] * pdf))
+                )
+                updated = np.where(use_newton, newton, 0.5 * (lo + hi))
+                low[active], high[active] = lo, hi
+                previous_step[active] = updated - x
+                current[active] = updated
+        return np.asarray(current.reshape(bracket_shape))
+
+
+def _mixture_cdf_pdf(
+    values: np.ndarray,
+    weights: np.ndarray,
+    mean: np.ndarray,
+    inv_std: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    z = (np.asarray(values)[..., None] - mean) * inv_std
+    cdf = (weights * normal_cdf(z)).sum(axis=-1)
+    pdf = (weights * inv_std * normal_pdf(z)).sum(axis=-1)
+    return np.asarray(cdf), np.asarray(pdf)
@@ -1,30 +1,189 @@
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
+from statistics import NormalDist
 
 import numpy as np
 
+from pre.infer.mixture import GaussianMixture
+from pre.infer.special import normal_cdf
+
+
+def _normal_z(levels: Sequence[float]) -> np.ndarray:
+    return np.array([NormalDist().inv_cdf(float(q)) for q in levels])
+
+
+def _normal_quantiles(params: dict[str, np.ndarray], levels: Sequence[float]) -> np.ndarray:
+    z = _normal_z(levels).reshape((-1,) + (1,) * np.ndim(params["loc"]))
+    return np.asarray(params["loc"] + z * params["scale"])
+
+
+def _mixture_quantiles(params: dict[str, np.ndarray], levels: Sequence[float]) -> np.ndarray:
+    return GaussianMixture(params["logmix"], params["mean"], params["logstd"]).quantiles(levels)
+
+
+def _offset_quantiles(params: dict[str, np.ndarray], levels: Sequence[float]) -> np.ndarray:
+    """Interpolate known quantile offsets linearly in probit space, extrapolating the end slopes."""
+    knots = _normal_z(params["offset_levels"].tolist())
+    offsets = params["offsets"]
+    if knots.size == 1:
+        return np.stack([params["loc"] + offsets[0] for _ in levels])
+
+    stacked = []
+    for z in _normal_z(levels):
+        i = int(np.clip(np.searchsorted(knots, z) - 1, 0, knots.size - 2))
+        weight = (z - knots[i]) / (knots[i + 1] - knots[i])
+        stacked.append(params["loc"] + offsets[i] + weight * (offsets[i + 1] - offsets[i]))
+    return np.stack(stacked)
+
+
+def _sample_quantiles(params: dict[str, np.ndarray], levels: Sequence[float]) -> np.ndarray:
+    return np.asarray(np.quantile(params["samples"], q=list(levels), axis=0))
+
+
+_QUANTILE_FAMILIES: dict[str, Callable[[dict[str, np.ndarray], Sequence[float]], np.ndarray]] = {
+    "normal": _normal_quantiles,
+    "mixture": _mixture_quantiles,
+    "quantile_offsets": _offset_quantiles,
+    "samples": _sample_quantiles,
+}
+
 
 @dataclass(frozen=True)
 class PredictiveDistribution:
-    """Unified probabilistic output contract for all backends."""
+    """Unified probabilistic output contract for all backends.
+
+    Backends either pass materialized ``quantiles`` or describe the distribution
+    by a ``family`` and broadcastable ``params``; parametric quantiles are then
+    computed on demand (vectorized over every requested level) and memoized in
+    ``quantiles``. ``quantile_levels`` is the default grid used by reports.
+    """
 
     horizon: np.ndarray
-    quantiles: dict[float, np.ndarray]
+    quantiles: dict[float, np.ndarray] = field(default_factory=dict)
     mean: np.ndarray | None = None
     std: np.ndarray | None = None
     samples: np.ndarray | None = None
     tail_risk: dict[str, np.ndarray] = field(default_factory=dict)
     regime_score: np.ndarray | None = None
     metadata: dict[str, str | float | int | bool] = field(default_factory=dict)
+    family: str | None = None
+    params: dict[str, np.ndarray] = field(default_factory=dict)
+    quantile_levels: tuple[float, ...] = (0.1, 0.5, 0.9)
+
+    def __post_init__(self) -> None:
+        if self.family is not None and self.family not in _QUANTILE_FAMILIES:
+            supported = ", ".join(sorted(_QUANTILE_FAMILIES))
+            raise ValueError(f"Unsupported family '{self.family}'. Supported families: {supported}")
+
+    @property
+    def mixture(self) -> GaussianMixture | None:
+        if self.family != "mixture":
+            return None
+        return GaussianMixture(self.params["logmix"], self.params["mean"], self.params["logstd"])
+
+    def materialize(self, levels: Sequence[float] | None = None) -> dict[float, np.ndarray]:
+        """Quantiles for ``levels``, defaulting to ``quantile_levels``; computed on demand."""
+        requested = tuple(self.quantile_levels if levels is None else levels)
+        missing = [q for q in dict.fromkeys(requested) if q not in self.quantiles]
+        if missing:
+            if self.family is None:
+                raise KeyError(f"Missing quantile {missing[0]}")
+            values = _QUANTILE_FAMILIES[self.family](self.params, missing)
+            for q, value in zip(missing, values, strict=True):
+                self.quantiles[q] = value
+        return {q: self.quantiles[q] for q in requested}
 
     def quantile(self, level: float) -> np.ndarray:
-        if level not in self.quantiles:
-            raise KeyError(f"Missing quantile {level}")
-        return self.quantiles[level]
+        return self.materialize((level,))[level]
 
     def interval(self, low: float, high: float) -> tuple[np.ndarray, np.ndarray]:
-        return self.quantile(low), self.quantile(high)
+        bounds = self.materialize((low, high))
+        return bounds[low], bounds[high]
+
+    def cdf(self, values: np.ndarray) -> np.ndarray:
+        if self.family == "normal":
+            return normal_cdf((values - self.params["loc"]) / self.params["scale"])
+        mixture = self.mixture
+        if mixture is not None:
+            return mixture.cdf(values)
+        if self.family == "samples":
+            return np.asarray((self.params["samples"] <= values).mean(axis=0))
+        raise ValueError(f"cdf is not available for family '{self.family}'")
+
+    @classmethod
+    def normal(
+        cls,
+        horizon: np.ndarray,
+        loc: np.ndarray,
+        scale: np.ndarray,
+        quantile_levels: tuple[float, ...] = (0.1, 0.5, 0.9),
+        metadata: dict[str, str | float | int | bool] | None = None,
+    ) -> PredictiveDistribution:
+        """Gaussian per step; ``scale`` may be any shape broadcastable to ``loc``."""
+        std = np.broadcast_to(scale, np.shape(loc))
+        return cls(
+            horizon=horizon,
+            mean=loc,
+            std=std,
+            metadata=metadata or {},
+            family="normal",
+            params={"loc": loc, "scale": scale},
+            quantile_levels=quantile_levels,
+        )
+
+    @classmethod
+    def from_quantile_offsets(
+        cls,
+        horizon: np.ndarray,
+        loc: np.ndarray,
+        offset_levels: tuple[float, ...],
+        offsets: np.ndarray,
+        std: np.ndarray,
+        quantile_levels: tuple[float, ...] = (0.1, 0.5, 0.9),
+        metadata: dict[str, str | float | int | bool] | None = None,
+    ) -> PredictiveDistribution:
+        """Location plus per-level offsets (``offsets[i]`` broadcastable to ``loc``).
+
+        Other levels are interpolated linearly in probit space between the known
+        offsets and extrapolated with the outermost slopes.
+        """
+        return cls(
+            horizon=horizon,
+            mean=loc,
+            std=np.broadcast_to(std, np.shape(loc)),
+            metadata=metadata or {},
+            family="quantile_offsets",
+            params={
+                "loc": loc,
+                "offset_levels": np.asarray(offset_levels, dtype=float),
+                "offsets": offsets,
+            },
+            quantile_levels=quantile_levels,
+        )
+
+    @classmethod
+    def from_mixture(
+        cls,
+        horizon: np.ndarray,
+        logmix: np.ndarray,
+        mean: np.ndarray,
+        logstd: np.ndarray,
+        quantile_levels: tuple[float, ...] = (0.1, 0.5, 0.9),
+        metadata: dict[str, str | float | int | bool] | None = None,
+    ) -> PredictiveDistribution:
+        """Build from Gaussian mixture parameters shaped ``[..., horizon, K]`` without sampling."""
+        mixture_mean, mixture_std = GaussianMixture(logmix, mean, logstd).moments()
+        return cls(
+            horizon=horizon,
+            mean=mixture_mean,
+            std=mixture_std,
+            metadata=metadata or {},
+            family="mixture",
+            params={"logmix": logmix, "mean": mean, "logstd": logstd},
+            quantile_levels=quantile_levels,
+        )
 
     @classmethod
     def from_samples(
@@ -33,15 +192,16 @@ class PredictiveDistribution:
         samples: np.ndarray,
         quantile_levels: tuple[float, ...] = (0.1, 0.5, 0.9),
         metadata: dict[str, str | float | int | bool] | None = None,
-    ) -> "PredictiveDistribution":
+    ) -> PredictiveDistribution:
         if samples.ndim != 2:
             raise ValueError("samples must be shaped [num_samples, horizon]")
-        quantiles = {q: np.quantile(samples, q=q, axis=0) for q in quantile_levels}
         return cls(
             horizon=horizon,
-            quantiles=quantiles,
             mean=samples.mean(axis=0),
             std=samples.std(axis=0),
             samples=samples,
             metadata=metadata or {},
+            family="samples",
+            params={"samples": samples},
+            quantile_levels=quantile_levels,
         )
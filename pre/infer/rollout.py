@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import os
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 
 import numpy as np
+from numpy.typing import DTypeLike
+
+from pre.infer.aggregate import ExceedanceCounts, QuantileSketch, StepMoments
+from pre.infer.predict import PredictiveDistribution
+
+BatchTransition = Callable[[np.ndarray, np.random.Generator], np.ndarray]
 
 
 def monte_carlo_rollout(
@@ -19,3 +29,175 @@ def monte_carlo_rollout(
             state = transition_fn(state)
             trajectories[i, t] = state.squeeze()
     return trajectories
+
+
+def _first_component(state: np.ndarray) -> np.ndarray:
+    return state[:, 0]
+
+
+def batched_monte_carlo_rollout(
+    initial_state: np.ndarray,
+    transition_fn: BatchTransition,
+    steps: int,
+    num_samples: int,
+    seed: int | np.random.SeedSequence = 0,
+    dtype: DTypeLike = np.float64,
+    observe: Callable[[np.ndarray], np.ndarray] = _first_component,
+    out: np.ndarray | None = None,
+) -> np.ndarray:
+    """Roll all samples forward together, one vectorized transition call per step.
+
+    ``transition_fn(states, rng)`` receives the whole ``[num_samples, state_dim]``
+    batch and a generator dedicated to that step, spawned from ``seed``, so results
+    depend only on the seed and not on how the caller batches work. ``observe`` maps
+    a state batch to the ``[num_samples]`` values recorded per step (the first state
+    component by default). Values land in ``out`` (or a freshly allocated
+    ``[num_samples, steps]`` buffer of ``dtype``), which is returned.
+    """
+    if steps < 1 or num_samples < 1:
+        raise ValueError("steps and num_samples must be >= 1")
+    if out is None:
+        out = np.empty((num_samples, steps), dtype=dtype)
+    elif out.shape != (num_samples, steps):
+        raise ValueError(f"out must be shaped {(num_samples, steps)}, got {out.shape}")
+
+    state = np.atleast_1d(np.asarray(initial_state, dtype=out.dtype))
+    if state.ndim == 1:
+        state = np.broadcast_to(state, (num_samples, state.size))
+    if state.shape[0] != num_samples:
+        raise ValueError(f"initial_state batch {state.shape[0]} != num_samples {num_samples}")
+    state = state.copy()
+
+    sequence = seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+    for t, child in enumerate(sequence.spawn(steps)):
+        state = transition_fn(state, np.random.default_rng(child))
+        out[:, t] = observe(state)
+    return out
+
+
+@dataclass
+class RolloutSummary:
+    """Mergeable per-step reduction of rollout trajectories, O(steps) in the sample count."""
+
+    moments: StepMoments
+    exceedance: ExceedanceCounts
+    sketch: QuantileSketch
+
+    @classmethod
+    def empty(
+        cls,
+        steps: int,
+        thresholds: tuple[float, ...] = (),
+        relative_accuracy: float = 0.01,
+    ) -> RolloutSummary:
+        return cls(
+            moments=StepMoments(steps),
+            exceedance=ExceedanceCounts(thresholds, steps),
+            sketch=QuantileSketch(steps, relative_accuracy=relative_accuracy),
+        )
+
+    @property
+    def count(self) -> int:
+        return self.moments.count
+
+    def update(self, trajectories: np.ndarray) -> None:
+        self.moments.update(trajectories)
+        self.exceedance.update(trajectories)
+        self.sketch.update(trajectories)
+
+    def merge(self, other: RolloutSummary) -> None:
+        self.moments.merge(other.moments)
+        self.exceedance.merge(other.exceedance)
+        self.sketch.merge(other.sketch)
+
+    def to_distribution(
+        self,
+        quantile_levels: tuple[float, ...] = (0.1, 0.5, 0.9),
+    ) -> PredictiveDistribution:
+        """Materialized distribution with sketch quantiles and exceedance tail risk."""
+        steps = self.moments.steps
+        quantiles = self.sketch.quantiles(quantile_levels)
+        return PredictiveDistribution(
+            horizon=np.arange(steps),
+            quantiles=dict(zip(quantile_levels, quantiles, strict=True)),
+            mean=self.moments.mean,
+            std=self.moments.std,
+            tail_risk={
+                f"exceed_{threshold:g}": probability
+                for threshold, probability in self.exceedance.probabilities().items()
+            },
+            metadata={"num_samples": self.count},
+            quantile_levels=quantile_levels,
+        )
+
+
+def _rollout_shard(
+    initial_state: np.ndarray,
+    transition_fn: BatchTransition,
+    steps: int,
+    thresholds: tuple[float, ...],
+    relative_accuracy: float,
+    dtype: DTypeLike,
+    observe: Callable[[np.ndarray], np.ndarray],
+    shard: tuple[int, np.random.SeedSequence],
+) -> RolloutSummary:
+    num_samples, seed = shard
+    trajectories = batched_monte_carlo_rollout(
+        initial_state, transition_fn, steps, num_samples, seed=seed, dtype=dtype, observe=observe
+    )
+    summary = RolloutSummary.empty(steps, thresholds, relative_accuracy)
+    summary.update(trajectories)
+    return summary
+
+
+def sharded_monte_carlo_rollout(
+    initial_state: np.ndarray,
+    transition_fn: BatchTransition,
+    steps: int,
+    num_samples: int,
+    seed: int = 0,
+    shard_size: int = 16_384,
+    max_workers: int | None = None,
+    thresholds: tuple[float, ...] = (),
+    relative_accuracy: float = 0.01,
+    dtype: DTypeLike = np.float64,
+    observe: Callable[[np.ndarray], np.ndarray] = _first_component,
+) -> RolloutSummary:
+    """Run ``num_samples`` trajectories in fixed-size shards and merge their summaries.
+
+    Shard ``i`` always draws from the ``i``-th stream spawned from ``seed`` and
+    summaries are merged in shard order, so the result is identical for any
+    ``max_workers``. Only one ``[shard_size, steps]`` block per worker is ever
+    alive. With more than one worker, ``transition_fn`` and ``observe`` must be
+    picklable.
+    """
+    if shard_size < 1:
+        raise ValueError("shard_size must be >= 1")
+    if num_samples < 1:
+        raise ValueError("num_samples must be >= 1")
+
+    shard_count = -(-num_samples // shard_size)
+    sizes = [min(shard_size, num_samples - i * shard_size) for i in range(shard_count)]
+    shards = list(zip(sizes, np.random.SeedSequence(seed).spawn(shard_count), strict=True))
+    run_shard = partial(
+        _rollout_shard,
+        initial_state,
+        transition_fn,
+        steps,
+        thresholds,
+        relative_accuracy,
+        dtype,
+        observe,
+    )
+
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    workers = max(1, min(workers, shard_count))
+    summary = RolloutSummary.empty(steps, thresholds, relative_accuracy)
+    if workers == 1:
+        for shard in shards:
+            summary.merge(run_shard(shard))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for partial_summary in pool.map(run_shard, shards):
+                summary.merge(partial_summary)
+    return summary
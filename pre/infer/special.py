@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+_ERF_SEGMENT = 0.25
+_ERF_LIMIT = 6.0
+_ERF_DEGREE = 12
+_ERF_BLOCK = 32768
+_SQRT_2 = math.sqrt(2.0)
+_SQRT_2PI = math.sqrt(2.0 * math.pi)
+
+
+def _build_erf_table() -> np.ndarray:
+    """Per-segment polynomial coefficients (highest degree first) interpolating ``math.erf``.
+
+    ``[0, _ERF_LIMIT)`` is split into segments of width ``_ERF_SEGMENT``; each gets a
+    degree-``_ERF_DEGREE`` Chebyshev interpolant in the local variable ``t ∈ [-1, 1]``,
+    which is accurate to double precision on that segment.
+    """
+    segments = int(round(_ERF_LIMIT / _ERF_SEGMENT))
+    nodes = np.cos(np.pi * (np.arange(_ERF_DEGREE + 1) + 0.5) / (_ERF_DEGREE + 1))
+    table = np.empty((_ERF_DEGREE + 1, segments))
+    for segment in range(segments):
+        points = segment * _ERF_SEGMENT + 0.5 * _ERF_SEGMENT * (nodes + 1.0)
+        values = [math.erf(float(point)) for point in points]
+        cheb = np.polynomial.chebyshev.chebfit(nodes, values, _ERF_DEGREE)
+        table[:, segment] = np.polynomial.chebyshev.cheb2poly(cheb)[::-1]
+    return table
+
+
+_ERF_TABLE = _build_erf_table()
+
+
+def erf(x: np.ndarray) -> np.ndarray:
+    """Vectorized error function, matching ``math.erf`` to ~1e-15 absolute error.
+
+    Evaluated in cache-sized blocks with in-place Horner steps so temporaries stay
+    small regardless of the input size.
+    """
+    values = np.asarray(x, dtype=float)
+    flat = values.reshape(-1)
+    out = np.empty_like(flat)
+    last_segment = _ERF_TABLE.shape[1] - 1
+
+    with np.errstate(invalid="ignore"):
+        for start in range(0, flat.size, _ERF_BLOCK):
+            chunk = flat[start : start + _ERF_BLOCK]
+            magnitude = np.abs(chunk)
+            segment = np.fmin(magnitude * (1.0 / _ERF_SEGMENT), last_segment).astype(np.intp)
+            local = magnitude - segment * _ERF_SEGMENT
+            local *= 2.0 / _ERF_SEGMENT
+            local -= 1.0
+
+            result = np.take(_ERF_TABLE[0], segment)
+            for coefficients in _ERF_TABLE[1:]:
+                result *= local
+                result += np.take(coefficients, segment)
+            result[magnitude >= _ERF_LIMIT] = 1.0
+            np.copysign(result, chunk, out=out[start : start + _ERF_BLOCK])
+    return out.reshape(values.shape)
+
+
+def normal_pdf(z: np.ndarray) -> np.ndarray:
+    return np.asarray(np.exp(-0.5 * np.square(z)) / _SQRT_2PI)
+
+
+def normal_cdf(z: np.ndarray) -> np.ndarray:
+    return 0.5 * (1.0 + erf(np.asarray(z) / _SQRT_2))
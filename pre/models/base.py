@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Protocol, runtime_checkable
 
 import numpy as np
 
@@ -17,3 +17,11 @@ class ForecastModel(Protocol):
 
     def predict(self, x: np.ndarray, horizon: int) -> PredictiveDistribution:
         """Predict distribution for each step in the forecast horizon."""
+
+
+@runtime_checkable
+class IncrementalForecastModel(ForecastModel, Protocol):
+    """Model that can absorb additional training windows without a full refit."""
+
+    def partial_fit(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Update the fit with new windows appended to those already seen."""
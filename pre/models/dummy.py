@@ -24,23 +24,24 @@ class DummyModel:
         if x.ndim == 1:
             x = x[None, :]
 
+        shape = (x.shape[0], horizon)
         if self.center_ is None or self.spread_ is None or self.horizon is None:
-            last_values = x[:, -1]
-            center = np.full((x.shape[0], horizon), float(np.mean(last_values)))
-            spread = np.full((x.shape[0], horizon), 1.0)
+            center = np.broadcast_to(float(np.mean(x[:, -1])), shape)
+            spread = np.ones(horizon)
         else:
             if horizon != self.horizon:
                 raise ValueError(
                     f"Requested horizon {horizon} does not match fitted horizon {self.horizon}"
                 )
-            center = np.repeat(self.center_[None, :], x.shape[0], axis=0)
-            spread = np.repeat(self.spread_[None, :], x.shape[0], axis=0)
+            center = np.broadcast_to(self.center_, shape)
+            spread = self.spread_
 
-        return PredictiveDistribution(
+        return PredictiveDistribution.from_quantile_offsets(
             horizon=np.arange(horizon),
-            mean=center,
+            loc=center,
+            offset_levels=(0.1, 0.5, 0.9),
+            offsets=np.stack([-spread, np.zeros_like(spread), spread]),
             std=spread,
-            quantiles={0.1: center - spread, 0.5: center, 0.9: center + spread},
             metadata={"model": self.name},
         )
 
@@ -52,3 +53,11 @@ class DummyModel:
             "spread": self.spread_,
             "horizon": np.array([self.horizon]),
         }
+
+    @classmethod
+    def from_artifact_state(cls, state: dict[str, np.ndarray]) -> DummyModel:
+        model = cls()
+        model.center_ = state["center"]
+        model.spread_ = state["spread"]
+        model.horizon = int(state["horizon"][0])
+        return model
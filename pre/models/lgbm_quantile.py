@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 import numpy as np
 
 from pre.infer.predict import PredictiveDistribution
+from pre.models.linear import NormalEquations
 
 
 class LGBMQuantileModel:
@@ -16,6 +19,8 @@ class LGBMQuantileModel:
         self.bias_: np.ndarray | None = None
         self.residual_q10_: np.ndarray | None = None
         self.residual_q90_: np.ndarray | None = None
+        self.normal_equations_: NormalEquations | None = None
+        self.ridge_ = 0.0
 
     def fit(self, x: np.ndarray, y: np.ndarray) -> None:
         if x.ndim != 2 or y.ndim != 2:
@@ -31,6 +36,48 @@ class LGBMQuantileModel:
         self.bias_ = coef[-1, :]
         self.residual_q10_ = np.quantile(residual, 0.1, axis=0)
         self.residual_q90_ = np.quantile(residual, 0.9, axis=0)
+        self.normal_equations_ = None
+        self.ridge_ = 0.0
+
+    def partial_fit(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Absorb new windows into the accumulated normal equations and re-solve.
+
+        Residual quantiles cannot be updated from sufficient statistics, so they
+        are taken from the residual mean/variance under a Gaussian assumption.
+        """
+        if self.normal_equations_ is None:
+            self.normal_equations_ = NormalEquations()
+        self.normal_equations_.update(x, y)
+        self._solve(self.normal_equations_, self.ridge_)
+
+    def fit_chunks(
+        self,
+        chunks: Iterable[tuple[np.ndarray, np.ndarray]],
+        ridge: float = 0.0,
+    ) -> None:
+        """Fit from an iterator of ``(x, y)`` window chunks, as ``partial_fit`` would.
+
+        ``ridge`` is kept for later ``partial_fit`` calls.
+        """
+        equations = NormalEquations()
+        for x, y in chunks:
+            equations.update(x, y)
+        if equations.count == 0:
+            raise ValueError("chunks must contain at least one window")
+        self._solve(equations, ridge)
+        self.normal_equations_ = equations
+
+    def _solve(self, equations: NormalEquations, ridge: float) -> None:
+        coef = equations.solve(ridge=ridge)
+        mean, var = equations.residual_moments(coef)
+        spread = 1.28155 * np.sqrt(var)
+
+        self.horizon = coef.shape[1]
+        self.coefficients_ = coef[:-1, :]
+        self.bias_ = coef[-1, :]
+        self.residual_q10_ = mean - spread
+        self.residual_q90_ = mean + spread
+        self.ridge_ = ridge
 
     def predict(self, x: np.ndarray, horizon: int) -> PredictiveDistribution:
         if x.ndim == 1:
@@ -48,16 +95,17 @@ class LGBMQuantileModel:
                 f"Requested horizon {horizon} does not match fitted horizon {self.horizon}"
             )
 
-        median = x @ self.coefficients_ + self.bias_
-        q10 = median + self.residual_q10_[None, :]
-        q90 = median + self.residual_q90_[None, :]
-        std = np.maximum((q90 - q10) / (2.0 * 1.28155), 1e-6)
+        offsets = np.stack(
+            [self.residual_q10_, np.zeros_like(self.residual_q10_), self.residual_q90_]
+        )
+        std = np.maximum((self.residual_q90_ - self.residual_q10_) / (2.0 * 1.28155), 1e-6)
 
-        return PredictiveDistribution(
+        return PredictiveDistribution.from_quantile_offsets(
             horizon=np.arange(horizon),
-            mean=median,
+            loc=x @ self.coefficients_ + self.bias_,
+            offset_levels=(0.1, 0.5, 0.9),
+            offsets=offsets,
             std=std,
-            quantiles={0.1: q10, 0.5: median, 0.9: q90},
             metadata={"model": self.name},
         )
 
@@ -77,3 +125,13 @@ class LGBMQuantileModel:
             "residual_q90": self.residual_q90_,
             "horizon": np.array([self.horizon]),
         }
+
+    @classmethod
+    def from_artifact_state(cls, state: dict[str, np.ndarray]) -> LGBMQuantileModel:
+        model = cls()
+        model.coefficients_ = state["coefficients"]
+        model.bias_ = state["bias"]
+        model.residual_q10_ = state["residual_q10"]
+        model.residual_q90_ = state["residual_q90"]
+        model.horizon = int(state["horizon"][0])
+        return model
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class NormalEquations:
+    """Sufficient statistics of a multi-output least-squares fit with an intercept.
+
+    Holds ``[X 1]ᵀ[X 1]`` and ``[X 1]ᵀy`` plus target moments, so a model can absorb
+    new windows in O(m·d²) and re-solve in O(d³) without revisiting earlier rows.
+    Targets are accumulated relative to a fixed ``shift`` (the mean of the first
+    update) to limit cancellation in the residual variance.
+    """
+
+    gram: np.ndarray | None = None
+    cross: np.ndarray | None = None
+    target_sq: np.ndarray | None = None
+    shift: np.ndarray | None = None
+    count: int = 0
+
+    def update(self, x: np.ndarray, y: np.ndarray) -> None:
+        if x.ndim != 2 or y.ndim != 2:
+            raise ValueError("x and y must be 2D")
+        if x.shape[0] != y.shape[0]:
+            raise ValueError(f"batch count mismatch: {x.shape} vs {y.shape}")
+        if x.shape[0] == 0:
+            return
+        if self.shift is None:
+            self.shift = y.mean(axis=0)
+        if self.cross is not None and (self.cross.shape != (x.shape[1] + 1, y.shape[1])):
+            raise ValueError("update shapes do not match accumulated statistics")
+
+        d = x.shape[1]
+        centered = y - self.shift
+        gram = np.empty((d + 1, d + 1))
+        gram[:d, :d] = x.T @ x
+        gram[:d, d] = gram[d, :d] = x.sum(axis=0)
+        gram[d, d] = x.shape[0]
+        cross = np.empty((d + 1, y.shape[1]))
+        cross[:d] = x.T @ centered
+        cross[d] = centered.sum(axis=0)
+        target_sq = np.einsum("ij,ij->j", centered, centered)
+
+        if self.gram is None or self.cross is None or self.target_sq is None:
+            self.gram, self.cross, self.target_sq = gram, cross, target_sq
+        else:
+            self.gram += gram
+            self.cross += cross
+            self.target_sq += target_sq
+        self.count += x.shape[0]
+
+    def solve(self, ridge: float = 0.0) -> np.ndarray:
+        """Coefficients shaped ``[d + 1, horizon]`` (last row is the bias).
+
+        Solves the (optionally ridge-penalized, intercept excluded) normal equations
+        by Cholesky factorization, falling back to a minimum-norm least-squares
+        solve when the system is not positive definite.
+        """
+        if self.gram is None or self.cross is None or self.shift is None:
+            raise ValueError("No observations accumulated")
+        if ridge < 0.0:
+            raise ValueError("ridge must be non-negative")
+
+        system = self.gram.copy()
+        diagonal = np.arange(system.shape[0] - 1)
+        system[diagonal, diagonal] += ridge
+        try:
+            lower = np.linalg.cholesky(system)
+            coef = np.linalg.solve(lower.T, np.linalg.solve(lower, self.cross))
+        except np.linalg.LinAlgError:
+            coef, *_ = np.linalg.lstsq(system, self.cross, rcond=None)
+        coef[-1] += self.shift
+        return np.asarray(coef)
+
+    def residual_moments(self, coef: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Per-output residual mean and population variance for ``coef`` from ``solve``."""
+        if self.gram is None or self.cross is None or self.target_sq is None or self.shift is None:
+            raise ValueError("No observations accumulated")
+        centered_coef = coef.copy()
+        centered_coef[-1] -= self.shift
+        fitted_cross = np.einsum("ij,ij->j", centered_coef, self.cross)
+        fitted_sq = np.einsum("ij,ij->j", centered_coef, self.gram @ centered_coef)
+        residual_sum = self.cross[-1] - centered_coef.T @ self.gram[-1]
+        residual_sq = self.target_sq - 2.0 * fitted_cross + fitted_sq
+
+        mean = residual_sum / self.count
+        var = np.maximum(residual_sq / self.count - mean**2, 0.0)
+        return mean, var
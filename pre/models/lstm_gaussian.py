@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 import numpy as np
 
 from pre.infer.predict import PredictiveDistribution
+from pre.models.linear import NormalEquations
 
 
 class LSTMGaussianModel:
@@ -15,6 +18,8 @@ class LSTMGaussianModel:
         self.coefficients_: np.ndarray | None = None
         self.bias_: np.ndarray | None = None
         self.residual_std_: np.ndarray | None = None
+        self.normal_equations_: NormalEquations | None = None
+        self.ridge_ = 0.0
 
     def fit(self, x: np.ndarray, y: np.ndarray) -> None:
         if x.ndim != 2 or y.ndim != 2:
@@ -30,6 +35,49 @@ class LSTMGaussianModel:
         self.bias_ = coef[-1, :]
         std = residual.std(axis=0)
         self.residual_std_ = np.where(std < 1e-6, 1.0, std)
+        self.normal_equations_ = None
+        self.ridge_ = 0.0
+
+    def partial_fit(self, x: np.ndarray, y: np.ndarray) -> None:
+        """Absorb new windows into the accumulated normal equations and re-solve.
+
+        Equivalent to ``fit`` on every window passed to ``partial_fit`` so far, at a
+        cost proportional to the new windows only.
+        """
+        if self.normal_equations_ is None:
+            self.normal_equations_ = NormalEquations()
+        self.normal_equations_.update(x, y)
+        self._solve(self.normal_equations_, self.ridge_)
+
+    def fit_chunks(
+        self,
+        chunks: Iterable[tuple[np.ndarray, np.ndarray]],
+        ridge: float = 0.0,
+    ) -> None:
+        """Fit from an iterator of ``(x, y)`` window chunks.
+
+        Only the normal equations are kept between chunks, so peak memory depends on
+        the chunk size and feature width, not on the total number of windows.
+        ``ridge`` is kept for later ``partial_fit`` calls.
+        """
+        equations = NormalEquations()
+        for x, y in chunks:
+            equations.update(x, y)
+        if equations.count == 0:
+            raise ValueError("chunks must contain at least one window")
+        self._solve(equations, ridge)
+        self.normal_equations_ = equations
+
+    def _solve(self, equations: NormalEquations, ridge: float) -> None:
+        coef = equations.solve(ridge=ridge)
+        _, var = equations.residual_moments(coef)
+
+        self.horizon = coef.shape[1]
+        self.coefficients_ = coef[:-1, :]
+        self.bias_ = coef[-1, :]
+        std = np.sqrt(var)
+        self.residual_std_ = np.where(std < 1e-6, 1.0, std)
+        self.ridge_ = ridge
 
     def predict(self, x: np.ndarray, horizon: int) -> PredictiveDistribution:
         if x.ndim == 1:
@@ -46,19 +94,10 @@ class LSTMGaussianModel:
                 f"Requested horizon {horizon} does not match fitted horizon {self.horizon}"
             )
 
-        mean = x @ self.coefficients_ + self.bias_
-        std = np.repeat(self.residual_std_[None, :], x.shape[0], axis=0)
-        z = 1.28155
-
-        return PredictiveDistribution(
+        return PredictiveDistribution.normal(
             horizon=np.arange(horizon),
-            mean=mean,
-            std=std,
-            quantiles={
-                0.1: mean - z * std,
-                0.5: mean,
-                0.9: mean + z * std,
-            },
+            loc=x @ self.coefficients_ + self.bias_,
+            scale=self.residual_std_,
             metadata={"model": self.name},
         )
 
@@ -76,3 +115,12 @@ class LSTMGaussianModel:
             "residual_std": self.residual_std_,
             "horizon": np.array([self.horizon]),
         }
+
+    @classmethod
+    def from_artifact_state(cls, state: dict[str, np.ndarray]) -> LSTMGaussianModel:
+        model = cls()
+        model.coefficients_ = state["coefficients"]
+        model.bias_ = state["bias"]
+        model.residual_std_ = state["residual_std"]
+        model.horizon = int(state["horizon"][0])
+        return model
@@ -1,4 +1,231 @@
 from __future__ import annotations
 
-# Optional backend placeholder. Full implementation intentionally deferred
-# until contract-first pipeline is stable.
+import math
+
+import numpy as np
+
+from pre.config.schema import TrainConfig
+from pre.infer.predict import PredictiveDistribution
+
+_LOG_SQRT_2PI = 0.5 * math.log(2.0 * math.pi)
+_LOGSTD_BOUNDS = (-7.0, 7.0)
+_PARAM_NAMES = ("w_in", "w_rec", "b_rec", "w_out", "b_out")
+
+
+def _logsumexp(values: np.ndarray, axis: int) -> np.ndarray:
+    peak = values.max(axis=axis, keepdims=True)
+    return np.asarray(peak + np.log(np.exp(values - peak).sum(axis=axis, keepdims=True)))
+
+
+class MDNRNNModel:
+    """Mixture-density recurrent forecaster implemented in NumPy.
+
+    A tanh recurrent layer reads the context window and its final hidden state
+    parameterizes a ``num_mixtures``-component Gaussian mixture for every horizon
+    step. Training runs minibatch BPTT with Adam on standardized targets, so
+    memory scales with ``batch_size`` rather than the number of windows.
+    """
+
+    name = "mdn_rnn"
+
+    def __init__(
+        self,
+        hidden_size: int = 32,
+        num_mixtures: int = 3,
+        train_config: TrainConfig | None = None,
+        grad_clip: float = 5.0,
+    ) -> None:
+        config = train_config or TrainConfig()
+        self.hidden_size = hidden_size
+        self.num_mixtures = num_mixtures
+        self.epochs = config.epochs
+        self.batch_size = config.batch_size
+        self.learning_rate = config.learning_rate
+        self.seed = config.seed
+        self.grad_clip = grad_clip
+        self.horizon: int | None = None
+        self.params_: dict[str, np.ndarray] | None = None
+        self.target_mean_: np.ndarray | None = None
+        self.target_std_: np.ndarray | None = None
+        self.loss_history_: list[float] = []
+
+    def _init_params(self, horizon: int, rng: np.random.Generator) -> dict[str, np.ndarray]:
+        hidden = self.hidden_size
+        out_width = 3 * horizon * self.num_mixtures
+        b_out = np.zeros(out_width)
+        means = b_out[horizon * self.num_mixtures : 2 * horizon * self.num_mixtures]
+        means[:] = np.tile(np.linspace(-1.0, 1.0, self.num_mixtures), horizon)
+        return {
+            "w_in": rng.normal(0.0, 1.0, size=(1, hidden)),
+            "w_rec": rng.normal(0.0, 1.0 / math.sqrt(hidden), size=(hidden, hidden)),
+            "b_rec": np.zeros(hidden),
+            "w_out": rng.normal(0.0, 0.1 / math.sqrt(hidden), size=(hidden, out_width)),
+            "b_out": b_out,
+        }
+
+    def _forward(
+        self,
+        params: dict[str, np.ndarray],
+        x: np.ndarray,
+        keep_states: bool,
+    ) -> tuple[np.ndarray, np.ndarray | None]:
+        """Run the recurrence over ``x`` [batch, time]; returns the head output and states."""
+        batch, steps = x.shape
+        projected = x[:, :, None] * params["w_in"][0] + params["b_rec"]
+        states = np.empty((batch, steps, self.hidden_size)) if keep_states else None
+        hidden = np.zeros((batch, self.hidden_size))
+        for t in range(steps):
+            hidden = np.tanh(projected[:, t] + hidden @ params["w_rec"])
+            if states is not None:
+                states[:, t] = hidden
+        return hidden @ params["w_out"] + params["b_out"], states
+
+    def _split(self, output: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self.horizon is None:
+            raise ValueError("Model is not fitted")
+        raw = output.reshape(output.shape[0], 3, self.horizon, self.num_mixtures)
+        logmix = raw[:, 0] - _logsumexp(raw[:, 0], axis=-1)
+        logstd = np.clip(raw[:, 2], *_LOGSTD_BOUNDS)
+        return logmix, raw[:, 1], logstd
+
+    def _loss_and_grads(
+        self,
+        params: dict[str, np.ndarray],
+        x: np.ndarray,
+        z: np.ndarray,
+    ) -> tuple[float, dict[str, np.ndarray]]:
+        output, states = self._forward(params, x, keep_states=True)
+        assert states is not None
+        logmix, mean, logstd = self._split(output)
+
+        inv_std = np.exp(-logstd)
+        scaled = (z[..., None] - mean) * inv_std
+        joint = logmix - 0.5 * scaled**2 - logstd - _LOG_SQRT_2PI
+        log_lik = _logsumexp(joint, axis=-1)
+        count = z.size
+        loss = float(-log_lik.sum() / count)
+
+        resp = np.exp(joint - log_lik)
+        d_logmix = -(resp - np.exp(logmix)) / count
+        d_mean = -resp * scaled * inv_std / count
+        d_logstd = -resp * (scaled**2 - 1.0) / count
+        inside = (logstd > _LOGSTD_BOUNDS[0]) & (logstd < _LOGSTD_BOUNDS[1])
+        d_logstd = np.where(inside, d_logstd, 0.0)
+        d_output = np.stack([d_logmix, d_mean, d_logstd], axis=1).reshape(output.shape)
+
+        last = states[:, -1]
+        grads = {
+            "w_out": last.T @ d_output,
+            "b_out": d_output.sum(axis=0),
+            "w_in": np.zeros_like(params["w_in"]),
+            "w_rec": np.zeros_like(params["w_rec"]),
+            "b_rec": np.zeros_like(params["b_rec"]),
+        }
+        d_hidden = d_output @ params["w_out"].T
+        for t in range(x.shape[1] - 1, -1, -1):
+            d_pre = d_hidden * (1.0 - states[:, t] ** 2)
+            previous = states[:, t - 1] if t > 0 else np.zeros_like(last)
+            grads["w_in"][0] += x[:, t] @ d_pre
+            grads["w_rec"] += previous.T @ d_pre
+            grads["b_rec"] += d_pre.sum(axis=0)
+            d_hidden = d_pre @ params["w_rec"].T
+        return loss, grads
+
+    def fit(self, x: np.ndarray, y: np.ndarray) -> None:
+        if x.ndim != 2 or y.ndim != 2:
+            raise ValueError("x and y must be 2D")
+        if x.shape[0] != y.shape[0]:
+            raise ValueError(f"batch count mismatch: {x.shape} vs {y.shape}")
+
+        rng = np.random.default_rng(self.seed)
+        self.horizon = y.shape[1]
+        self.target_mean_ = y.mean(axis=0)
+        std = y.std(axis=0)
+        self.target_std_ = np.where(std < 1e-6, 1.0, std)
+        params = self._init_params(self.horizon, rng)
+
+        first_moment = {key: np.zeros_like(value) for key, value in params.items()}
+        second_moment = {key: np.zeros_like(value) for key, value in params.items()}
+        beta1, beta2, eps = 0.9, 0.999, 1e-8
+        step = 0
+        self.loss_history_ = []
+        for _ in range(self.epochs):
+            order = rng.permutation(x.shape[0])
+            epoch_loss = 0.0
+            for start in range(0, x.shape[0], self.batch_size):
+                idx = order[start : start + self.batch_size]
+                z = (y[idx] - self.target_mean_) / self.target_std_
+                loss, grads = self._loss_and_grads(params, x[idx], z)
+                epoch_loss += loss * idx.size
+
+                norm = math.sqrt(sum(float(np.sum(g**2)) for g in grads.values()))
+                scale = min(1.0, self.grad_clip / (norm + 1e-12))
+                step += 1
+                lr = self.learning_rate * math.sqrt(1.0 - beta2**step) / (1.0 - beta1**step)
+                for key in params:
+                    grad = grads[key] * scale
+                    first_moment[key] = beta1 * first_moment[key] + (1.0 - beta1) * grad
+                    second_moment[key] = beta2 * second_moment[key] + (1.0 - beta2) * grad**2
+                    params[key] -= lr * first_moment[key] / (np.sqrt(second_moment[key]) + eps)
+            self.loss_history_.append(epoch_loss / x.shape[0])
+        self.params_ = params
+
+    def predict_mixture(self, x: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Mixture ``(logmix, mean, logstd)`` in target units, each shaped [batch, horizon, K]."""
+        if x.ndim == 1:
+            x = x[None, :]
+        if self.params_ is None or self.target_mean_ is None or self.target_std_ is None:
+            raise ValueError("Model is not fitted")
+
+        parts = []
+        for start in range(0, x.shape[0], self.batch_size):
+            output, _ = self._forward(self.params_, x[start : start + self.batch_size], False)
+            parts.append(self._split(output))
+        logmix = np.concatenate([part[0] for part in parts])
+        mean = np.concatenate([part[1] for part in parts])
+        logstd = np.concatenate([part[2] for part in parts])
+        mean = mean * self.target_std_[:, None] + self.target_mean_[:, None]
+        logstd = logstd + np.log(self.target_std_)[:, None]
+        return logmix, mean, logstd
+
+    def predict(self, x: np.ndarray, horizon: int) -> PredictiveDistribution:
+        if horizon != self.horizon:
+            raise ValueError(
+                f"Requested horizon {horizon} does not match fitted horizon {self.horizon}"
+            )
+        logmix, mean, logstd = self.predict_mixture(x)
+        return PredictiveDistribution.from_mixture(
+            horizon=np.arange(horizon),
+            logmix=logmix,
+            mean=mean,
+            logstd=logstd,
+            metadata={"model": self.name, "num_mixtures": self.num_mixtures},
+        )
+
+    def artifact_state(self) -> dict[str, np.ndarray]:
+        if (
+            self.params_ is None
+            or self.target_mean_ is None
+            or self.target_std_ is None
+            or self.horizon is None
+        ):
+            raise ValueError("Model must be fit before serialization")
+        return {
+            **{key: self.params_[key] for key in _PARAM_NAMES},
+            "target_mean": self.target_mean_,
+            "target_std": self.target_std_,
+            "horizon": np.array([self.horizon]),
+            "num_mixtures": np.array([self.num_mixtures]),
+        }
+
+    @classmethod
+    def from_artifact_state(cls, state: dict[str, np.ndarray]) -> MDNRNNModel:
+        model = cls(
+            hidden_size=int(state["w_rec"].shape[0]),
+            num_mixtures=int(state["num_mixtures"][0]),
+        )
+        model.params_ = {key: state[key] for key in _PARAM_NAMES}
+        model.target_mean_ = state["target_mean"]
+        model.target_std_ = state["target_std"]
+        model.horizon = int(state["horizon"][0])
+        return model
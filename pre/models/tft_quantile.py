@@ -14,10 +14,11 @@ class TFTQuantileModel:
     def predict(self, x: np.ndarray, horizon: int) -> PredictiveDistribution:
         center = np.full(horizon, float(np.mean(x[:, -1])))
         spread = np.linspace(0.8, 1.2, horizon)
-        return PredictiveDistribution(
+        return PredictiveDistribution.from_quantile_offsets(
             horizon=np.arange(horizon),
-            mean=center,
+            loc=center,
+            offset_levels=(0.1, 0.5, 0.9),
+            offsets=np.stack([-spread, np.zeros_like(spread), spread]),
             std=spread,
-            quantiles={0.1: center - spread, 0.5: center, 0.9: center + spread},
             metadata={"model": self.name},
         )
@@ -0,0 +1 @@
+"""Metrics and timing instrumentation."""
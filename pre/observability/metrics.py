@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, TypeVar
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+STAGE_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+
+_RETIRED = "retired.json"
+_COLLECT_ATTEMPTS = 5
+
+M = TypeVar("M", bound="_Metric")
+Sample = tuple[str, tuple[tuple[str, str], ...], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        self.registry = registry
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, str]) -> tuple[str, ...]:
+        if labels.keys() != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+        return tuple(zip(self.labelnames, key, strict=True))
+
+    def samples(self) -> Iterator[Sample]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield "", self._labels(key), float(value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def snapshot(self) -> list[list[Any]]:
+        with self._lock:
+            return [[list(key), value] for key, value in sorted(self._values.items())]
+
+    def absorb(self, values: list[list[Any]]) -> None:
+        with self._lock:
+            for key, value in values:
+                self._values[tuple(key)] = self._values.get(tuple(key), 0.0) + value
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        if not self.registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return float(self._values.get(self._key(labels), 0.0))
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        if not self.registry.enabled:
+            return
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(registry, name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels: str) -> None:
+        if not self.registry.enabled:
+            return
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def count(self, **labels: str) -> int:
+        state = self._values.get(self._key(labels))
+        return 0 if state is None else int(sum(state[0]))
+
+    def samples(self) -> Iterator[Sample]:
+        with self._lock:
+            items = sorted((key, (list(state[0]), state[1])) for key, state in self._values.items())
+        for key, (counts, total) in items:
+            labels = self._labels(key)
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                yield "_bucket", (*labels, ("le", _format_value(bound))), float(cumulative)
+            yield "_sum", labels, total
+            yield "_count", labels, float(cumulative)
+
+    def snapshot(self) -> list[list[Any]]:
+        with self._lock:
+            items = sorted(self._values.items())
+            return [[list(key), [list(state[0]), state[1]]] for key, state in items]
+
+    def absorb(self, values: list[list[Any]]) -> None:
+        with self._lock:
+            for key, (counts, total) in values:
+                if len(counts) != len(self.buckets) + 1:
+                    raise ValueError(f"{self.name} buckets do not match the absorbed snapshot")
+                state = self._values.setdefault(tuple(key), [[0] * (len(self.buckets) + 1), 0.0])
+                state[0] = [mine + theirs for mine, theirs in zip(state[0], counts, strict=True)]
+                state[1] += total
+
+
+class MetricsRegistry:
+    """Named counters, gauges and histograms rendered in Prometheus text format.
+
+    When ``enabled`` is false every update returns after a single attribute check,
+    so instrumented code paths cost next to nothing. Metrics are per process unless
+    :meth:`share` publishes them to a directory that all processes render from.
+    """
+
+    def __init__(self, enabled: bool = True) -> None:
+        self.enabled = enabled
+        self.directory: Path | None = None
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._name = ""
+
+    def _get(self, kind: type[M], name: str, factory: Callable[[], M]) -> M:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = factory()
+        if type(metric) is not kind:
+            raise ValueError(f"metric '{name}' is already registered as a {metric.kind}")
+        return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get(Counter, name, lambda: Counter(self, name, help, labelnames))
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get(Gauge, name, lambda: Gauge(self, name, help, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._get(Histogram, name, lambda: Histogram(self, name, help, labelnames, buckets))
+
+    def share(self, directory: Path, interval: float | None = None) -> None:
+        """Publish this process's metrics under ``directory`` and render every process's.
+
+        Values inherited from a forking parent are cleared first. With ``interval``, a
+        daemon thread republishes every ``interval`` seconds; :meth:`render` publishes
+        before collecting, so the process answering a scrape is never stale.
+        """
+        self.reset()
+        self.directory = directory
+        self._name = f"{os.getpid()}-{time.monotonic_ns()}.json"
+        if interval is not None:
+            threading.Thread(target=self._publish_every, args=(interval,), daemon=True).start()
+
+    def _publish_every(self, interval: float) -> None:
+        while True:
+            time.sleep(interval)
+            self.publish()
+
+    def publish(self) -> None:
+        if self.directory is not None:
+            _write_json(self.directory / self._name, self.snapshot())
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {
+            metric.name: {
+                "kind": metric.kind,
+                "help": metric.help,
+                "labelnames": list(metric.labelnames),
+                "buckets": list(getattr(metric, "buckets", ())),
+                "values": metric.snapshot(),
+            }
+            for metric in metrics
+        }
+
+    def absorb(self, snapshot: dict[str, Any], gauges: bool = True) -> None:
+        """Add another registry's :meth:`snapshot` into this one's values."""
+        for name, state in snapshot.items():
+            if state["kind"] == "gauge" and not gauges:
+                continue
+            metric: _Metric
+            if state["kind"] == "histogram":
+                metric = self.histogram(name, state["help"], state["labelnames"], state["buckets"])
+            elif state["kind"] == "gauge":
+                metric = self.gauge(name, state["help"], state["labelnames"])
+            else:
+                metric = self.counter(name, state["help"], state["labelnames"])
+            metric.absorb(state["values"])
+
+    def render(self) -> str:
+        if self.directory is not None:
+            self.publish()
+            return collect(self.directory).render()
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for suffix, labels, value in metric.samples():
+                series = f"{metric.name}{suffix}{_format_labels(labels)}"
+                lines.append(f"{series} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+def _write_json(path: Path, payload: Any) -> None:
+    partial = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    partial.write_text(json.dumps(payload))
+    os.replace(partial, path)
+
+
+def _read_retired(directory: Path) -> dict[str, Any]:
+    try:
+        retired: dict[str, Any] = json.loads((directory / _RETIRED).read_text())
+    except FileNotFoundError:
+        return {"absorbed": [], "metrics": {}}
+    return retired
+
+
+def collect(directory: Path) -> MetricsRegistry:
+    """Merge every snapshot published under ``directory`` into one registry.
+
+    Counters and histograms of exited processes are kept (see :func:`retire_process`),
+    so totals never go backwards when workers are replaced; gauges cover live
+    processes only.
+    """
+    merged = MetricsRegistry()
+    for _ in range(_COLLECT_ATTEMPTS):
+        merged = MetricsRegistry()
+        retired = _read_retired(directory)
+        merged.absorb(retired["metrics"])
+        try:
+            for path in sorted(directory.glob("[0-9]*.json")):
+                if path.name not in retired["absorbed"]:
+                    merged.absorb(json.loads(path.read_text()))
+        except FileNotFoundError:
+            continue  # retired while we read; its values are in the retired file now
+        return merged
+    return merged
+
+
+def retire_process(directory: Path, pid: int) -> None:
+    """Fold the counters and histograms an exited process published into the retired totals."""
+    for path in sorted(directory.glob(f"{pid}-*.json")):
+        retired = _read_retired(directory)
+        totals = MetricsRegistry()
+        totals.absorb(retired["metrics"])
+        totals.absorb(json.loads(path.read_text()), gauges=False)
+        absorbed = [name for name in retired["absorbed"] if (directory / name).exists()]
+        _write_json(
+            directory / _RETIRED,
+            {"absorbed": [*absorbed, path.name], "metrics": totals.snapshot()},
+        )
+        path.unlink()
+
+
+class StageTimer:
+    """Times named pipeline stages into ``histogram`` and the ``durations`` dict."""
+
+    def __init__(
+        self, histogram: Histogram, clock: Callable[[], float] = time.perf_counter
+    ) -> None:
+        self.histogram = histogram
+        self.clock = clock
+        self.durations: dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = self.clock()
+        try:
+            yield
+        finally:
+            elapsed = self.clock() - start
+            self.durations[name] = self.durations.get(name, 0.0) + elapsed
+            self.histogram.observe(elapsed, stage=name)
+
+
+METRICS = MetricsRegistry()
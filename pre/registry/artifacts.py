@@ -23,3 +23,13 @@ def save_json(path: Path, payload: dict[str, Any]) -> None:
 
 def save_npz(path: Path, payload: dict[str, np.ndarray]) -> None:
     np.savez(path, **payload)
+
+
+def load_json(path: Path) -> dict[str, Any]:
+    payload: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+    return payload
+
+
+def load_npz(path: Path) -> dict[str, np.ndarray]:
+    with np.load(path) as archive:
+        return {key: archive[key] for key in archive.files}
@@ -1,6 +1,39 @@
 from __future__ import annotations
 
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from pre.data.transforms import StandardScaler
+from pre.models.base import ForecastModel
+from pre.models.dummy import DummyModel
+from pre.models.lgbm_quantile import LGBMQuantileModel
+from pre.models.lstm_gaussian import LSTMGaussianModel
+from pre.models.mdn_rnn import MDNRNNModel
+from pre.observability.metrics import METRICS
+from pre.registry.artifacts import load_json, load_npz
+
+MODEL_CACHE_LOOKUPS = METRICS.counter(
+    "pre_model_cache_lookups_total", "ModelStore lookups by result.", ("result",)
+)
+
+RUN_FILES = ("config.json", "scaler.npz", "model.npz", "summary.json", "context.npz")
+_LOAD_ATTEMPTS = 5
+_LOAD_RETRY_SECONDS = 0.05
+
+_MODEL_LOADERS: dict[str, Callable[[dict[str, np.ndarray]], ForecastModel]] = {
+    "dummy": DummyModel.from_artifact_state,
+    "lstm_gaussian": LSTMGaussianModel.from_artifact_state,
+    "lgbm_quantile": LGBMQuantileModel.from_artifact_state,
+    "mdn_rnn": MDNRNNModel.from_artifact_state,
+}
 
 
 @dataclass(frozen=True)
@@ -8,3 +41,144 @@ class ModelRecord:
     model_name: str
     version: str
     run_id: str
+
+
+@dataclass(frozen=True)
+class LoadedRun:
+    """A fitted model restored from a run directory, ready for ``predict``."""
+
+    run_dir: Path
+    config: dict[str, Any]
+    summary: dict[str, Any]
+    model: ForecastModel
+    scaler: StandardScaler
+    context: np.ndarray
+    mtimes: tuple[int, ...]
+
+
+def run_is_complete(run_dir: Path) -> bool:
+    return all((run_dir / name).is_file() for name in RUN_FILES)
+
+
+def _mtimes(run_dir: Path) -> tuple[int, ...]:
+    try:
+        return tuple((run_dir / name).stat().st_mtime_ns for name in RUN_FILES)
+    except FileNotFoundError as error:
+        raise FileNotFoundError(f"Incomplete run directory {run_dir}: {error.filename}") from error
+
+
+def load_run(run_dir: Path) -> LoadedRun:
+    """Restore model, scaler and latest context from the artifacts of a training run.
+
+    The artifact mtimes are checked again after reading. If a retrain rewrote any
+    file in the meantime (or a half-written file failed to parse), the read is
+    retried, so a loaded run never mixes files from two trainings.
+    """
+    for attempt in range(_LOAD_ATTEMPTS):
+        mtimes = _mtimes(run_dir)
+        try:
+            run = _read_run(run_dir, mtimes)
+        except (OSError, EOFError, ValueError, zipfile.BadZipFile):
+            if _mtimes(run_dir) == mtimes:
+                raise
+        else:
+            if _mtimes(run_dir) == mtimes:
+                return run
+        time.sleep(_LOAD_RETRY_SECONDS * (attempt + 1))
+    raise RuntimeError(f"Run directory {run_dir} kept changing while it was loaded")
+
+
+def _read_run(run_dir: Path, mtimes: tuple[int, ...]) -> LoadedRun:
+    config = load_json(run_dir / "config.json")
+    model_name = config["model"]
+    if model_name not in _MODEL_LOADERS:
+        supported = ", ".join(sorted(_MODEL_LOADERS))
+        raise ValueError(f"Unsupported model '{model_name}'. Supported models: {supported}")
+
+    scaler_state = load_npz(run_dir / "scaler.npz")
+    scaler = StandardScaler(mean_=scaler_state["mean"], std_=scaler_state["std"])
+    return LoadedRun(
+        run_dir=run_dir,
+        config=config,
+        summary=load_json(run_dir / "summary.json"),
+        model=_MODEL_LOADERS[model_name](load_npz(run_dir / "model.npz")),
+        scaler=scaler,
+        context=load_npz(run_dir / "context.npz")["features"],
+        mtimes=mtimes,
+    )
+
+
+class ModelStore:
+    """Thread-safe in-process LRU cache of loaded runs.
+
+    Entries are keyed by resolved run directory and revalidated on every ``get``
+    against the artifact files' modification times, so retraining a run (which
+    rewrites its files) transparently reloads it. The least recently used entry
+    is evicted once ``capacity`` runs are cached.
+    """
+
+    def __init__(self, capacity: int = 8) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Path, LoadedRun] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, run_dir: Path) -> LoadedRun:
+        """Cached run for ``run_dir``, loading it outside the lock on a miss.
+
+        Hits on other runs never wait for a cold load. Concurrent misses on the
+        same run may each load it; the entry with the newest artifacts wins.
+        """
+        key = run_dir.resolve()
+        mtimes = _mtimes(key)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached.mtimes == mtimes:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                MODEL_CACHE_LOOKUPS.inc(result="hit")
+                return cached
+            self.misses += 1
+        MODEL_CACHE_LOOKUPS.inc(result="miss")
+        loaded = load_run(key)
+        with self._lock:
+            current = self._entries.get(key)
+            if current is None or max(current.mtimes) <= max(loaded.mtimes):
+                self._entries[key] = loaded
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+        return loaded
+
+    def invalidate(self, run_dir: Path) -> None:
+        with self._lock:
+            self._entries.pop(run_dir.resolve(), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def preload_runs(artifact_root: Path, store: ModelStore) -> list[Path]:
+    """Load and warm the newest complete runs under ``artifact_root``, up to capacity.
+
+    Warming runs one prediction on each run's stored context so lazy numpy and
+    BLAS initialisation happens here rather than on the first request.
+    """
+    runs = [path for path in artifact_root.glob("*") if path.is_dir() and run_is_complete(path)]
+    runs.sort(key=lambda path: (path / "model.npz").stat().st_mtime_ns, reverse=True)
+    loaded = []
+    for run_dir in runs[: store.capacity]:
+        run = store.get(run_dir)
+        run.model.predict(run.scaler.transform(run.context), horizon=int(run.config["horizon"]))
+        loaded.append(run.run_dir)
+    return loaded
+
+
+MODEL_STORE = ModelStore()
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import math
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+import numpy as np
+
+from pre.data.base import BacktestFold, WindowSpec, make_supervised_windows
+from pre.data.shared import SharedArrays, SharedArraySpec, attach_shared_arrays
+from pre.data.transforms import StandardScaler
+from pre.eval.crps import crps_distribution
+from pre.eval.reports import build_report
+from pre.models.base import ForecastModel, IncrementalForecastModel
+
+METRIC_KEYS = ("mae", "rmse", "nll", "crps", "coverage")
+
+_WORKER_ARRAYS: dict[str, np.ndarray] = {}
+_WORKER_SEGMENTS: list[SharedMemory] = []
+
+
+def _attach_worker(specs: dict[str, SharedArraySpec], spec: WindowSpec) -> None:
+    arrays, segments = attach_shared_arrays(specs)
+    windows = make_supervised_windows(arrays["values"], spec)
+    _WORKER_ARRAYS.update(features=windows.features, targets=windows.targets)
+    _WORKER_SEGMENTS.extend(segments)
+
+
+def _score_fold(
+    model: ForecastModel,
+    scaler: StandardScaler,
+    features: np.ndarray,
+    targets: np.ndarray,
+    fold: BacktestFold,
+    horizon: int,
+) -> dict[str, Any]:
+    y_eval = targets[fold.eval_slice]
+    dist = model.predict(scaler.transform(features[fold.eval_slice]), horizon=horizon)
+    if dist.mean is None or dist.std is None:
+        raise ValueError("Predictive distribution must include mean and std for backtesting")
+
+    report: dict[str, Any] = build_report(
+        y_true=y_eval.reshape(-1),
+        y_pred_mean=dist.mean.reshape(-1),
+        y_pred_std=dist.std.reshape(-1),
+        quantiles={q: values.reshape(-1) for q, values in dist.materialize().items()},
+        crps_values=crps_distribution(dist, y_eval),
+    )
+    return {
+        "train": [fold.train_slice.start, fold.train_slice.stop],
+        "eval": [fold.eval_slice.start, fold.eval_slice.stop],
+        "count": int(y_eval.size),
+        "metrics": {key: float(report[key]) for key in METRIC_KEYS},
+    }
+
+
+def _evaluate_folds(
+    model_factory: Callable[[], ForecastModel],
+    features: np.ndarray,
+    targets: np.ndarray,
+    folds: list[BacktestFold],
+    horizon: int,
+) -> list[dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+    for fold in folds:
+        x_train = features[fold.train_slice]
+        scaler = StandardScaler().fit(x_train)
+        model = model_factory()
+        model.fit(scaler.transform(x_train), targets[fold.train_slice])
+        results.append(_score_fold(model, scaler, features, targets, fold, horizon))
+    return results
+
+
+def _evaluate_folds_incremental(
+    model_factory: Callable[[], ForecastModel],
+    features: np.ndarray,
+    targets: np.ndarray,
+    folds: list[BacktestFold],
+    horizon: int,
+) -> list[dict[str, Any]]:
+    """Walk expanding-window folds, feeding each model only the windows added since the last fold.
+
+    The scaler is fit once on the first fold: an affine rescaling of the features
+    does not change least-squares predictions, so a per-fold scaler is unnecessary.
+    """
+    model = model_factory()
+    if not isinstance(model, IncrementalForecastModel):
+        raise ValueError(f"Model '{model.name}' does not support incremental fitting")
+
+    results: list[dict[str, Any]] = []
+    scaler = StandardScaler().fit(features[folds[0].train_slice])
+    seen = 0
+    for fold in folds:
+        stop = fold.train_slice.stop
+        model.partial_fit(scaler.transform(features[seen:stop]), targets[seen:stop])
+        seen = stop
+        results.append(_score_fold(model, scaler, features, targets, fold, horizon))
+    return results
+
+
+def _evaluate_folds_in_worker(
+    model_factory: Callable[[], ForecastModel],
+    folds: list[BacktestFold],
+    horizon: int,
+    incremental: bool,
+) -> list[dict[str, Any]]:
+    evaluate = _evaluate_folds_incremental if incremental else _evaluate_folds
+    return evaluate(
+        model_factory,
+        _WORKER_ARRAYS["features"],
+        _WORKER_ARRAYS["targets"],
+        folds,
+        horizon,
+    )
+
+
+def aggregate_fold_metrics(fold_results: list[dict[str, Any]]) -> dict[str, float]:
+    """Element-weighted aggregate of per-fold metrics; RMSE is pooled over squared error."""
+    total: int = sum(item["count"] for item in fold_results)
+    if total == 0:
+        return {key: float("nan") for key in METRIC_KEYS}
+
+    def _weighted(key: str, transform: Callable[[float], float] = lambda v: v) -> float:
+        weighted = sum(item["count"] * transform(item["metrics"][key]) for item in fold_results)
+        return float(weighted) / total
+
+    aggregate = {key: _weighted(key) for key in METRIC_KEYS}
+    aggregate["rmse"] = math.sqrt(_weighted("rmse", lambda v: v * v))
+    return aggregate
+
+
+def run_backtest(
+    values: np.ndarray,
+    spec: WindowSpec,
+    folds: list[BacktestFold],
+    model_factory: Callable[[], ForecastModel],
+    max_workers: int | None = None,
+    incremental: bool = False,
+) -> dict[str, Any]:
+    """Fit, predict and score every walk-forward fold of ``values`` windowed by ``spec``.
+
+    Fold slices index the windows ``make_supervised_windows(values, spec)`` yields.
+    With more than one worker the folds run on a process pool; only the series is
+    copied into shared memory and each worker rebuilds the strided window views
+    over it, so no ``[windows, context]`` matrix is ever materialized.
+    ``model_factory`` must be picklable.
+
+    ``incremental=True`` requires expanding-window folds (``train_slice`` starting
+    at 0 with non-decreasing stops) and a model with ``partial_fit``. Each worker
+    then takes a contiguous run of folds and grows one model across it.
+    """
+    if (
+        incremental
+        and folds
+        and any(
+            fold.train_slice.start != 0 or fold.train_slice.stop < prev.train_slice.stop
+            for prev, fold in zip([folds[0], *folds], folds, strict=False)
+        )
+    ):
+        raise ValueError("incremental backtests require nested expanding-window folds")
+
+    horizon = spec.horizon
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+    workers = max(1, min(workers, len(folds)))
+    evaluate = _evaluate_folds_incremental if incremental else _evaluate_folds
+
+    if workers == 1:
+        windows = make_supervised_windows(values, spec)
+        fold_results = (
+            evaluate(model_factory, windows.features, windows.targets, folds, horizon)
+            if folds
+            else []
+        )
+    else:
+        if incremental:
+            bounds = np.linspace(0, len(folds), workers + 1).astype(int)
+            groups = [
+                folds[start:stop] for start, stop in zip(bounds[:-1], bounds[1:], strict=True)
+            ]
+        else:
+            groups = [[fold] for fold in folds]
+        with SharedArrays({"values": np.asarray(values, dtype=float)}) as shared:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_attach_worker,
+                initargs=(shared.specs, spec),
+            ) as pool:
+                fold_results = [
+                    item
+                    for chunk in pool.map(
+                        _evaluate_folds_in_worker,
+                        [model_factory] * len(groups),
+                        groups,
+                        [horizon] * len(groups),
+                        [incremental] * len(groups),
+                    )
+                    for item in chunk
+                ]
+
+    for index, item in enumerate(fold_results):
+        item["index"] = index
+    return {
+        "fold_count": len(fold_results),
+        "workers": workers,
+        "incremental": incremental,
+        "folds": fold_results,
+        "aggregate": aggregate_fold_metrics(fold_results),
+    }
@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 import json
 
+from pre.config.schema import TrainConfig
 from pre.train.trainer import Trainer
 
 
@@ -14,6 +15,12 @@ def train_main() -> None:
     parser.add_argument("--context-length", type=int, default=168)
     parser.add_argument("--stride", type=int, default=1)
     parser.add_argument("--artifact-root", default="artifacts")
+    parser.add_argument("--backtest", action="store_true")
+    parser.add_argument("--backtest-workers", type=int, default=None)
+    parser.add_argument("--backtest-incremental", action="store_true")
+    parser.add_argument("--epochs", type=int, default=TrainConfig().epochs)
+    parser.add_argument("--batch-size", type=int, default=TrainConfig().batch_size)
+    parser.add_argument("--learning-rate", type=float, default=TrainConfig().learning_rate)
     args = parser.parse_args()
 
     try:
@@ -24,6 +31,14 @@ def train_main() -> None:
             context_length=args.context_length,
             stride=args.stride,
             artifact_root=args.artifact_root,
+            backtest=args.backtest,
+            backtest_workers=args.backtest_workers,
+            backtest_incremental=args.backtest_incremental,
+            train_config=TrainConfig(
+                epochs=args.epochs,
+                batch_size=args.batch_size,
+                learning_rate=args.learning_rate,
+            ),
         )
     except ValueError as err:
         print(json.dumps({"status": "error", "message": str(err)}, indent=2))
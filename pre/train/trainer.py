@@ -1,22 +1,48 @@
 from __future__ import annotations
 
 from dataclasses import asdict, dataclass
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
-from pre.data.base import DatasetAdapter, rolling_backtest_folds
+from pre.config.schema import EvalConfig, TrainConfig
+from pre.data.base import (
+    DatasetAdapter,
+    WindowSpec,
+    make_supervised_windows,
+    rolling_backtest_folds,
+    temporal_train_val_test_split,
+)
 from pre.data.energy_load import EnergyLoadAdapter
 from pre.data.nyc_taxi import NYCTaxiAdapter
 from pre.data.project_sim import ProjectTimelineAdapter
 from pre.data.telemetry import TelemetryAdapter
 from pre.data.transforms import StandardScaler
+from pre.eval.calibration import CalibrationAccumulator, pit_values
+from pre.eval.crps import crps_distribution, quantile_grid
 from pre.eval.reports import build_report, to_markdown
 from pre.models.dummy import DummyModel
 from pre.models.lgbm_quantile import LGBMQuantileModel
 from pre.models.lstm_gaussian import LSTMGaussianModel
+from pre.models.mdn_rnn import MDNRNNModel
+from pre.observability.metrics import METRICS, STAGE_BUCKETS, StageTimer
 from pre.registry.artifacts import ensure_artifact_dir, save_json, save_npz
+from pre.train.backtest import run_backtest
+
+TRAIN_STAGE_SECONDS = METRICS.histogram(
+    "pre_train_stage_seconds",
+    "Wall time of Trainer.train pipeline stages.",
+    ("stage",),
+    buckets=STAGE_BUCKETS,
+)
+
+
+def observe_stage_seconds(durations: dict[str, float]) -> None:
+    """Record stage timings reported by a ``Trainer.train`` run in another process."""
+    for stage, seconds in durations.items():
+        TRAIN_STAGE_SECONDS.observe(seconds, stage=stage)
 
 
 def _to_2d(values: Any) -> Any:
@@ -30,9 +56,10 @@ def _build_visuals(
     test_dist: Any,
     report: dict[str, Any],
 ) -> dict[str, Any]:
-    q10 = _to_2d(test_dist.quantiles[0.1]).mean(axis=0)
-    q50 = _to_2d(test_dist.quantiles[0.5]).mean(axis=0)
-    q90 = _to_2d(test_dist.quantiles[0.9]).mean(axis=0)
+    bands = test_dist.materialize((0.1, 0.5, 0.9))
+    q10 = _to_2d(bands[0.1]).mean(axis=0)
+    q50 = _to_2d(bands[0.5]).mean(axis=0)
+    q90 = _to_2d(bands[0.9]).mean(axis=0)
     mean_curve = _to_2d(test_dist.mean).mean(axis=0)
     std_curve = _to_2d(test_dist.std).mean(axis=0)
 
@@ -105,14 +132,30 @@ def _resolve_dataset(dataset: str) -> DatasetAdapter:
     return adapters[dataset]
 
 
-def _resolve_model(model: str) -> DummyModel | LSTMGaussianModel | LGBMQuantileModel:
+def load_dataset(dataset: str) -> np.ndarray:
+    """Raw series for ``dataset``, as ``Trainer.train`` loads it."""
+    return _resolve_dataset(dataset).load()
+
+
+def _resolve_model(
+    model: str,
+    train_config: TrainConfig | None = None,
+) -> DummyModel | LSTMGaussianModel | LGBMQuantileModel | MDNRNNModel:
     if model == "dummy":
         return DummyModel()
     if model == "lstm_gaussian":
         return LSTMGaussianModel()
     if model == "lgbm_quantile":
         return LGBMQuantileModel()
-    raise ValueError("Unsupported model. Supported models: dummy, lstm_gaussian, lgbm_quantile")
+    if model == "mdn_rnn":
+        return MDNRNNModel(train_config=train_config)
+    raise ValueError(
+        "Unsupported model. Supported models: dummy, lstm_gaussian, lgbm_quantile, mdn_rnn"
+    )
+
+
+def make_run_id(dataset: str, model: str, horizon: int, context_length: int) -> str:
+    return f"{dataset}-{model}-h{horizon}-c{context_length}"
 
 
 @dataclass(frozen=True)
@@ -134,28 +177,44 @@ class Trainer:
         context_length: int = 168,
         stride: int = 1,
         artifact_root: str = "artifacts",
+        backtest: bool = False,
+        backtest_workers: int | None = None,
+        backtest_incremental: bool = False,
+        train_config: TrainConfig | None = None,
+        eval_config: EvalConfig | None = None,
+        values: np.ndarray | None = None,
     ) -> TrainResult:
+        """Train, evaluate and persist one run.
+
+        ``values`` is the already loaded series for ``dataset`` (for example a
+        read-only view shared between processes); when omitted it is loaded here.
+        """
         adapter = _resolve_dataset(dataset)
-        model_impl = _resolve_model(model)
-
-        split = adapter.split(
-            horizon=horizon,
-            context_length=context_length,
-            stride=stride,
-            val_ratio=0.1,
-            test_ratio=0.1,
-        )
+        model_impl = _resolve_model(model, train_config)
+        timer = StageTimer(TRAIN_STAGE_SECONDS)
+
+        with timer.stage("load"):
+            if values is None:
+                values = adapter.load()
+        with timer.stage("windowing"):
+            spec = WindowSpec(context_length=context_length, horizon=horizon, stride=stride)
+            split = temporal_train_val_test_split(
+                make_supervised_windows(values=values, spec=spec), val_ratio=0.1, test_ratio=0.1
+            )
 
         _assert_shape_consistency(split.train.features.shape, split.train.targets.shape, horizon)
         _assert_shape_consistency(split.val.features.shape, split.val.targets.shape, horizon)
         _assert_shape_consistency(split.test.features.shape, split.test.targets.shape, horizon)
 
-        scaler = StandardScaler().fit(split.train.features)
-        x_train = scaler.transform(split.train.features)
-        x_test = scaler.transform(split.test.features)
+        with timer.stage("scaling"):
+            scaler = StandardScaler().fit(split.train.features)
+            x_train = scaler.transform(split.train.features)
+            x_test = scaler.transform(split.test.features)
 
-        model_impl.fit(x_train, split.train.targets)
-        test_dist = model_impl.predict(x_test, horizon=horizon)
+        with timer.stage("fit"):
+            model_impl.fit(x_train, split.train.targets)
+        with timer.stage("predict"):
+            test_dist = model_impl.predict(x_test, horizon=horizon)
 
         if test_dist.mean is None or test_dist.std is None:
             raise ValueError(
@@ -163,46 +222,93 @@ class Trainer:
                 "for report generation"
             )
 
-        report = build_report(
-            y_true=split.test.targets.reshape(-1),
-            y_pred_mean=test_dist.mean.reshape(-1),
-            y_pred_std=test_dist.std.reshape(-1),
-            quantiles={q: values.reshape(-1) for q, values in test_dist.quantiles.items()},
-        )
-        visuals = _build_visuals(horizon=horizon, test_dist=test_dist, report=report)
+        with timer.stage("build_report"):
+            report: dict[str, Any] = build_report(
+                y_true=split.test.targets,
+                y_pred_mean=test_dist.mean,
+                y_pred_std=test_dist.std,
+                quantiles=test_dist.materialize(),
+                crps_values=crps_distribution(test_dist, split.test.targets),
+                breakdown=True,
+            )
+            by_series = report.pop("by_series")
+        with timer.stage("calibration"):
+            eval_settings = eval_config or EvalConfig()
+            calibration = CalibrationAccumulator(
+                levels=quantile_grid(eval_settings.reliability_levels),
+                bins=eval_settings.calibration_bins,
+            )
+            calibration.update(pit_values(test_dist, split.test.targets))
+            report["calibration"] = calibration.finalize()
+        with timer.stage("visuals"):
+            visuals = _build_visuals(horizon=horizon, test_dist=test_dist, report=report)
 
         folds = rolling_backtest_folds(
             num_windows=split.train.features.shape[0],
             initial_train_size=max(1, int(split.train.features.shape[0] * 0.6)),
             eval_size=max(1, horizon),
             step=max(1, horizon),
-        )[:25]
-
-        run_id = f"{dataset}-{model}-h{horizon}-c{context_length}"
-        artifact_dir = ensure_artifact_dir(Path(artifact_root), run_id)
-
-        save_json(
-            artifact_dir / "config.json",
-            {
-                "dataset": dataset,
-                "model": model,
-                "horizon": horizon,
-                "context_length": context_length,
-                "stride": stride,
-            },
-        )
-        if scaler.mean_ is None or scaler.std_ is None:
-            raise ValueError("Scaler is not fitted")
-        save_npz(
-            artifact_dir / "scaler.npz",
-            {
-                "mean": scaler.mean_,
-                "std": scaler.std_,
-            },
         )
-        save_npz(artifact_dir / "model.npz", model_impl.artifact_state())
-        save_json(artifact_dir / "report.json", report)
-        (artifact_dir / "report.md").write_text(to_markdown(report), encoding="utf-8")
+        backtest_result = None
+        if backtest:
+            with timer.stage("backtest"):
+                # Only the prefix of the series covering the training windows.
+                train_span = (split.train.features.shape[0] - 1) * stride + context_length + horizon
+                backtest_result = run_backtest(
+                    values=values[:train_span],
+                    spec=spec,
+                    folds=folds,
+                    model_factory=partial(_resolve_model, model, train_config),
+                    max_workers=backtest_workers,
+                    incremental=backtest_incremental,
+                )
+
+        run_id = make_run_id(dataset, model, horizon, context_length)
+        with timer.stage("artifacts"):
+            artifact_dir = ensure_artifact_dir(Path(artifact_root), run_id)
+
+            save_json(
+                artifact_dir / "config.json",
+                {
+                    "dataset": dataset,
+                    "model": model,
+                    "horizon": horizon,
+                    "context_length": context_length,
+                    "stride": stride,
+                },
+            )
+            if scaler.mean_ is None or scaler.std_ is None:
+                raise ValueError("Scaler is not fitted")
+            save_npz(
+                artifact_dir / "scaler.npz",
+                {
+                    "mean": scaler.mean_,
+                    "std": scaler.std_,
+                },
+            )
+            save_npz(artifact_dir / "model.npz", model_impl.artifact_state())
+            save_json(artifact_dir / "report.json", report)
+            (artifact_dir / "report.md").write_text(to_markdown(report), encoding="utf-8")
+            save_npz(
+                artifact_dir / "breakdown.npz",
+                {"timestamps": split.test.timestamps, **by_series},
+            )
+            artifacts = [
+                "config.json",
+                "scaler.npz",
+                "model.npz",
+                "report.json",
+                "report.md",
+                "breakdown.npz",
+                "context.npz",
+                "summary.json",
+            ]
+            # The latest window of the series, so served forecasts start after it.
+            latest = np.asarray(values, dtype=float).reshape(-1)[-context_length:]
+            save_npz(artifact_dir / "context.npz", {"features": latest[None, :]})
+            if backtest_result is not None:
+                save_json(artifact_dir / "backtest.json", backtest_result)
+                artifacts.append("backtest.json")
 
         summary = {
             "dataset": dataset,
@@ -234,7 +340,7 @@ class Trainer:
                     "train": [fold.train_slice.start, fold.train_slice.stop],
                     "eval": [fold.eval_slice.start, fold.eval_slice.stop],
                 }
-                for fold in folds
+                for fold in folds[:25]
             ],
             "shape_checks_passed": True,
             "metrics": {
@@ -245,8 +351,17 @@ class Trainer:
                 "coverage": float(report["coverage"]),
             },
             "visuals": visuals,
-            "artifacts": ["config.json", "scaler.npz", "model.npz", "report.json", "report.md"],
+            "artifacts": artifacts,
+            "stage_seconds": timer.durations,
         }
+        if backtest_result is not None:
+            summary["backtest"] = {
+                "fold_count": backtest_result["fold_count"],
+                "workers": backtest_result["workers"],
+                "incremental": backtest_result["incremental"],
+                "aggregate": backtest_result["aggregate"],
+            }
+        save_json(artifact_dir / "summary.json", summary)
         return TrainResult(
             run_id=run_id,
             model_name=model,
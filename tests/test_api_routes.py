@@ -1,10 +1,45 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+import zlib
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
+from typing import Any
 
+import numpy as np
+import pytest
 from fastapi.testclient import TestClient
 
+from pre.api import app as app_module
 from pre.api.app import create_app
+from pre.api.batching import MicroBatcher
+from pre.api.encoding import ARRAY_MEDIA_TYPE, decode_arrays, encoded_response
+from pre.api.executors import ExecutorBusyError, Lane, RouteExecutors
+from pre.api.jobs import JobQueue
+from pre.api.routes import predict as predict_module
+from pre.api.singleflight import SingleFlight
+from pre.observability.metrics import MetricsRegistry, retire_process
+
+
+def _wait_for_job(client: TestClient, job_id: str, timeout: float = 120.0) -> dict[str, Any]:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        payload: dict[str, Any] = client.get(f'/jobs/{job_id}').json()
+        if payload['status'] in ('succeeded', 'failed'):
+            return payload
+        time.sleep(0.05)
+    raise AssertionError(f'job {job_id} did not finish')
 
 
 def test_health_endpoint() -> None:
@@ -15,8 +50,76 @@ def test_health_endpoint() -> None:
     assert payload['status'] == 'ok'
 
 
+def test_metrics_endpoint_exposes_route_latency_and_respects_disable() -> None:
+    registry = MetricsRegistry()
+    client = TestClient(create_app(metrics=registry))
+    assert client.get('/health').status_code == 200
+    client.get('/jobs/abc')
+    body = client.get('/metrics').text
+    assert '# TYPE pre_http_request_duration_seconds histogram' in body
+    assert 'pre_http_request_duration_seconds_count{method="GET",route="/health"} 1.0' in body
+    assert 'pre_http_requests_total{method="GET",route="/jobs/{job_id}",status="404"} 1.0' in body
+    assert 'pre_http_requests_in_flight{method="GET",route="/health"} 0.0' in body
+
+    stages = registry.histogram('stage_seconds', 'Stage timings.', ('stage',), buckets=(1.0,))
+    stages.observe(0.5, stage='fit')
+    stages.observe(2.0, stage='fit')
+    body = registry.render()
+    assert 'stage_seconds_bucket{stage="fit",le="1.0"} 1.0' in body
+    assert 'stage_seconds_bucket{stage="fit",le="+Inf"} 2.0' in body
+    assert 'stage_seconds_sum{stage="fit"} 2.5' in body
+
+    disabled = MetricsRegistry(enabled=False)
+    quiet = TestClient(create_app(metrics=disabled))
+    quiet.get('/health')
+    assert 'pre_http' not in quiet.get('/metrics').text
+    disabled.counter('ignored_total', 'Ignored.').inc()
+    assert disabled.counter('ignored_total', 'Ignored.').value() == 0.0
+
+
+
+def test_shared_metrics_sum_across_processes_and_survive_retirement(tmp_path: Path) -> None:
+    first, second = MetricsRegistry(), MetricsRegistry()
+    first.counter('jobs_total', 'Jobs.').inc(5)
+    first.share(tmp_path)
+    second.share(tmp_path)
+    assert first.counter('jobs_total', 'Jobs.').value() == 0.0
+    first.counter('jobs_total', 'Jobs.').inc(2)
+    second.counter('jobs_total', 'Jobs.').inc(3)
+    first.gauge('busy', 'Busy.').set(1)
+    second.gauge('busy', 'Busy.').set(1)
+    second.histogram('latency', 'Latency.', buckets=(1.0,)).observe(0.5)
+    second.publish()
+
+    body = first.render()
+    assert 'jobs_total 5.0' in body
+    assert 'busy 2.0' in body
+    assert 'latency_count 1.0' in body
+
+    retire_process(tmp_path, os.getpid())
+    replacement = MetricsRegistry()
+    replacement.share(tmp_path)
+    replacement.counter('jobs_total', 'Jobs.').inc()
+    body = replacement.render()
+    assert 'jobs_total 6.0' in body
+    assert 'latency_count 1.0' in body
+    assert 'busy' not in body
+
+def test_ready_endpoint_waits_for_warmup() -> None:
+    release = threading.Event()
+    with TestClient(create_app(warmup=lambda: release.wait(timeout=10))) as client:
+        assert client.get('/health').status_code == 200
+        assert client.get('/ready').status_code == 503
+        release.set()
+        deadline = time.monotonic() + 5
+        while client.get('/ready').status_code != 200:
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        assert client.get('/ready').json()['ready'] is True
+
+
 def test_train_predict_reports_routes(tmp_path: Path) -> None:
-    client = TestClient(create_app())
+    client = TestClient(create_app(JobQueue(max_workers=1)))
 
     train_response = client.post(
         '/train',
@@ -28,17 +131,518 @@ def test_train_predict_reports_routes(tmp_path: Path) -> None:
             'artifact_root': str(tmp_path),
         },
     )
-    assert train_response.status_code == 200
-    train_payload = train_response.json()
-    assert train_payload['summary']['shape_checks_passed'] is True
+    assert train_response.status_code == 202
+    job = _wait_for_job(client, train_response.json()['job_id'])
+    assert job['status'] == 'succeeded'
+    assert job['result']['summary']['shape_checks_passed'] is True
 
     predict_response = client.get('/predict', params={'mode': 'demand', 'artifact_root': str(tmp_path)})
     assert predict_response.status_code == 200
     predict_payload = predict_response.json()
     assert predict_payload['mode'] == 'demand'
 
+    context = np.load(tmp_path / 'nyc_taxi-lstm_gaussian-h12-c72' / 'context.npz')['features']
+    forecast_response = client.post(
+        '/predict',
+        params={'artifact_root': str(tmp_path)},
+        json={
+            'run_id': 'nyc_taxi-lstm_gaussian-h12-c72',
+            'contexts': [context[0].tolist()] * 2,
+            'quantiles': [0.1, 0.9],
+        },
+    )
+    assert forecast_response.status_code == 200
+    forecast = forecast_response.json()
+    assert forecast['run_id'] == 'nyc_taxi-lstm_gaussian-h12-c72'
+    assert np.asarray(forecast['quantiles']['0.1']).shape == (2, 12)
+    assert np.all(np.asarray(forecast['quantiles']['0.1']) <= forecast['quantiles']['0.9'])
+    binary = client.post(
+        '/predict',
+        params={'artifact_root': str(tmp_path)},
+        json={'run_id': forecast['run_id'], 'contexts': [context[0].tolist()] * 2},
+        headers={'Accept': ARRAY_MEDIA_TYPE},
+    )
+    assert binary.headers['content-type'] == ARRAY_MEDIA_TYPE
+    decoded = decode_arrays(binary.content)
+    assert decoded['quantiles']['0.1'].dtype == np.float32
+    np.testing.assert_allclose(decoded['quantiles']['0.1'], forecast['quantiles']['0.1'], rtol=1e-6)
+    bad_width = client.post(
+        '/predict', params={'artifact_root': str(tmp_path)}, json={'contexts': [[1.0, 2.0]]}
+    )
+    assert bad_width.status_code == 422
+
     reports_response = client.get('/reports', params={'dataset': 'nyc_taxi', 'artifact_root': str(tmp_path)})
     assert reports_response.status_code == 200
     reports_payload = reports_response.json()
     assert 'benchmark' in reports_payload
     assert reports_payload['benchmark']['leaderboard']
+
+    leaderboard = tmp_path / 'benchmark-nyc_taxi-h24-c168' / 'leaderboard.json'
+    written = leaderboard.stat().st_mtime_ns
+    etag = reports_response.headers['etag']
+    assert reports_response.headers['last-modified']
+    cached = client.get(
+        '/reports',
+        params={'dataset': 'nyc_taxi', 'artifact_root': str(tmp_path)},
+        headers={'If-None-Match': etag},
+    )
+    assert cached.status_code == 304
+    assert cached.headers['etag'] == etag
+    assert leaderboard.stat().st_mtime_ns == written
+
+    refreshed = client.get(
+        '/reports',
+        params={'dataset': 'nyc_taxi', 'artifact_root': str(tmp_path), 'refresh': True},
+        headers={'If-None-Match': etag},
+    )
+    assert refreshed.status_code == 200
+    assert leaderboard.stat().st_mtime_ns > written
+
+
+def test_train_jobs_deduplicate_and_apply_backpressure() -> None:
+    release = threading.Event()
+
+    def blocked_worker(params: dict[str, Any]) -> dict[str, Any]:
+        release.wait(timeout=10)
+        return {'params': params}
+
+    queue = JobQueue(
+        max_workers=1,
+        max_pending=2,
+        worker=blocked_worker,
+        executor_factory=lambda workers: ThreadPoolExecutor(max_workers=workers),
+    )
+    client = TestClient(create_app(queue))
+
+    first = client.post('/train', params={'horizon': 12}).json()
+    duplicate = client.post('/train', params={'horizon': 12}).json()
+    assert duplicate['job_id'] == first['job_id']
+    assert duplicate['deduplicated'] is True
+
+    assert client.post('/train', params={'horizon': 6}).status_code == 202
+    rejected = client.post('/train', params={'horizon': 3})
+    assert rejected.status_code == 429
+    assert client.get('/jobs/unknown').status_code == 404
+
+    release.set()
+    assert _wait_for_job(client, first['job_id'])['result']['params']['horizon'] == 12
+    assert client.post('/train', params={'horizon': 3}).status_code == 202
+    queue.shutdown()
+
+
+def test_array_encoding_round_trips_and_compresses() -> None:
+    payload = {
+        'mode': 'demand',
+        'bands': [[0.5, 1.5], [2.5, 3.5]],
+        'horizon': np.arange(3),
+        'nested': [{'p50': [1.0, 2.0]}, 'label'],
+        'flags': [True, False],
+    }
+    decoded = decode_arrays(encoded_response(payload, accept=ARRAY_MEDIA_TYPE).body)
+    assert decoded['mode'] == 'demand'
+    assert decoded['bands'].dtype == np.float32 and decoded['bands'].shape == (2, 2)
+    assert decoded['horizon'].dtype == np.int32
+    np.testing.assert_array_equal(decoded['nested'][0]['p50'], [1.0, 2.0])
+    assert decoded['nested'][1] == 'label' and decoded['flags'] == [True, False]
+
+    plain = encoded_response(payload)
+    assert plain.media_type == 'application/json'
+    assert 'content-encoding' not in plain.headers
+    deflated = encoded_response(
+        {'values': list(range(1000))}, accept_encoding='gzip;q=0.5, deflate', compress_min_size=16
+    )
+    assert deflated.headers['content-encoding'] == 'deflate'
+    assert zlib.decompress(deflated.body).startswith(b'{"values":[0,1,2')
+
+
+def test_micro_batcher_coalesces_concurrent_requests() -> None:
+    calls: list[int] = []
+
+    def batch_fn(key: Any, rows: np.ndarray) -> np.ndarray:
+        calls.append(rows.shape[0])
+        return rows * key
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=16, max_wait=0.05)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(batcher.submit, 2.0, np.full((1, 3), i)) for i in range(32)]
+        results = [future.result().result(timeout=5) for future in futures]
+    for i, result in enumerate(results):
+        np.testing.assert_array_equal(result, np.full((1, 3), 2.0 * i))
+    assert sum(calls) == 32
+    assert max(calls) <= 16
+    assert batcher.batches < 32
+
+    failed = batcher.submit('bad', np.ones((1, 3)))
+    try:
+        failed.result(timeout=5)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError('batch errors must propagate to callers')
+    batcher.shutdown()
+
+
+def test_micro_batcher_skips_callers_cancelled_before_dispatch() -> None:
+    seen: list[int] = []
+
+    def batch_fn(key: Any, rows: np.ndarray) -> np.ndarray:
+        seen.append(rows.shape[0])
+        return rows + 1.0
+
+    batcher = MicroBatcher(batch_fn, max_batch_size=16, max_wait=0.2)
+
+    async def _callers() -> np.ndarray:
+        abandoned = asyncio.ensure_future(batcher.predict('k', np.zeros((1, 2))))
+        kept = asyncio.ensure_future(batcher.predict('k', np.ones((1, 2))))
+        await asyncio.sleep(0.01)
+        abandoned.cancel()
+        return await asyncio.wait_for(kept, timeout=5)
+
+    np.testing.assert_array_equal(asyncio.run(_callers()), np.full((1, 2), 2.0))
+    assert seen == [1]
+    np.testing.assert_array_equal(
+        batcher.submit('k', np.zeros((1, 2))).result(timeout=5), np.ones((1, 2))
+    )
+    batcher.shutdown()
+
+
+def test_single_flight_shares_inflight_calls_and_caches_briefly() -> None:
+    now = [0.0]
+    flights = SingleFlight(ttl=2.0, clock=lambda: now[0])
+    started = threading.Event()
+    release = threading.Event()
+    calls: list[int] = []
+
+    def expensive() -> int:
+        calls.append(1)
+        started.set()
+        release.wait(timeout=5)
+        return len(calls)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        leader = pool.submit(flights.do, 'key', expensive)
+        started.wait(timeout=5)
+        followers = [pool.submit(flights.do, 'key', expensive) for _ in range(3)]
+        while flights.shared < 3:
+            time.sleep(0.001)
+        release.set()
+        assert {leader.result(), *(f.result() for f in followers)} == {1}
+    assert flights.do('key', expensive) == 1
+    assert flights.do('key', expensive, fresh=True) == 2
+    assert flights.do('key', expensive) == 2
+    now[0] = 5.0
+    assert flights.do('key', expensive) == 3
+    assert (flights.calls, flights.shared, flights.hits) == (3, 3, 2)
+
+    def failing() -> int:
+        raise RuntimeError('boom')
+
+    for _ in range(2):
+        try:
+            flights.do('bad', failing)
+        except RuntimeError:
+            pass
+    assert flights.calls == 5
+
+    running: list[str] = []
+    overlaps: list[int] = []
+    gate = threading.Event()
+
+    def train(label: str) -> str:
+        running.append(label)
+        overlaps.append(len(running))
+        gate.wait(timeout=5)
+        running.remove(label)
+        return label
+
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        plain = pool.submit(flights.do, 'mode', lambda: train('plain'))
+        while not running:
+            time.sleep(0.001)
+        retrains = [
+            pool.submit(flights.do, 'mode', lambda: train('fresh'), fresh=True) for _ in range(2)
+        ]
+        time.sleep(0.05)
+        assert running == ['plain']
+        gate.set()
+        assert plain.result() == 'plain'
+        assert [future.result() for future in retrains] == ['fresh', 'fresh']
+    assert max(overlaps) == 1
+    assert flights.do('mode', lambda: train('late')) == 'fresh'
+
+
+
+def test_single_flight_hold_shares_streamed_results_and_releases_abandoned_keys() -> None:
+    flights = SingleFlight(ttl=0.0)
+    resume = threading.Event()
+    ran: list[str] = []
+
+    def events() -> Iterator[tuple[str, str]]:
+        yield 'a', 'streamed-a'
+        resume.wait(timeout=5)
+        yield 'b', 'streamed-b'
+
+    def train(label: str) -> str:
+        ran.append(label)
+        return label
+
+    stream = flights.hold(['b', 'a'], events(), lambda event: event)
+    assert next(stream) == ('a', 'streamed-a')
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        waiting = pool.submit(flights.do, 'b', lambda: train('b'), fresh=True)
+        while flights.shared < 1:
+            time.sleep(0.001)
+        resume.set()
+        assert next(stream) == ('b', 'streamed-b')
+        assert waiting.result(timeout=5) == 'streamed-b'
+    assert list(stream) == [] and ran == []
+
+    resume.clear()
+    stream = flights.hold(['a', 'b'], events(), lambda event: event)
+    next(stream)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        retry = pool.submit(flights.do, 'b', lambda: train('b'), fresh=True)
+        while flights.shared < 2:
+            time.sleep(0.001)
+        stream.close()
+        assert retry.result(timeout=5) == 'b'
+    assert ran == ['b']
+    assert flights.do('a', lambda: train('a')) == 'a'
+
+    cached = SingleFlight(ttl=60.0)
+    for key in ('served-a', 'served-b', 'unrelated'):
+        cached.do(key, lambda key=key: f'old-{key}')
+    derived = {'a': 'served-a', 'b': 'served-b'}
+    resume.set()
+    stream = cached.hold(['a', 'b'], events(), lambda event: event, derived=derived)
+    next(stream)
+    assert cached.do('served-a', lambda: 'new') == 'new'
+    assert cached.do('served-b', lambda: 'new') == 'old-served-b'
+    stream.close()
+    assert cached.do('served-b', lambda: 'new') == 'new'
+    assert cached.do('unrelated', lambda: 'new') == 'old-unrelated'
+
+def test_saturated_lane_rejects_without_blocking_health(tmp_path: Path) -> None:
+    release = threading.Event()
+    lane = Lane('reports', max_workers=1, max_queue=1, queue_timeout=0.05)
+    predict = Lane('predict', max_workers=1, max_queue=0, queue_timeout=0.05)
+    executors = RouteExecutors(predict=predict, reports=lane)
+    client = TestClient(create_app(executors=executors))
+
+    running = lane.submit(release.wait, 10)
+    rejected = client.get('/reports', params={'artifact_root': str(tmp_path)})
+    assert rejected.status_code == 503
+    assert rejected.headers['retry-after'] == '1'
+    assert client.get('/health').status_code == 200
+
+    predicting = predict.submit(release.wait, 10)
+    forecast = client.post(
+        '/predict', params={'artifact_root': str(tmp_path)}, json={'contexts': [[1.0]]}
+    )
+    assert forecast.status_code == 503
+
+    queued = lane.submit(release.wait, 10)
+    try:
+        lane.call(release.wait, 10)
+    except ExecutorBusyError:
+        pass
+    else:
+        raise AssertionError('a full lane must reject immediately')
+    assert lane.rejected == 2
+
+    release.set()
+    assert running.result(timeout=5) and queued.result(timeout=5) and predicting.result(5)
+    assert lane.call(sum, [1, 2]) == 3
+    executors.shutdown()
+
+
+
+def test_response_bodies_are_encoded_on_the_route_lane(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    encoders: list[str] = []
+
+    def _recording_encoder(*args: Any, **kwargs: Any) -> Any:
+        encoders.append(threading.current_thread().name)
+        return encoded_response(*args, **kwargs)
+
+    def _lane(name: str) -> Lane:
+        return Lane(name, 1, executor_factory=lambda n: ThreadPoolExecutor(n, f'{name}-lane'))
+
+    monkeypatch.setattr(app_module, 'encoded_response', _recording_encoder)
+    monkeypatch.setattr(app_module, 'predict_route', lambda **_: {'forecast': list(range(4096))})
+    monkeypatch.setattr(app_module, 'demo_needs_training', lambda *_: False)
+    executors = RouteExecutors(predict=_lane('predict'), reports=_lane('reports'))
+    client = TestClient(create_app(executors=executors))
+    response = client.get('/predict', params={'artifact_root': str(tmp_path)})
+    assert response.status_code == 200
+    assert response.headers['content-encoding'] == 'gzip'
+    assert response.json()['forecast'][-1] == 4095
+    assert len(encoders) == 1 and encoders[0].startswith('predict-lane')
+    executors.shutdown()
+
+
+def test_retraining_is_awaited_without_holding_a_predict_lane_thread(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    started, release = threading.Event(), threading.Event()
+    trained: list[str] = []
+
+    def _slow_run_demo(mode: str, artifact_root: str) -> dict[str, Any]:
+        started.set()
+        release.wait(timeout=10)
+        trained.append(mode)
+        return {'mode': mode}
+
+    monkeypatch.setattr(predict_module, 'run_demo', _slow_run_demo)
+    monkeypatch.setattr(app_module, 'demo_needs_training', lambda *_: False)
+    monkeypatch.setattr(app_module, 'predict_route', lambda **kwargs: {'mode': kwargs['mode']})
+    predict = Lane('predict', max_workers=1, max_queue=0)
+    compute = Lane('compute', max_workers=1, queue_timeout=10.0)
+    executors = RouteExecutors(predict=predict, compute=compute)
+    client = TestClient(create_app(executors=executors))
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        retrains = [
+            pool.submit(client.get, '/predict', params={'mode': 'demand', 'retrain': 'true'})
+            for _ in range(2)
+        ]
+        assert started.wait(timeout=10)
+        cached = client.get('/predict', params={'mode': 'telemetry'})
+        assert cached.status_code == 200 and cached.json() == {'mode': 'telemetry'}
+        assert predict.rejected == 0
+        release.set()
+        assert [future.result().json() for future in retrains] == [{'mode': 'demand'}] * 2
+    assert trained == ['demand']
+    executors.shutdown()
+
+
+def test_stream_routes_emit_ndjson_and_sse_events(tmp_path: Path) -> None:
+    streams = Lane('streams', max_workers=1, max_queue=0)
+    client = TestClient(create_app(executors=RouteExecutors(streams=streams)))
+    root = str(tmp_path)
+
+    response = client.get('/demos/stream', params={'modes': 'telemetry', 'artifact_root': root})
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('application/x-ndjson')
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event['event'] for event in events] == ['mode', 'done']
+    assert events[0]['payload']['mode'] == 'telemetry'
+    assert streams.outstanding == 0
+
+    sse = client.get(
+        '/demos/stream',
+        params={'modes': 'telemetry', 'artifact_root': root},
+        headers={'Accept': 'text/event-stream'},
+    )
+    assert sse.headers['content-type'].startswith('text/event-stream')
+    messages = sse.text.strip().split('\n\n')
+    assert messages[-1].startswith('id: 2\nevent: done\ndata: {')
+
+    assert client.get('/demos/stream', params={'modes': 'nope'}).status_code == 422
+    streams.acquire()
+    assert client.get('/demos/stream', params={'artifact_root': root}).status_code == 503
+    streams.release()
+    assert streams.outstanding == 0
+
+
+def test_job_queue_replaces_a_broken_pool_without_leaking_jobs() -> None:
+    class BrokenPool(ThreadPoolExecutor):
+        def submit(self, fn: Any, /, *args: Any, **kwargs: Any) -> Any:
+            raise BrokenProcessPool('worker killed')
+
+    pools: list[ThreadPoolExecutor] = []
+
+    def factory(workers: int) -> ThreadPoolExecutor:
+        pool = ThreadPoolExecutor(workers) if pools else BrokenPool(workers)
+        pools.append(pool)
+        return pool
+
+    queue = JobQueue(max_workers=1, max_pending=1, worker=dict, executor_factory=factory)
+    job, created = queue.submit({'horizon': 12})
+    assert created and len(pools) == 2
+    assert job.future is not None and job.future.result(timeout=5) == {'horizon': 12}
+    queue.shutdown()
+
+    stuck = JobQueue(max_workers=1, max_pending=1, worker=dict, executor_factory=BrokenPool)
+    for _ in range(2):
+        try:
+            stuck.submit({'horizon': 6})
+        except BrokenProcessPool:
+            pass
+        else:
+            raise AssertionError('a pool that stays broken must surface the error')
+        assert stuck.pending == 0
+    stuck.shutdown()
+
+
+def _worker_pids(parent: int) -> set[int]:
+    children = Path(f'/proc/{parent}/task/{parent}/children')
+    return {int(pid) for pid in children.read_text().split()}
+
+
+def _wait_until(check: Any, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if check():
+                return
+        except OSError:
+            pass
+        time.sleep(0.1)
+    raise AssertionError('condition not reached in time')
+
+
+@pytest.mark.skipif(not Path('/proc/self/task').exists(), reason='needs /proc')
+def test_prefork_server_serves_and_recycles_workers_one_at_a_time(tmp_path: Path) -> None:
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+    argv = [
+        '--host', '127.0.0.1', '--port', str(port), '--workers', '2',
+        '--artifact-root', str(tmp_path), '--graceful-timeout', '5',
+    ]
+    server = subprocess.Popen(
+        [sys.executable, '-c', f'from pre.api.serve import main; main({argv!r})'],
+    )
+    url = f'http://127.0.0.1:{port}'
+
+    def _healthy() -> bool:
+        with urllib.request.urlopen(f'{url}/health', timeout=2) as response:
+            return bool(response.status == 200)
+
+    def _health_count() -> float:
+        with urllib.request.urlopen(f'{url}/metrics', timeout=2) as response:
+            body = response.read().decode()
+        series = 'pre_http_request_duration_seconds_count{method="GET",route="/health"} '
+        return float(body.split(series)[1].split()[0])
+
+    try:
+        _wait_until(lambda: _healthy() and len(_worker_pids(server.pid)) == 2)
+        for _ in range(10):
+            assert _healthy()
+        time.sleep(1.5)
+        before = _health_count()
+        assert before >= 10
+        first = _worker_pids(server.pid)
+        server.send_signal(signal.SIGHUP)
+        peak = 0
+
+        def _recycled() -> bool:
+            nonlocal peak
+            current = _worker_pids(server.pid)
+            peak = max(peak, len(current))
+            assert len(current) >= 2, 'a rolling recycle never drops below the worker count'
+            return not current & first and len(current) == 2
+
+        _wait_until(_recycled)
+        assert peak <= 3
+        assert _healthy()
+        time.sleep(1.5)
+        assert _health_count() >= before + 1
+        server.send_signal(signal.SIGTERM)
+        assert server.wait(timeout=30) == 0
+    finally:
+        if server.poll() is None:
+            os.kill(server.pid, signal.SIGKILL)
+            server.wait()
@@ -1,9 +1,23 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 
-from pre.benchmarks.runner import run_benchmark
-from pre.demo.runner import build_mode_cards, run_all_demos, run_demo
+import numpy as np
+import pytest
+
+from pre.benchmarks.kernels import (
+    benchmark_eval_kernel,
+    benchmark_rollout,
+    benchmark_windowing,
+)
+from pre.benchmarks.runner import iter_benchmark, run_benchmark
+from pre.demo import runner as demo_runner
+from pre.demo.modes import DEMO_MODES
+from pre.demo.runner import build_mode_cards, run_all_demos, run_demo, serve_demo
+from pre.registry import model_store
+from pre.registry.model_store import ModelStore
+from pre.train.trainer import load_dataset
 
 
 def test_benchmark_runner_generates_leaderboard(tmp_path: Path) -> None:
@@ -34,9 +48,148 @@ def test_demo_mode_outputs_payload_and_artifacts(tmp_path: Path) -> None:
     assert (mode_dir / "demo.md").exists()
 
 
+def test_serve_demo_trains_once_then_predicts_from_cached_artifacts(tmp_path: Path) -> None:
+    store = ModelStore(capacity=1)
+    first = serve_demo(mode="telemetry", artifact_root=str(tmp_path), store=store)
+    run_dir = Path(first["artifact_path"])
+    model_mtime = (run_dir / "model.npz").stat().st_mtime_ns
+
+    second = serve_demo(mode="telemetry", artifact_root=str(tmp_path), store=store)
+    third = serve_demo(mode="telemetry", artifact_root=str(tmp_path), store=store)
+    assert (run_dir / "model.npz").stat().st_mtime_ns == model_mtime
+    assert (store.hits, store.misses) == (2, 1)
+    assert second["forecast"] == third["forecast"] == first["forecast"]
+    assert len(second["forecast"]["p50"]) == second["horizon"]
+    assert second["metrics"] == first["metrics"]
+    assert second.keys() == first.keys()
+    assert second["demo_artifact_path"] == first["demo_artifact_path"]
+
+    serve_demo(mode="telemetry", artifact_root=str(tmp_path), retrain=True, store=store)
+    serve_demo(mode="telemetry", artifact_root=str(tmp_path), store=store)
+    assert store.misses == 2
+    assert len(store) == 1
+
+
 def test_run_all_demos_and_cards(tmp_path: Path) -> None:
     cards = build_mode_cards()
     assert len(cards) >= 5
 
     payload = run_all_demos(artifact_root=str(tmp_path))
     assert payload["count"] >= 5
+
+
+def test_parallel_demos_load_each_dataset_once_and_match_serial(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    loaded: list[str] = []
+
+    def _counting_load(dataset: str) -> np.ndarray:
+        loaded.append(dataset)
+        return load_dataset(dataset)
+
+    monkeypatch.setattr(demo_runner, "load_dataset", _counting_load)
+    parallel = run_all_demos(artifact_root=str(tmp_path / "parallel"), max_workers=3)
+    assert sorted(loaded) == sorted({spec.dataset for spec in DEMO_MODES.values()})
+    assert [item["mode"] for item in parallel["modes"]] == sorted(DEMO_MODES)
+
+    serial = run_all_demos(artifact_root=str(tmp_path / "serial"), max_workers=1)
+    for left, right in zip(parallel["modes"], serial["modes"], strict=True):
+        assert left["metrics"] == right["metrics"]
+        assert left["forecast"] == right["forecast"]
+
+
+def test_windowing_kernel_benchmark_reports_baseline_and_candidate() -> None:
+    result = benchmark_windowing(length=2_000, context_length=48, horizon=12, repeats=1)
+    assert result["kernel"] == "windowing"
+    assert result["candidate"]["peak_bytes"] < result["baseline"]["peak_bytes"]
+    assert result["speedup"] > 0.0
+
+
+def test_rollout_kernel_benchmark_reports_throughput() -> None:
+    result = benchmark_rollout(num_samples=500, steps=8, dtype="float32", repeats=1)
+    assert result["kernel"] == "rollout"
+    assert result["candidate"]["samples_per_second"] > 0.0
+    assert result["speedup"] > 1.0
+
+
+def test_eval_kernel_benchmark_matches_reference() -> None:
+    result = benchmark_eval_kernel(size=20_000, repeats=1)
+    assert result["kernel"] == "eval"
+    assert result["max_abs_diff"] < 1e-12
+    assert result["speedup"] > 1.0
+
+
+def test_streamed_benchmark_ranks_incrementally_and_matches_run_benchmark(
+    tmp_path: Path,
+) -> None:
+    models = ["dummy", "lstm_gaussian", "lgbm_quantile"]
+    events = list(iter_benchmark("nyc_taxi", models, 12, 72, str(tmp_path), max_workers=3))
+    runs, done = events[:-1], events[-1]
+    assert [event["completed"] for event in runs] == [1, 2, 3]
+    assert sorted(event["run"]["model"] for event in runs) == sorted(models)
+    for event in runs:
+        assert event["leaderboard"][event["rank"] - 1] == event["run"]["model"]
+    report = done["report"]
+    assert [row["model"] for row in report["leaderboard"]] == runs[-1]["leaderboard"]
+
+    serial = run_benchmark("nyc_taxi", models, 12, 72, artifact_root=str(tmp_path))
+    assert serial["leaderboard"][-1]["model"] == report["leaderboard"][-1]["model"] == "dummy"
+
+
+def test_model_store_loads_outside_its_lock_and_retries_torn_reads(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    warm = Path(run_demo(mode="telemetry", artifact_root=str(tmp_path))["artifact_path"])
+    cold = Path(run_demo(mode="project-risk", artifact_root=str(tmp_path))["artifact_path"])
+    context = np.load(warm / "context.npz")["features"]
+    np.testing.assert_array_equal(context[0], load_dataset("telemetry").reshape(-1)[-120:])
+
+    store = ModelStore(capacity=2)
+    store.get(warm)
+    started, release = threading.Event(), threading.Event()
+    original = model_store.load_run
+
+    def _slow_load(run_dir: Path) -> model_store.LoadedRun:
+        started.set()
+        release.wait(10)
+        return original(run_dir)
+
+    monkeypatch.setattr(model_store, "load_run", _slow_load)
+    loader = threading.Thread(target=store.get, args=(cold,))
+    loader.start()
+    assert started.wait(10)
+    assert store.get(warm).run_dir == warm.resolve()
+    release.set()
+    loader.join(10)
+    assert (store.hits, store.misses, len(store)) == (1, 2, 2)
+
+    reads = []
+    read_run = model_store._read_run
+
+    def _torn_read(run_dir: Path, mtimes: tuple[int, ...]) -> model_store.LoadedRun:
+        reads.append(run_dir)
+        if len(reads) == 1:
+            (run_dir / "model.npz").touch()
+        return read_run(run_dir, mtimes)
+
+    monkeypatch.setattr(model_store, "_read_run", _torn_read)
+    loaded = original(cold)
+    assert len(reads) == 2
+    assert loaded.mtimes == model_store._mtimes(cold)
+
+
+def test_preload_runs_warms_the_newest_complete_runs(tmp_path: Path) -> None:
+    older = Path(run_demo(mode="telemetry", artifact_root=str(tmp_path))["artifact_path"])
+    newer = Path(run_demo(mode="project-risk", artifact_root=str(tmp_path))["artifact_path"])
+    (tmp_path / "incomplete").mkdir()
+
+    store = ModelStore(capacity=1)
+    assert model_store.preload_runs(tmp_path, store) == [newer.resolve()]
+    assert (store.hits, store.misses, len(store)) == (0, 1, 1)
+
+    assert model_store.preload_runs(tmp_path, store) == [newer.resolve()]
+    assert (store.hits, store.misses) == (1, 1)
+
+    (older / "model.npz").touch()
+    assert model_store.preload_runs(tmp_path, store) == [older.resolve()]
+    assert store.misses == 2
@@ -1,16 +1,24 @@
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import numpy as np
 
+from pre.config.schema import TrainConfig
 from pre.data.base import (
     WindowSpec,
+    iter_window_chunks,
     make_supervised_windows,
     rolling_backtest_folds,
     temporal_train_val_test_split,
 )
 from pre.data.nyc_taxi import NYCTaxiAdapter
+from pre.data.telemetry import TelemetryAdapter
+from pre.models.lgbm_quantile import LGBMQuantileModel
+from pre.models.lstm_gaussian import LSTMGaussianModel
+from pre.models.mdn_rnn import MDNRNNModel
+from pre.train.backtest import run_backtest
 from pre.train.trainer import Trainer
 
 
@@ -23,6 +31,84 @@ def test_windowing_supports_multiple_horizons() -> None:
         assert windows.features.shape[0] == windows.targets.shape[0]
 
 
+def test_windowing_returns_read_only_strided_views() -> None:
+    series = np.arange(100, dtype=float)
+    windows = make_supervised_windows(series, WindowSpec(context_length=10, horizon=3, stride=4))
+
+    assert windows.features.shape == (22, 10)
+    assert windows.targets.shape == (22, 3)
+    assert np.array_equal(windows.features[1], series[4:14])
+    assert np.array_equal(windows.targets[1], series[14:17])
+    assert np.array_equal(windows.timestamps[:3], [10, 14, 18])
+    assert np.shares_memory(windows.features, series)
+    assert not windows.features.flags.writeable
+
+    copied = make_supervised_windows(
+        series, WindowSpec(context_length=10, horizon=3, stride=4), copy=True
+    )
+    assert copied.features.flags.writeable and copied.features.flags.c_contiguous
+    assert np.array_equal(copied.features, windows.features)
+
+    for spec in (WindowSpec(context_length=4, horizon=1), WindowSpec(context_length=1, horizon=3)):
+        copied = make_supervised_windows(series, spec, copy=True)
+        for array in (copied.features, copied.targets):
+            assert array.flags.writeable and array.flags.c_contiguous
+            assert not np.shares_memory(array, series)
+
+
+def test_chunked_gaussian_fit_matches_in_memory_fit(tmp_path: Path) -> None:
+    series = TelemetryAdapter().load().reshape(-1)
+    mapped = np.lib.format.open_memmap(tmp_path / "series.npy", mode="w+", shape=series.shape)
+    mapped[:] = series
+    spec = WindowSpec(context_length=24, horizon=6)
+
+    windows = make_supervised_windows(series, spec)
+    in_memory = LSTMGaussianModel()
+    in_memory.fit(windows.features, windows.targets)
+    chunked = LSTMGaussianModel()
+    chunked.fit_chunks(iter_window_chunks(mapped, spec, chunk_size=97))
+
+    assert in_memory.coefficients_ is not None and chunked.coefficients_ is not None
+    assert np.allclose(chunked.coefficients_, in_memory.coefficients_, atol=1e-8)
+    assert np.allclose(chunked.residual_std_, in_memory.residual_std_)
+
+    half = windows.features.shape[0] // 2
+    for model_type in (LSTMGaussianModel, LGBMQuantileModel):
+        ridged, grown = model_type(), model_type()
+        ridged.fit_chunks(iter_window_chunks(series, spec, chunk_size=97), ridge=50.0)
+        grown.fit_chunks([(windows.features[:half], windows.targets[:half])], ridge=50.0)
+        grown.partial_fit(windows.features[half:], windows.targets[half:])
+        assert grown.ridge_ == 50.0
+        assert np.allclose(grown.coefficients_, ridged.coefficients_)
+        try:
+            grown.fit_chunks(iter_window_chunks(series, spec), ridge=-1.0)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("a negative ridge must be rejected")
+        assert grown.ridge_ == 50.0
+
+
+def test_window_chunks_cast_only_their_rows_and_match_full_windows(tmp_path: Path) -> None:
+    series = np.arange(1000, dtype=np.float32)
+    mapped = np.lib.format.open_memmap(
+        tmp_path / "series.npy", mode="w+", dtype=np.float32, shape=series.shape
+    )
+    mapped[:] = series
+    spec = WindowSpec(context_length=24, horizon=6, stride=3)
+    windows = make_supervised_windows(series, spec)
+
+    chunks = list(iter_window_chunks(mapped, spec, chunk_size=50))
+    assert [len(x) for x, _ in chunks] == [50] * 6 + [24]
+    for x, _ in chunks:
+        owner = x
+        while owner.base is not None:
+            owner = owner.base
+        assert owner.dtype == np.float64 and owner.size <= 49 * 3 + 30
+    assert np.array_equal(np.concatenate([x for x, _ in chunks]), windows.features)
+    assert np.array_equal(np.concatenate([y for _, y in chunks]), windows.targets)
+
+
 def test_temporal_split_preserves_order_and_sizes() -> None:
     series = np.arange(200, dtype=float)
     windows = make_supervised_windows(series, WindowSpec(context_length=24, horizon=6))
@@ -50,6 +136,49 @@ def test_rolling_backtest_folds_generated() -> None:
     assert folds[0].eval_slice == slice(60, 72)
 
 
+def test_parallel_backtest_matches_serial_execution() -> None:
+    values = NYCTaxiAdapter().load()
+    spec = WindowSpec(context_length=24, horizon=6)
+    windows = make_supervised_windows(values, spec)
+    folds = rolling_backtest_folds(
+        num_windows=windows.features.shape[0],
+        initial_train_size=600,
+        eval_size=60,
+        step=120,
+    )
+
+    serial = run_backtest(values, spec, folds, LSTMGaussianModel, max_workers=1)
+    parallel = run_backtest(values, spec, folds, LSTMGaussianModel, max_workers=2)
+
+    assert serial["fold_count"] == len(folds)
+    assert parallel["workers"] == 2
+    assert [item["metrics"] for item in parallel["folds"]] == [
+        item["metrics"] for item in serial["folds"]
+    ]
+    assert np.isclose(parallel["aggregate"]["crps"], serial["aggregate"]["crps"])
+
+
+def test_incremental_backtest_matches_full_refit() -> None:
+    values = TelemetryAdapter().load()
+    spec = WindowSpec(context_length=24, horizon=6)
+    windows = make_supervised_windows(values, spec)
+    folds = rolling_backtest_folds(
+        num_windows=windows.features.shape[0],
+        initial_train_size=500,
+        eval_size=50,
+        step=100,
+    )
+
+    full = run_backtest(values, spec, folds, LSTMGaussianModel, max_workers=1)
+    incremental = run_backtest(
+        values, spec, folds, LSTMGaussianModel, max_workers=2, incremental=True
+    )
+
+    assert incremental["fold_count"] == full["fold_count"]
+    for key in ("mae", "rmse", "nll", "crps", "coverage"):
+        assert np.isclose(incremental["aggregate"][key], full["aggregate"][key], rtol=1e-6)
+
+
 def test_trainer_runs_shape_checks_with_dummy_model() -> None:
     result = Trainer().train(
         dataset="nyc_taxi",
@@ -59,6 +188,9 @@ def test_trainer_runs_shape_checks_with_dummy_model() -> None:
     )
     assert result.summary["shape_checks_passed"] is True
     assert result.summary["batch_shapes"]["train"]["targets"][1] == 12
+    stages = result.summary["stage_seconds"]
+    assert set(stages) >= {"load", "windowing", "scaling", "fit", "predict", "artifacts"}
+    assert all(seconds >= 0.0 for seconds in stages.values())
 
 
 def test_lstm_gaussian_training_writes_artifacts_and_metrics(  # type: ignore[no-untyped-def]
@@ -81,6 +213,11 @@ def test_lstm_gaussian_training_writes_artifacts_and_metrics(  # type: ignore[no
     for key in ("mae", "rmse", "nll", "crps", "coverage"):
         assert key in result.summary["metrics"]
 
+    report = json.loads((artifact_dir / "report.json").read_text(encoding="utf-8"))
+    assert len(report["by_step"]["rmse"]) == 12
+    breakdown = np.load(artifact_dir / "breakdown.npz")
+    assert breakdown["mae"].shape == breakdown["timestamps"].shape
+
 
 def test_lgbm_quantile_runs_on_telemetry_dataset(  # type: ignore[no-untyped-def]
     tmp_path: Path,
@@ -94,3 +231,58 @@ def test_lgbm_quantile_runs_on_telemetry_dataset(  # type: ignore[no-untyped-def
     )
     assert result.summary["shape_checks_passed"] is True
     assert result.summary["window_counts"]["train"] > 0
+
+
+def test_mdn_rnn_trains_with_minibatches(tmp_path: Path) -> None:
+    result = Trainer().train(
+        dataset="telemetry",
+        model="mdn_rnn",
+        horizon=6,
+        context_length=24,
+        artifact_root=str(tmp_path),
+        train_config=TrainConfig(epochs=3, batch_size=128, learning_rate=1e-2),
+    )
+    assert result.summary["shape_checks_passed"] is True
+    for key in ("mae", "rmse", "nll", "crps", "coverage"):
+        assert np.isfinite(result.summary["metrics"][key])
+
+    state = np.load(Path(result.artifact_path) / "model.npz")
+    assert state["w_out"].shape == (32, 3 * 6 * 3)
+
+
+def test_mdn_rnn_gradients_match_finite_differences() -> None:
+    rng = np.random.default_rng(3)
+    model = MDNRNNModel(hidden_size=4, num_mixtures=2)
+    model.horizon = 2
+    params = model._init_params(2, rng)
+    params["b_out"] += rng.normal(0.0, 0.3, size=params["b_out"].shape)
+    x, z = rng.normal(size=(5, 6)), rng.normal(size=(5, 2))
+
+    _, grads = model._loss_and_grads(params, x, z)
+    step = 1e-6
+    for key, value in params.items():
+        for index in np.ndindex(value.shape):
+            original = value[index]
+            value[index] = original + step
+            upper, _ = model._loss_and_grads(params, x, z)
+            value[index] = original - step
+            lower, _ = model._loss_and_grads(params, x, z)
+            value[index] = original
+            numeric = (upper - lower) / (2 * step)
+            assert np.isclose(grads[key][index], numeric, rtol=1e-4, atol=1e-7), (key, index)
+
+
+def test_mdn_rnn_loss_drops_on_a_learnable_series() -> None:
+    t = np.arange(600)
+    series = np.sin(2 * np.pi * t / 24) + 0.05 * np.random.default_rng(0).normal(size=600)
+    windows = make_supervised_windows(series, WindowSpec(context_length=24, horizon=4))
+    model = MDNRNNModel(
+        hidden_size=8,
+        num_mixtures=2,
+        train_config=TrainConfig(epochs=10, batch_size=64, learning_rate=1e-2),
+    )
+    model.fit(windows.features, windows.targets)
+
+    assert model.loss_history_[-1] < model.loss_history_[0] - 1.0
+    forecast = model.predict(windows.features[-50:], horizon=4)
+    assert np.mean(np.abs(forecast.mean - windows.targets[-50:])) < 0.3
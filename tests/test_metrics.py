@@ -1,10 +1,28 @@
 from __future__ import annotations
 
+import math
+
 import numpy as np
 
-from pre.eval.calibration import quantile_reliability_bins
+from pre.eval.calibration import (
+    CalibrationAccumulator,
+    picp,
+    pit_values,
+    quantile_reliability_bins,
+)
+from pre.eval.crps import (
+    crps_distribution,
+    crps_ensemble,
+    crps_gaussian_mixture,
+    crps_gaussian_values,
+    crps_quantiles,
+    quantile_grid,
+)
+from pre.eval.kernel import fused_gaussian_report
 from pre.eval.metrics import crps_gaussian, gaussian_nll, interval_coverage, mae, rmse
 from pre.eval.reports import build_report, to_markdown
+from pre.eval.streaming import ReportAccumulator, ReportChunk, stream_report
+from pre.infer.predict import PredictiveDistribution
 
 
 def test_point_metrics_deterministic() -> None:
@@ -50,3 +68,181 @@ def test_reliability_bins_and_report_generation() -> None:
 
     assert "# Evaluation Report" in markdown
     assert "| expected | observed | count |" in markdown
+
+
+def test_fused_report_matches_separate_metrics_across_chunks() -> None:
+    rng = np.random.default_rng(11)
+    y_true = rng.normal(size=10_001)
+    mean = 0.2 * rng.normal(size=10_001)
+    std = 0.3 + np.abs(rng.normal(size=10_001))
+    quantiles = {0.9: mean + 1.28155 * std, 0.1: mean - 1.28155 * std, 0.5: mean}
+
+    report = fused_gaussian_report(y_true, mean, std, quantiles, chunk_size=1_000)
+
+    assert math.isclose(report["mae"], mae(y_true, mean), rel_tol=1e-12)
+    assert math.isclose(report["rmse"], rmse(y_true, mean), rel_tol=1e-12)
+    assert math.isclose(report["nll"], gaussian_nll(y_true, mean, std), rel_tol=1e-12)
+    assert math.isclose(report["crps"], crps_gaussian(y_true, mean, std), rel_tol=1e-12)
+    assert report["coverage"] == picp(y_true, quantiles[0.1], quantiles[0.9])
+    expected_bins = quantile_reliability_bins(y_true, quantiles)
+    assert [row["observed"] for row in report["reliability_bins"]] == [
+        row.observed for row in expected_bins
+    ]
+
+
+def test_report_accumulators_merge_to_the_full_report() -> None:
+    rng = np.random.default_rng(5)
+    y_true = rng.normal(size=9_000)
+    mean = 0.1 * rng.normal(size=9_000)
+    std = 0.5 + np.abs(rng.normal(size=9_000))
+    quantiles = {0.1: mean - 1.28155 * std, 0.5: mean, 0.9: mean + 1.28155 * std}
+    expected = build_report(y_true, mean, std, quantiles)
+
+    def chunk(part: np.ndarray) -> ReportChunk:
+        sliced = {q: values[part] for q, values in quantiles.items()}
+        return y_true[part], mean[part], std[part], sliced
+
+    merged = ReportAccumulator((0.1, 0.5, 0.9))
+    for part in np.array_split(np.arange(9_000), 4):
+        worker = ReportAccumulator((0.9, 0.5, 0.1))
+        worker.update(*chunk(part))
+        merged.merge(worker)
+    streamed = stream_report(chunk(part) for part in np.array_split(np.arange(9_000), 7))
+
+    for report in (merged.finalize(), streamed):
+        for key in ("mae", "rmse", "nll", "crps", "coverage"):
+            assert math.isclose(report[key], expected[key], rel_tol=1e-12)
+        assert report["reliability_bins"] == expected["reliability_bins"]
+
+
+def test_sorted_ensemble_crps_matches_pairwise_energy_form() -> None:
+    rng = np.random.default_rng(2)
+    samples = rng.normal(size=(200, 3, 4))
+    y_true = rng.normal(size=(3, 4))
+
+    spread = np.abs(samples - y_true).mean(axis=0)
+    pairwise = np.abs(samples[:, None] - samples[None, :]).mean(axis=(0, 1))
+    np.testing.assert_allclose(crps_ensemble(samples, y_true), spread - 0.5 * pairwise)
+
+
+def test_mixture_and_quantile_crps_agree_with_reference_forms() -> None:
+    y_true = np.array([-1.0, 0.3, 2.5])
+    mean = np.array([0.0, 0.5, 1.0])
+    std = np.array([1.0, 0.5, 2.0])
+    single = crps_gaussian_mixture(y_true, np.zeros((3, 1)), mean[:, None], np.log(std)[:, None])
+    np.testing.assert_allclose(single, crps_gaussian_values(y_true, mean, std), atol=1e-12)
+
+    logmix = np.log(np.array([[0.3, 0.7]]))
+    means, logstd = np.array([[-2.0, 1.0]]), np.log(np.array([[0.5, 1.5]]))
+    rng = np.random.default_rng(4)
+    draws = np.where(
+        rng.random(400_000) < 0.3, rng.normal(-2.0, 0.5, 400_000), rng.normal(1.0, 1.5, 400_000)
+    )
+    exact = crps_gaussian_mixture(np.array([0.2]), logmix, means, logstd)
+    assert abs(float(exact[0]) - float(crps_ensemble(draws[:, None], np.array([0.2]))[0])) < 5e-3
+
+    dist = PredictiveDistribution.normal(horizon=np.arange(3), loc=mean, scale=std)
+    approx = crps_quantiles(y_true, dist.materialize(tuple(np.linspace(0.005, 0.995, 199))))
+    np.testing.assert_allclose(approx, crps_gaussian_values(y_true, mean, std), rtol=2e-2)
+
+
+def test_crps_distribution_dispatches_by_family() -> None:
+    y_true = np.array([0.1, -0.4])
+    mixture = PredictiveDistribution.from_mixture(
+        horizon=np.arange(2),
+        logmix=np.log(np.full((2, 2), 0.5)),
+        mean=np.array([[-1.0, 1.0], [0.0, 0.5]]),
+        logstd=np.zeros((2, 2)),
+    )
+    np.testing.assert_allclose(
+        crps_distribution(mixture, y_true),
+        crps_gaussian_mixture(y_true, *(mixture.params[k] for k in ("logmix", "mean", "logstd"))),
+    )
+    offsets = PredictiveDistribution.from_quantile_offsets(
+        horizon=np.arange(2),
+        loc=np.zeros(2),
+        offset_levels=(0.1, 0.5, 0.9),
+        offsets=np.array([[-1.28155], [0.0], [1.28155]]),
+        std=np.ones(2),
+    )
+    np.testing.assert_allclose(
+        crps_distribution(offsets, y_true),
+        crps_gaussian_values(y_true, np.zeros(2), np.ones(2)),
+        rtol=3e-2,
+    )
+
+
+def test_breakdown_report_matches_per_step_and_per_series_loops() -> None:
+    rng = np.random.default_rng(8)
+    y_true = rng.normal(size=(301, 6))
+    mean = 0.1 * rng.normal(size=(301, 6))
+    std = np.broadcast_to(np.linspace(0.5, 1.5, 6), (301, 6))
+    quantiles = {0.1: mean - 1.28155 * std, 0.5: mean, 0.9: mean + 1.28155 * std}
+
+    report = build_report(y_true, mean, std, quantiles, breakdown=True)
+    flat = build_report(
+        y_true.reshape(-1),
+        mean.reshape(-1),
+        std.reshape(-1),
+        {q: v.reshape(-1) for q, v in quantiles.items()},
+    )
+    for key in ("mae", "rmse", "nll", "crps", "coverage"):
+        assert math.isclose(report[key], flat[key], rel_tol=1e-12)
+
+    for step in range(6):
+        assert math.isclose(report["by_step"]["rmse"][step], rmse(y_true[:, step], mean[:, step]))
+        assert math.isclose(
+            report["by_step"]["crps"][step],
+            crps_gaussian(y_true[:, step], mean[:, step], std[:, step]),
+            rel_tol=1e-12,
+        )
+    expected_coverage = [picp(y_true[i], quantiles[0.1][i], quantiles[0.9][i]) for i in range(301)]
+    np.testing.assert_allclose(report["by_series"]["coverage"], expected_coverage)
+    np.testing.assert_allclose(report["by_series"]["mae"], np.abs(y_true - mean).mean(axis=1))
+    assert "## By Horizon Step" in to_markdown(report)
+
+
+def test_calibration_accumulator_matches_per_level_passes_and_merges() -> None:
+    rng = np.random.default_rng(12)
+    loc, scale = rng.normal(size=(400, 5)), 0.5 + rng.random((400, 5))
+    y_true = loc + scale * rng.normal(size=(400, 5))
+    dist = PredictiveDistribution.normal(horizon=np.arange(5), loc=loc, scale=scale)
+    pit = pit_values(dist, y_true)
+
+    whole = CalibrationAccumulator(levels=quantile_grid(99), bins=10)
+    whole.update(pit)
+    merged = CalibrationAccumulator(levels=quantile_grid(99), bins=10)
+    for block in np.array_split(pit, 3):
+        part = CalibrationAccumulator(levels=quantile_grid(99), bins=10)
+        part.update(block)
+        merged.merge(part)
+
+    report = merged.finalize()
+    assert report == whole.finalize()
+    assert report["count"] == 2_000
+    assert len(report["pit_histogram"]) == 10
+    assert max(abs(density - 1.0) for density in report["pit_histogram"]) < 0.3
+    expected = [float(np.mean(pit <= q)) for q in quantile_grid(99)]
+    np.testing.assert_allclose(report["observed"], expected)
+    grid_quantiles = dist.materialize(quantile_grid(99))
+    per_level = [float(np.mean(y_true <= grid_quantiles[q])) for q in quantile_grid(99)]
+    np.testing.assert_allclose(report["observed"], per_level, atol=1e-3)
+
+
+def test_pit_for_quantile_only_distribution_uses_level_intervals() -> None:
+    dist = PredictiveDistribution(
+        horizon=np.arange(3),
+        quantiles={0.1: np.full(3, -1.0), 0.5: np.zeros(3), 0.9: np.ones(3)},
+    )
+    np.testing.assert_allclose(pit_values(dist, np.array([-2.0, 0.5, 3.0])), [0.05, 0.7, 0.95])
+
+    rng = np.random.default_rng(3)
+    levels = quantile_grid(9)
+    crossing = PredictiveDistribution(
+        horizon=np.arange(4), quantiles={q: rng.normal(size=(50, 4)) for q in levels}
+    )
+    y_true = rng.normal(size=(50, 4))
+    bounds = np.concatenate([[0.0], levels, [1.0]])
+    position = sum((crossing.quantiles[q] < y_true).astype(int) for q in levels)
+    expected = 0.5 * (bounds[position] + bounds[position + 1])
+    np.testing.assert_allclose(pit_values(crossing, y_true), expected)
@@ -1,8 +1,20 @@
 from __future__ import annotations
 
+import math
+from statistics import NormalDist
+
 import numpy as np
 
+from pre.infer.aggregate import QuantileSketch, StepMoments
 from pre.infer.predict import PredictiveDistribution
+from pre.infer.rollout import (
+    RolloutSummary,
+    batched_monte_carlo_rollout,
+    monte_carlo_rollout,
+    sharded_monte_carlo_rollout,
+)
+from pre.infer.special import erf
+from pre.models.lgbm_quantile import LGBMQuantileModel
 
 
 def test_predictive_distribution_from_samples_is_deterministic() -> None:
@@ -16,3 +28,146 @@ def test_predictive_distribution_from_samples_is_deterministic() -> None:
     assert dist.quantile(0.5).shape == (12,)
     low, high = dist.interval(0.1, 0.9)
     assert np.all(low <= high)
+
+
+def test_vectorized_erf_matches_math_erf() -> None:
+    z = np.linspace(-7.0, 7.0, 10_001)
+    expected = np.array([math.erf(value) for value in z])
+    assert np.max(np.abs(erf(z) - expected)) < 1e-14
+
+
+def test_mixture_distribution_has_analytic_quantiles() -> None:
+    rng = np.random.default_rng(5)
+    logits = rng.normal(size=(40, 6, 3))
+    logmix = logits - np.log(np.exp(logits).sum(axis=-1, keepdims=True))
+    mean = rng.normal(scale=3.0, size=(40, 6, 3))
+    logstd = rng.normal(scale=0.5, size=(40, 6, 3))
+
+    dist = PredictiveDistribution.from_mixture(
+        horizon=np.arange(6),
+        logmix=logmix,
+        mean=mean,
+        logstd=logstd,
+        quantile_levels=(0.05, 0.5, 0.95),
+    )
+
+    assert dist.samples is None
+    assert dist.quantile(0.5).shape == (40, 6)
+    for level in (0.05, 0.5, 0.95):
+        assert np.allclose(dist.cdf(dist.quantile(level)), level, atol=1e-10)
+    assert np.allclose(dist.mean, (np.exp(logmix) * mean).sum(axis=-1))
+
+
+def test_single_component_mixture_matches_normal_quantiles() -> None:
+    mean = np.array([[[1.0], [2.0]]])
+    logstd = np.log(np.array([[[0.5], [2.0]]]))
+    dist = PredictiveDistribution.from_mixture(
+        horizon=np.arange(2),
+        logmix=np.zeros_like(mean),
+        mean=mean,
+        logstd=logstd,
+    )
+    z = NormalDist().inv_cdf(0.9)
+    assert np.allclose(dist.quantile(0.9), [[1.0 + 0.5 * z, 2.0 + 2.0 * z]])
+
+
+def test_parametric_distribution_materializes_quantiles_on_demand() -> None:
+    loc = np.arange(12, dtype=float).reshape(3, 4)
+    dist = PredictiveDistribution.normal(horizon=np.arange(4), loc=loc, scale=np.full(4, 2.0))
+
+    assert dist.quantiles == {}
+    assert dist.std is not None and dist.std.shape == (3, 4)
+    upper = dist.quantile(0.975)
+    assert np.allclose(upper, loc + 2.0 * NormalDist().inv_cdf(0.975))
+    assert dist.quantile(0.975) is upper
+    grid = dist.materialize(tuple(np.linspace(0.01, 0.99, 99)))
+    assert len(grid) == 99
+
+
+def test_quantile_offsets_keep_fitted_levels_and_extrapolate() -> None:
+    rng = np.random.default_rng(3)
+    x = rng.normal(size=(300, 8))
+    y = x @ rng.normal(size=(8, 5)) + rng.normal(size=(300, 5))
+    model = LGBMQuantileModel()
+    model.fit(x, y)
+
+    dist = model.predict(x[:10], horizon=5)
+    median = dist.quantile(0.5)
+    assert model.residual_q10_ is not None and model.residual_q90_ is not None
+    assert np.allclose(dist.quantile(0.1), median + model.residual_q10_)
+    assert np.allclose(dist.quantile(0.9), median + model.residual_q90_)
+    low, high = dist.interval(0.01, 0.99)
+    assert np.all(low < dist.quantile(0.1)) and np.all(high > dist.quantile(0.9))
+
+
+def test_batched_rollout_matches_nested_loop_for_deterministic_transition() -> None:
+    initial = np.array([2.0])
+    expected = monte_carlo_rollout(initial, lambda s: 0.5 * s + 1.0, steps=6, num_samples=4)
+    batched = batched_monte_carlo_rollout(
+        initial, lambda states, rng: 0.5 * states + 1.0, steps=6, num_samples=4
+    )
+    np.testing.assert_allclose(batched, expected)
+
+
+def test_batched_rollout_is_seeded_and_fills_float32_buffer() -> None:
+    def ar1(states: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        return 0.8 * states + rng.standard_normal(states.shape, dtype=states.dtype)
+
+    buffer = np.empty((2_000, 12), dtype=np.float32)
+    first = batched_monte_carlo_rollout(np.zeros(1), ar1, 12, 2_000, seed=7, out=buffer)
+    second = batched_monte_carlo_rollout(np.zeros(1), ar1, 12, 2_000, seed=7, dtype=np.float32)
+
+    assert first is buffer
+    np.testing.assert_array_equal(first, second)
+    stationary_std = 1.0 / math.sqrt(1.0 - 0.8**2)
+    assert abs(float(first[:, -1].std()) - stationary_std) < 0.1
+
+
+def _ar1_step(states: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    return 0.8 * states + rng.standard_normal(states.shape, dtype=states.dtype)
+
+
+def test_sharded_rollout_is_identical_for_any_worker_count() -> None:
+    def run(workers: int) -> RolloutSummary:
+        return sharded_monte_carlo_rollout(
+            np.zeros(1),
+            _ar1_step,
+            steps=10,
+            num_samples=5_000,
+            seed=3,
+            shard_size=1_000,
+            max_workers=workers,
+            thresholds=(2.0,),
+        )
+
+    serial, parallel = run(1), run(3)
+
+    assert serial.count == parallel.count == 5_000
+    np.testing.assert_array_equal(serial.moments.mean, parallel.moments.mean)
+    np.testing.assert_array_equal(serial.moments.m2, parallel.moments.m2)
+    np.testing.assert_array_equal(serial.sketch.positive, parallel.sketch.positive)
+    np.testing.assert_array_equal(serial.exceedance.counts, parallel.exceedance.counts)
+
+    dist = serial.to_distribution((0.05, 0.5, 0.95))
+    stationary_std = 1.0 / math.sqrt(1.0 - 0.8**2)
+    assert abs(float(dist.std[-1]) - stationary_std) < 0.1
+    assert abs(float(dist.quantile(0.95)[-1]) - 1.645 * stationary_std) < 0.15
+    assert 0.0 < float(dist.tail_risk["exceed_2"][-1]) < 0.2
+
+
+def test_streaming_accumulators_merge_like_a_single_pass() -> None:
+    values = np.random.default_rng(9).normal(loc=1.0, scale=4.0, size=(20_000, 3))
+    moments, sketch = StepMoments(3), QuantileSketch(3, relative_accuracy=0.01)
+    for block in np.array_split(values, 7):
+        part_moments, part_sketch = StepMoments(3), QuantileSketch(3, relative_accuracy=0.01)
+        part_moments.update(block)
+        part_sketch.update(block)
+        moments.merge(part_moments)
+        sketch.merge(part_sketch)
+
+    np.testing.assert_allclose(moments.mean, values.mean(axis=0), rtol=1e-12)
+    np.testing.assert_allclose(moments.std, values.std(axis=0), rtol=1e-12)
+    levels = [0.01, 0.25, 0.75, 0.99]
+    expected = np.quantile(values, levels, axis=0)
+    estimated = sketch.quantiles(levels)
+    assert np.all(np.abs(estimated - expected) <= 0.02 * np.abs(expected) + 0.01)